@@ -12,11 +12,14 @@ Status: PRODUCTION-READY
 import asyncio
 import base64
 import json
+import os
 import re
 import subprocess
+import sys
 import time
 from pathlib import Path
 from typing import Literal, Optional, TypeVar, Callable
+from urllib.parse import urlsplit
 
 # Internal imports
 try:
@@ -33,6 +36,7 @@ try:
         BrowserContext,
         Page,
         Playwright,
+        TimeoutError as PlaywrightTimeoutError,
     )
     PLAYWRIGHT_AVAILABLE = True
 except ImportError:
@@ -85,6 +89,34 @@ SERVICE_ACCOUNT_URL = (
     "infrastructure-secrets/service-accounts/create"
 )
 
+# Substring of the API calls the service-account form loads its data from
+SERVICE_ACCOUNT_API_MARKER = "service-account"
+
+# Service account token as it appears in page text or API responses
+TOKEN_PATTERN = re.compile(r"ops_[A-Za-z0-9_-]{100,500}")
+
+# How long start_token_capture() listens for the create call (ms), and how
+# long extract_token() still waits for it once the wizard is done (s)
+TOKEN_CAPTURE_TIMEOUT = 120000
+TOKEN_CAPTURE_GRACE = 0.5
+
+# Resources block_heavy_resources() aborts: these types unless served by
+# 1Password itself, and anything from these analytics hosts
+BLOCKED_RESOURCE_TYPES = frozenset({"image", "font", "media", "stylesheet"})
+BLOCKED_HOSTS = (
+    "segment.io",
+    "segment.com",
+    "google-analytics.com",
+    "googletagmanager.com",
+)
+
+# Nice value boost_browser_priority() gives browser processes (lower runs
+# sooner; going below 0 usually needs root, so failures are skipped)
+BROWSER_NICENESS = -5
+
+# pgrep -f pattern identifying the Playwright driver among our children
+PLAYWRIGHT_DRIVER_PATTERN = "run-driver"
+
 
 # ============================================================================
 # YABAI WINDOW MANAGER (macOS Integration)
@@ -253,7 +285,18 @@ class AsyncPlaywrightDriver:
             timeout=30000
         )
 
-        # Create persistent context (session state)
+        await self.open_context()
+        await self.open_page()
+
+        return self
+
+    async def open_context(self) -> "BrowserContext":
+        """
+        Create a browser context on the running browser.
+
+        Loads saved session state when the session file exists, so a reused
+        browser starts each run already authenticated.
+        """
         session_file = self.config.get("session_file")
         context_options = {
             "viewport": {'width': 1920, 'height': 1080},
@@ -271,18 +314,34 @@ class AsyncPlaywrightDriver:
 
         self.context = await self.browser.new_context(**context_options)
 
-        # Create page
+        return self.context
+
+    async def close_context(self) -> None:
+        """Close the current page and context, leaving the browser running."""
+        if self.page:
+            await self.page.close()
+            self.page = None
+        if self.context:
+            await self.context.close()
+            self.context = None
+
+    async def open_page(self) -> "Page":
+        """
+        Open a fresh page in the current browser context.
+
+        Called on entry, and again when a pooled driver is reused with a new
+        context.
+        """
         self.page = await self.context.new_page()
 
         # Enable detailed logging
         self.page.on("console", lambda msg: print(f"Browser console: {msg.text}"))
         self.page.on("pageerror", lambda err: print(f"Page error: {err}"))
 
-        return self
+        return self.page
 
-    async def __aexit__(self, exc_type, exc_val, exc_tb):
-        """Async context manager exit - cleanup resources."""
-        # Save session state for future runs
+    async def save_session(self) -> None:
+        """Save session state (cookies, storage) to the configured session file."""
         session_file = self.config.get("session_file")
         if self.context and session_file and self.config.get("save_session", True):
             try:
@@ -291,21 +350,170 @@ class AsyncPlaywrightDriver:
             except Exception as e:
                 print(f"WARNING: Failed to save session: {e}")
 
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit - cleanup resources."""
+        # Save session state for future runs
+        await self.save_session()
+
         # Close resources
-        if self.page:
-            await self.page.close()
-        if self.context:
-            await self.context.close()
+        await self.close_context()
         if self.browser:
             await self.browser.close()
         if self.playwright:
             await self.playwright.stop()
 
 
+# ============================================================================
+# PROCESS PRIORITY
+# ============================================================================
+
+def _child_pids(pid: int, pattern: Optional[str] = None) -> list:
+    """Return the PIDs of pid's direct children, optionally filtered by
+    a pgrep -f pattern on their command line."""
+    cmd = ["pgrep", "-P", str(pid)]
+    if pattern is not None:
+        cmd += ["-f", pattern]
+    result = subprocess.run(cmd, capture_output=True, text=True, timeout=5)
+    return [int(child) for child in result.stdout.split()]
+
+
+def _descendant_pids(pid: int) -> list:
+    """Return the PIDs of every process below pid, via pgrep -P."""
+    found = []
+    pending = [pid]
+    while pending:
+        children = _child_pids(pending.pop())
+        found.extend(children)
+        pending.extend(children)
+    return found
+
+
+def _browser_pids() -> list:
+    """Return the Playwright driver processes we started and everything
+    below them (the browser and its helpers)."""
+    pids = []
+    # The driver is launched as "<node> <cli.js> run-driver"; matching on
+    # that leaves our other children (op, say, ...) alone
+    for driver_pid in _child_pids(os.getpid(), PLAYWRIGHT_DRIVER_PATTERN):
+        pids.append(driver_pid)
+        pids.extend(_descendant_pids(driver_pid))
+    return pids
+
+
+def boost_browser_priority(niceness: int = BROWSER_NICENESS) -> int:
+    """
+    Raise the scheduling priority of the browser processes we launched.
+
+    Playwright does not expose the Chromium PID, so the Playwright driver
+    is found among this process's children by its command line, and the
+    browser processes below it are boosted along with it. On macOS each
+    one is also taken out of background QoS (taskpolicy -B) so it is not
+    held on efficiency cores. Best effort: failures are skipped.
+
+    Args:
+        niceness: Nice value to apply
+
+    Returns:
+        Number of processes whose nice value was changed
+    """
+    try:
+        pids = _browser_pids()
+    except (OSError, subprocess.SubprocessError) as e:
+        print(f"WARNING: Could not list browser processes: {e}")
+        return 0
+
+    boosted = 0
+    for pid in pids:
+        try:
+            os.setpriority(os.PRIO_PROCESS, pid, niceness)
+            boosted += 1
+        except OSError:
+            pass
+        if sys.platform == "darwin":
+            try:
+                subprocess.run(
+                    ["taskpolicy", "-B", "-p", str(pid)],
+                    capture_output=True,
+                    timeout=5
+                )
+            except (OSError, subprocess.SubprocessError):
+                pass
+    return boosted
+
+
+# ============================================================================
+# NETWORK FILTERING
+# ============================================================================
+
+def _is_blocked_host(host: str) -> bool:
+    """Check host against BLOCKED_HOSTS, including subdomains."""
+    return any(host == blocked or host.endswith("." + blocked) for blocked in BLOCKED_HOSTS)
+
+
+async def block_heavy_resources(page: Page) -> None:
+    """
+    Abort requests the automation never needs.
+
+    Third-party images, fonts, media and stylesheets are dropped along with
+    analytics hosts; 1Password's own assets still load so the UI renders
+    for selectors and screenshots.
+
+    Args:
+        page: Playwright page object
+    """
+    async def _route(route) -> None:
+        request = route.request
+        host = urlsplit(request.url).hostname or ""
+        if _is_blocked_host(host) or (
+            request.resource_type in BLOCKED_RESOURCE_TYPES
+            and "1password" not in host
+        ):
+            await route.abort()
+        else:
+            await route.continue_()
+
+    await page.route("**/*", _route)
+
+
 # ============================================================================
 # NAVIGATION FUNCTIONS
 # ============================================================================
 
+def _is_service_account_ready(response) -> bool:
+    """Match the form's API response, or a sign-in page we were sent to."""
+    resource_type = response.request.resource_type
+    if resource_type == "document":
+        return "signin" in response.url or "login" in response.url
+    return (
+        resource_type in ("xhr", "fetch")
+        and SERVICE_ACCOUNT_API_MARKER in response.url
+        and response.status == 200
+    )
+
+
+async def _wait_first(*waiters) -> None:
+    """
+    Wait until any waiter succeeds, cancelling the rest.
+
+    Raises the last error if every waiter fails.
+    """
+    pending = {asyncio.ensure_future(waiter) for waiter in waiters}
+    error = None
+    try:
+        while pending:
+            done, pending = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in done:
+                if task.exception() is None:
+                    return
+                error = task.exception()
+        raise error
+    finally:
+        for task in pending:
+            task.cancel()
+
+
 async def navigate_to_service_account_page(
     page: Page,
     timeout: int = 30000
@@ -320,12 +528,23 @@ async def navigate_to_service_account_page(
     Returns:
         Dictionary with status: "success" | "auth_required" | "error"
     """
+    # Listen for the form's API response before navigating so it can't be missed
+    api_ready = asyncio.ensure_future(
+        page.wait_for_response(_is_service_account_ready, timeout=timeout)
+    )
+
     try:
-        # Async navigation with network idle wait
+        # Only wait for the DOM, then for whichever comes first: the API call
+        # the form needs, or network idle (the old wait, still the upper
+        # bound when the API call never shows up)
         response = await page.goto(
             SERVICE_ACCOUNT_URL,
             timeout=timeout,
-            wait_until="networkidle"
+            wait_until="domcontentloaded"
+        )
+        await _wait_first(
+            api_ready,
+            page.wait_for_load_state("networkidle", timeout=timeout)
         )
 
         # Auto-screenshot for debugging
@@ -360,6 +579,9 @@ async def navigate_to_service_account_page(
         print(f"ERROR: Navigation failed: {e}")
         return {"status": "error", "message": str(e)}
 
+    finally:
+        api_ready.cancel()
+
 
 # ============================================================================
 # FORM FILLING FUNCTIONS
@@ -590,7 +812,7 @@ async def click_next(
             for label in ["Next", "Continue", "Create"]:
                 if macos_control.click_button("Google Chrome", label):
                     print(f"✓ Native click successful: {label}")
-                    await page.wait_for_load_state("networkidle", timeout=10000)
+                    await page.wait_for_load_state("domcontentloaded", timeout=10000)
                     return {"success": True, "message": f"Native click: {label}"}
         except Exception as e:
             print(f"⚠ Native click failed: {e}")
@@ -629,8 +851,8 @@ async def click_next(
     await next_button.click()
     print("✓ Clicked next button")
 
-    # Wait for page transition
-    await page.wait_for_load_state("networkidle", timeout=10000)
+    # Wait for page transition; the next step's selector waits gate readiness
+    await page.wait_for_load_state("domcontentloaded", timeout=10000)
 
     return {"success": True, "message": "Next button clicked"}
 
@@ -859,6 +1081,47 @@ async def extract_token_via_page_text(page: Page) -> Optional[str]:
     return None
 
 
+def _is_token_response(response) -> bool:
+    """Match the POST that creates the service account and returns its token."""
+    return (
+        response.request.method == "POST"
+        and SERVICE_ACCOUNT_API_MARKER in response.url
+        and response.ok
+    )
+
+
+async def _capture_token(page: Page, timeout: int) -> Optional[str]:
+    try:
+        response = await page.wait_for_response(_is_token_response, timeout=timeout)
+        match = TOKEN_PATTERN.search(await response.text())
+    except Exception as e:
+        print(f"Token response capture failed: {e}")
+        return None
+    if match and validate_token_format(match.group(0)):
+        return match.group(0)
+    return None
+
+
+def start_token_capture(
+    page: Page,
+    timeout: int = TOKEN_CAPTURE_TIMEOUT
+) -> "asyncio.Task[Optional[str]]":
+    """
+    Start listening for the service-account create response.
+
+    Call before the wizard submits; pass the task to extract_token() so the
+    token is read from the API response instead of polling the DOM.
+
+    Args:
+        page: Playwright page object
+        timeout: Maximum time to wait for the response in milliseconds
+
+    Returns:
+        Task resolving to the token, or None if the response held no token
+    """
+    return asyncio.ensure_future(_capture_token(page, timeout))
+
+
 def validate_token_format(token: Optional[str]) -> bool:
     """
     Validate 1Password service account token format.
@@ -881,16 +1144,30 @@ def validate_token_format(token: Optional[str]) -> bool:
     return bool(re.match(pattern, token))
 
 
-async def extract_token(page: Page) -> Optional[str]:
+async def extract_token(
+    page: Page,
+    token_capture: Optional["asyncio.Task[Optional[str]]"] = None
+) -> Optional[str]:
     """
     Extract 1Password service account token using 4 fallback strategies.
 
     Args:
         page: Playwright page object
+        token_capture: Optional task from start_token_capture(); when it
+            yields a token the DOM strategies are skipped
 
     Returns:
         Token string or None
     """
+    # Strategy 0: Token from the intercepted API response
+    if token_capture is not None:
+        done, _ = await asyncio.wait({token_capture}, timeout=TOKEN_CAPTURE_GRACE)
+        if not done:
+            token_capture.cancel()
+        elif not token_capture.cancelled() and token_capture.result():
+            print("✓ Token extracted from API response")
+            return token_capture.result()
+
     # Strategy 1: CSS Selector
     token = await extract_token_via_css(page)
     if token:
@@ -1147,12 +1424,18 @@ async def create_service_account_automated(
                     # Try to focus window for user
                     driver.focus_browser_window()
                 
+                auth_wait = config.get("timeouts", {}).get("auth_wait", 120000)
                 print("Please authenticate in the browser window.")
-                print("Waiting up to 120 seconds...")
+                print(f"Waiting up to {auth_wait // 1000} seconds...")
 
-                # Wait for auth to complete (simplified - in production,
-                # would use more sophisticated auth detection)
-                await asyncio.sleep(10)
+                # Returns as soon as the browser leaves the sign-in page
+                try:
+                    await page.wait_for_url(
+                        lambda url: "signin" not in url and "login" not in url,
+                        timeout=auth_wait
+                    )
+                except PlaywrightTimeoutError:
+                    print("WARNING: Timed out waiting for authentication")
 
                 # Retry navigation
                 nav_result = await navigate_to_service_account_page(page)
@@ -1229,12 +1512,17 @@ async def create_service_account_automated(
             # Screenshot for debugging
             screenshot_dir = Path("/tmp/1password_automation")
             screenshot_dir.mkdir(parents=True, exist_ok=True)
+            # Viewport-only and time-boxed so a stuck page cannot delay the error
             try:
-                await page.screenshot(
-                    path=str(screenshot_dir / "error_final_exception.png")
+                await asyncio.wait_for(
+                    page.screenshot(
+                        path=str(screenshot_dir / "error_final_exception.png"),
+                        full_page=False
+                    ),
+                    timeout=5.0
                 )
-            except:
-                pass
+            except (asyncio.TimeoutError, Exception) as screenshot_error:
+                print(f"WARNING: Error screenshot failed: {screenshot_error}")
 
             return {
                 "success": False,
@@ -20,14 +20,18 @@ Author: SPARC Phase 4 Agent 16
 Date: 2026-01-01
 """
 
+import asyncio
+import hashlib
 import os
 import re
+import shutil
 import subprocess
+import tempfile
 import time
+from collections import OrderedDict
 from dataclasses import dataclass
-from datetime import datetime
 from pathlib import Path
-from typing import Optional, Tuple, List
+from typing import Optional, Tuple, List, Union
 import logging
 
 # Configure logging
@@ -70,6 +74,27 @@ class TokenValidation:
     pattern_match: bool = False
 
 
+@dataclass(frozen=True)
+class ValidatedToken:
+    """
+    Token whose format has already been validated.
+
+    Passing one to save_token_to_env() or test_token() skips their own
+    format check.
+
+    Raises:
+        ValueError: If the token format is invalid
+    """
+    token: str
+
+    def __post_init__(self):
+        validation = validate_token_format(self.token)
+        if not validation.is_valid:
+            raise ValueError(
+                f"Invalid token format: {', '.join(validation.errors)}"
+            )
+
+
 @dataclass
 class PersistResult:
     """Token persistence result."""
@@ -95,19 +120,121 @@ class CLIValidationResult:
 
 # Token validation
 TOKEN_PATTERN = re.compile(r'^ops_[A-Za-z0-9_-]{100,}$')
+TOKEN_SEARCH_PATTERN = re.compile(r'(ops_[A-Za-z0-9_-]{100,})')
+TOKEN_SEARCH_PATTERN_BYTES = re.compile(rb'(ops_[A-Za-z0-9_-]{100,})')
+WHITESPACE_PATTERN = re.compile(r'\s+')
+WHITESPACE_PATTERN_BYTES = re.compile(rb'\s+')
 TOKEN_PREFIX = "ops_"
 MIN_TOKEN_LENGTH = 100
 ALLOWED_CHARS = set("ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789_-")
 
+# Transient 'op' failures worth retrying (network, server errors)
+TRANSIENT_ERROR_PATTERN = re.compile(
+    r'network|timeout|connection|server\s*error|\b50[023]\b',
+    re.IGNORECASE
+)
+
 # Retry configuration
 MAX_RETRIES = 3
 BASE_DELAY = 1.0  # seconds
 MAX_DELAY = 60.0  # seconds
 BACKOFF_MULTIPLIER = 2
 
+# Retry delays precomputed for the default retry budget
+BACKOFF_DELAYS = tuple(
+    min(BASE_DELAY * (BACKOFF_MULTIPLIER ** attempt), MAX_DELAY)
+    for attempt in range(MAX_RETRIES)
+)
+
 # Timeouts
 CLI_TIMEOUT = 10  # seconds for CLI operations
 
+# Variables passed through to 'op' (when set) on top of PATH, HOME and the
+# token: proxies, relocated config, temp dir and user name
+OP_ENV_PASSTHROUGH = (
+    'USER',
+    'TMPDIR',
+    'XDG_CONFIG_HOME',
+    'OP_CONFIG_DIR',
+    'HTTPS_PROXY',
+    'HTTP_PROXY',
+    'NO_PROXY',
+    'https_proxy',
+    'http_proxy',
+    'no_proxy',
+)
+
+# Successful 'op whoami' results keyed by token digest, so repeat validations
+# of the same token skip the fork/exec of the op binary. Bounded LRU with TTL.
+WHOAMI_CACHE_MAXSIZE = 128
+WHOAMI_CACHE_TTL = 60.0  # seconds
+_WHOAMI_CACHE = OrderedDict()  # digest -> (monotonic timestamp, result)
+
+
+# ============================================================================
+# Helpers
+# ============================================================================
+
+def _durable_copy(src: str, dst: str) -> None:
+    """
+    Copy src to dst and fsync dst before returning.
+
+    shutil.copy2 uses sendfile/copy_file_range where the platform supports
+    it, so the bytes never pass through a Python-level buffer.
+    """
+    shutil.copy2(src, dst)
+    fd = os.open(dst, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def _backoff_delay(attempt: int) -> float:
+    """Return the retry delay for a zero-based attempt number."""
+    if attempt < len(BACKOFF_DELAYS):
+        return BACKOFF_DELAYS[attempt]
+    return min(BASE_DELAY * (BACKOFF_MULTIPLIER ** attempt), MAX_DELAY)
+
+
+def _match_to_str(match: re.Match) -> str:
+    """Return the first group of a token match as str (tokens are ASCII)."""
+    value = match.group(1)
+    if isinstance(value, bytes):
+        return value.decode('ascii')
+    return value
+
+
+def _token_cache_key(token: str) -> str:
+    """Digest used to key token caches without holding the raw token."""
+    return hashlib.blake2b(token.encode(), digest_size=16).hexdigest()
+
+
+def _whoami_cache_get(key: str) -> Optional["CLIValidationResult"]:
+    """Return a cached result if present and younger than WHOAMI_CACHE_TTL."""
+    entry = _WHOAMI_CACHE.get(key)
+    if entry is None:
+        return None
+    cached_at, result = entry
+    if time.monotonic() - cached_at > WHOAMI_CACHE_TTL:
+        del _WHOAMI_CACHE[key]
+        return None
+    _WHOAMI_CACHE.move_to_end(key)
+    return result
+
+
+def _whoami_cache_put(key: str, result: "CLIValidationResult") -> None:
+    """Store a result, evicting least recently used entries past the max size."""
+    _WHOAMI_CACHE[key] = (time.monotonic(), result)
+    _WHOAMI_CACHE.move_to_end(key)
+    while len(_WHOAMI_CACHE) > WHOAMI_CACHE_MAXSIZE:
+        _WHOAMI_CACHE.popitem(last=False)
+
+
+def clear_whoami_cache() -> None:
+    """Forget all cached 'op whoami' validation results."""
+    _WHOAMI_CACHE.clear()
+
 
 # ============================================================================
 # Core Functions
@@ -187,7 +314,7 @@ def create_service_account_cli(
     )
 
 
-def extract_token_from_output(output: str) -> Optional[str]:
+def extract_token_from_output(output: Union[str, bytes]) -> Optional[str]:
     """
     Extract 1Password service account token from CLI or page output.
 
@@ -197,8 +324,11 @@ def extract_token_from_output(output: str) -> Optional[str]:
     - Multi-line with whitespace
     - Mixed with other text
 
+    Raw subprocess output may be passed as bytes; it is scanned without
+    decoding and only the matched token is decoded.
+
     Args:
-        output: Raw text output containing token
+        output: Raw text (or bytes) output containing token
 
     Returns:
         Extracted token string, or None if not found
@@ -209,25 +339,41 @@ def extract_token_from_output(output: str) -> Optional[str]:
         >>> print(token)
         ops_abc123...xyz789
     """
-    if not output or not isinstance(output, str):
+    if not output or not isinstance(output, (str, bytes)):
         logger.warning("extract_token_from_output: Invalid or empty output")
         return None
 
+    if isinstance(output, bytes):
+        prefix = TOKEN_PREFIX.encode('ascii')
+        token_pattern = TOKEN_SEARCH_PATTERN_BYTES
+        whitespace_pattern = WHITESPACE_PATTERN_BYTES
+        empty = b''
+    else:
+        prefix = TOKEN_PREFIX
+        token_pattern = TOKEN_SEARCH_PATTERN
+        whitespace_pattern = WHITESPACE_PATTERN
+        empty = ''
+
+    # Cheap substring search first: when the prefix is intact, only the
+    # text from it onwards needs whitespace stripped. A prefix wrapped across
+    # a line break ("op\ns_...") is not found, so scan the whole output then.
+    start = output.find(prefix)
+
     # Remove all whitespace and newlines for wrapped tokens
-    cleaned = re.sub(r'\s+', '', output)
+    cleaned = whitespace_pattern.sub(empty, output[max(start, 0):])
 
     # Search for token pattern
-    match = re.search(r'(ops_[A-Za-z0-9_-]{100,})', cleaned)
+    match = token_pattern.search(cleaned)
 
     if match:
-        token = match.group(1)
+        token = _match_to_str(match)
         logger.info(f"Token extracted successfully: {token[:8]}...{token[-8:]}")
         return token
 
     # Fallback: try searching in original output (with whitespace)
-    match = re.search(r'(ops_[A-Za-z0-9_-]{100,})', output)
+    match = token_pattern.search(output, start) if start >= 0 else None
     if match:
-        token = match.group(1)
+        token = _match_to_str(match)
         logger.info(f"Token extracted (fallback): {token[:8]}...{token[-8:]}")
         return token
 
@@ -300,9 +446,10 @@ def validate_token_format(token: str) -> TokenValidation:
 
 
 def save_token_to_env(
-    token: str,
+    token: Union[str, ValidatedToken],
     env_var_name: str = "OP_SERVICE_ACCOUNT_TOKEN",
-    zshrc_path: str = "~/.zshrc"
+    zshrc_path: str = "~/.zshrc",
+    paranoid_verify: bool = False
 ) -> PersistResult:
     """
     Save 1Password service account token to ~/.zshrc with backup.
@@ -315,9 +462,12 @@ def save_token_to_env(
     5. Verify write success
 
     Args:
-        token: Service account token (will be redacted in logs)
+        token: Service account token (will be redacted in logs); format
+            validation is skipped for a ValidatedToken
         env_var_name: Environment variable name (default: OP_SERVICE_ACCOUNT_TOKEN)
         zshrc_path: Path to zsh config file (default: ~/.zshrc)
+        paranoid_verify: Re-read the file from disk to verify the write
+            instead of checking the content that was written (default: False)
 
     Returns:
         PersistResult with success status and backup path
@@ -332,33 +482,27 @@ def save_token_to_env(
         ...     print(f"Token saved! Backup: {result.backup_path}")
     """
     # Validate token format first
-    validation = validate_token_format(token)
-    if not validation.is_valid:
-        return PersistResult(
-            success=False,
-            error_message=f"Invalid token format: {', '.join(validation.errors)}"
-        )
-
-    # Expand path
-    zshrc_path = os.path.expanduser(zshrc_path)
+    if isinstance(token, ValidatedToken):
+        token = token.token
+    else:
+        validation = validate_token_format(token)
+        if not validation.is_valid:
+            return PersistResult(
+                success=False,
+                error_message=f"Invalid token format: {', '.join(validation.errors)}"
+            )
 
-    # Resolve symlinks
-    if os.path.islink(zshrc_path):
-        real_path = os.path.realpath(zshrc_path)
-        logger.info(f"Following symlink: {zshrc_path} -> {real_path}")
-        zshrc_path = real_path
+    # Expand path and resolve symlinks in one step
+    zshrc_path = str(Path(zshrc_path).expanduser().resolve(strict=False))
 
     # Create backup
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    timestamp = time.strftime("%Y%m%d_%H%M%S", time.localtime())
     backup_path = f"{zshrc_path}.backup.{timestamp}"
 
     try:
         if os.path.exists(zshrc_path):
-            # Backup existing file
-            with open(zshrc_path, 'r') as src:
-                content = src.read()
-            with open(backup_path, 'w') as dst:
-                dst.write(content)
+            # Backup existing file (in-kernel copy, durable before overwrite)
+            _durable_copy(zshrc_path, backup_path)
             logger.info(f"Created backup: {backup_path}")
         else:
             # Create new .zshrc
@@ -392,19 +536,22 @@ def save_token_to_env(
             error_message=f"Failed to read .zshrc: {str(e)}"
         )
 
-    # Check for existing token export
-    export_pattern = re.compile(
-        rf'^export {re.escape(env_var_name)}=.*$',
-        re.MULTILINE
-    )
-
-    export_line = f'export {env_var_name}="{token}"'
+    # Check for existing token export (plain line scan, no per-call regex)
+    export_prefix = f'export {env_var_name}='
+    export_line = f'{export_prefix}"{token}"'
     comment_line = f"\n# 1Password Service Account Token - Created {timestamp}\n"
 
-    if export_pattern.search(content):
+    lines = content.split('\n')
+    found_existing = False
+    for i, line in enumerate(lines):
+        if line.startswith(export_prefix):
+            lines[i] = export_line
+            found_existing = True
+
+    if found_existing:
         # Update existing export
         logger.info(f"Updating existing {env_var_name} export")
-        content = export_pattern.sub(export_line, content)
+        content = '\n'.join(lines)
     else:
         # Append new export
         logger.info(f"Appending new {env_var_name} export")
@@ -412,21 +559,28 @@ def save_token_to_env(
             content += '\n'
         content += comment_line + export_line + '\n'
 
-    # Write updated content
+    # Write updated content atomically: temp file in the same directory,
+    # fsync, then rename over the original. On failure the original
+    # .zshrc is never touched, so there is nothing to roll back.
+    # mkstemp gives a unique name, opened O_EXCL with owner-only (0600) mode.
+    tmp_path = None
     try:
-        with open(zshrc_path, 'w') as f:
+        fd, tmp_path = tempfile.mkstemp(
+            dir=os.path.dirname(zshrc_path),
+            prefix=".zshrc."
+        )
+        with os.fdopen(fd, 'w') as f:
             f.write(content)
+            f.flush()
+            os.fsync(fd)
+        os.replace(tmp_path, zshrc_path)
+        logger.info(f"Wrote .zshrc atomically (0600): {zshrc_path}")
     except Exception as e:
-        # Restore from backup on failure
-        if backup_path and os.path.exists(backup_path):
+        if tmp_path and os.path.exists(tmp_path):
             try:
-                with open(backup_path, 'r') as src:
-                    backup_content = src.read()
-                with open(zshrc_path, 'w') as dst:
-                    dst.write(backup_content)
-                logger.warning(f"Restored from backup after write failure")
-            except Exception as restore_error:
-                logger.error(f"Failed to restore from backup: {restore_error}")
+                os.unlink(tmp_path)
+            except OSError as cleanup_error:
+                logger.warning(f"Failed to remove temp file {tmp_path}: {cleanup_error}")
 
         return PersistResult(
             success=False,
@@ -435,29 +589,26 @@ def save_token_to_env(
         )
 
     # Verify write success
-    try:
-        with open(zshrc_path, 'r') as f:
-            updated_content = f.read()
+    # Redact token for logging
+    redacted_token = f"{token[:8]}...{token[-8:]}"
+    verified_content = content
 
-        # Redact token for logging
-        redacted_token = f"{token[:8]}...{token[-8:]}"
+    if paranoid_verify:
+        try:
+            with open(zshrc_path, 'r') as f:
+                verified_content = f.read()
+        except Exception as e:
+            logger.warning(f"Failed to verify write: {str(e)}")
+            verified_content = None
 
-        if token in updated_content:
-            logger.info(f"Token successfully persisted: {redacted_token}")
-            verified = True
-        else:
-            logger.error("Token not found in .zshrc after write")
-            verified = False
-    except Exception as e:
-        logger.warning(f"Failed to verify write: {str(e)}")
+    if verified_content is None:
+        verified = False
+    elif token in verified_content:
+        logger.info(f"Token successfully persisted: {redacted_token}")
+        verified = True
+    else:
+        logger.error("Token not found in .zshrc after write")
         verified = False
-
-    # Set secure permissions (owner read/write only)
-    try:
-        os.chmod(zshrc_path, 0o600)
-        logger.info(f"Set permissions to 600: {zshrc_path}")
-    except Exception as e:
-        logger.warning(f"Failed to set permissions: {str(e)}")
 
     return PersistResult(
         success=True,
@@ -467,7 +618,151 @@ def save_token_to_env(
     )
 
 
-def test_token(token: str, max_retries: int = MAX_RETRIES) -> CLIValidationResult:
+def _prepare_whoami(
+    token: Union[str, ValidatedToken]
+) -> Tuple[Optional[CLIValidationResult], str, dict]:
+    """
+    Validate the token and check the whoami cache before any op call.
+
+    Returns:
+        (early_result, cache_key, env). early_result is set when the token is
+        malformed or a cached result exists, and the caller should return it.
+    """
+    if isinstance(token, ValidatedToken):
+        token = token.token
+    else:
+        validation = validate_token_format(token)
+        if not validation.is_valid:
+            return CLIValidationResult(
+                success=False,
+                error_message=f"Invalid token format: {', '.join(validation.errors)}"
+            ), "", {}
+
+    cache_key = _token_cache_key(token)
+    cached = _whoami_cache_get(cache_key)
+    if cached is not None:
+        logger.info("op whoami result served from cache")
+        return cached, cache_key, {}
+
+    # Minimal environment for op (built once, reused across retries)
+    env = {
+        name: os.environ[name] for name in OP_ENV_PASSTHROUGH if name in os.environ
+    }
+    env.update({
+        'PATH': os.environ.get('PATH', ''),
+        'HOME': os.environ.get('HOME', ''),
+        'LC_ALL': 'C',
+        'OP_SERVICE_ACCOUNT_TOKEN': token,
+    })
+    return None, cache_key, env
+
+
+def _whoami_attempt(
+    env: dict,
+    attempt: int,
+    max_retries: int
+) -> Union[CLIValidationResult, float]:
+    """
+    Run 'op whoami' once.
+
+    Returns:
+        The final CLIValidationResult, or the backoff delay in seconds to wait
+        before the next attempt. The caller does the waiting, so sync and
+        async callers can each sleep in their own way.
+    """
+    try:
+        logger.info(f"Running 'op whoami' (attempt {attempt + 1}/{max_retries})")
+
+        result = subprocess.run(
+            ['op', 'whoami'],
+            capture_output=True,
+            text=True,
+            timeout=CLI_TIMEOUT,
+            env=env,
+            close_fds=True,
+            start_new_session=True
+        )
+
+        # Check return code
+        if result.returncode == 0:
+            output = result.stdout.strip()
+            logger.info(f"op whoami succeeded")
+
+            # Parse output for service account name
+            service_account_name = None
+            match = re.search(r'Service Account:\s*([^\n\r(]+)', output)
+            if match:
+                service_account_name = match.group(1).strip()
+                logger.info(f"Service account: {service_account_name}")
+
+            return CLIValidationResult(
+                success=True,
+                output=output,
+                service_account_name=service_account_name
+            )
+
+        # CLI error
+        stderr = result.stderr.strip()
+        logger.error(f"op whoami failed (exit {result.returncode}): {stderr}")
+
+        # Check if it's a transient error (network, server)
+        is_transient = bool(TRANSIENT_ERROR_PATTERN.search(stderr))
+
+        if is_transient and attempt < max_retries - 1:
+            # Retry with exponential backoff
+            delay = _backoff_delay(attempt)
+            logger.warning(f"Transient error detected. Retrying in {delay}s...")
+            return delay
+
+        # Non-transient error or max retries reached
+        return CLIValidationResult(
+            success=False,
+            output=stderr,
+            error_message=f"op whoami failed: {stderr}"
+        )
+
+    except FileNotFoundError:
+        # op CLI not installed
+        error_msg = (
+            "1Password CLI (op) not found. Install with: brew install 1password-cli"
+        )
+        logger.error(error_msg)
+        return CLIValidationResult(
+            success=False,
+            error_message=error_msg
+        )
+
+    except subprocess.TimeoutExpired:
+        # Command timed out
+        logger.warning(f"op whoami timed out (attempt {attempt + 1}/{max_retries})")
+
+        if attempt < max_retries - 1:
+            delay = _backoff_delay(attempt)
+            logger.info(f"Retrying in {delay}s...")
+            return delay
+        return CLIValidationResult(
+            success=False,
+            error_message=f"op whoami timed out after {CLI_TIMEOUT}s"
+        )
+
+    except Exception as e:
+        # Unexpected error
+        logger.error(f"Unexpected error running op whoami: {str(e)}")
+
+        if attempt < max_retries - 1:
+            delay = _backoff_delay(attempt)
+            logger.info(f"Retrying in {delay}s...")
+            return delay
+        return CLIValidationResult(
+            success=False,
+            error_message=f"Unexpected error: {str(e)}"
+        )
+
+
+def test_token(
+    token: Union[str, ValidatedToken],
+    max_retries: int = MAX_RETRIES
+) -> CLIValidationResult:
     """
     Test 1Password service account token using 'op whoami'.
 
@@ -476,10 +771,14 @@ def test_token(token: str, max_retries: int = MAX_RETRIES) -> CLIValidationResul
     2. Service account is active
     3. Can communicate with 1Password servers
 
-    Includes retry logic for transient network errors.
+    Includes retry logic for transient network errors. Successful results
+    are cached per token for WHOAMI_CACHE_TTL seconds, so repeat calls with
+    the same token do not spawn another op process (see clear_whoami_cache()).
+    Async callers should use test_token_async() instead.
 
     Args:
-        token: Service account token to test
+        token: Service account token to test; format validation is skipped
+            for a ValidatedToken
         max_retries: Maximum retry attempts (default: 3)
 
     Returns:
@@ -490,126 +789,58 @@ def test_token(token: str, max_retries: int = MAX_RETRIES) -> CLIValidationResul
         >>> if result.success:
         ...     print(f"Service account: {result.service_account_name}")
     """
-    # Validate token format first
-    validation = validate_token_format(token)
-    if not validation.is_valid:
-        return CLIValidationResult(
-            success=False,
-            error_message=f"Invalid token format: {', '.join(validation.errors)}"
-        )
-
-    # Prepare environment with token
-    env = os.environ.copy()
-    env['OP_SERVICE_ACCOUNT_TOKEN'] = token
-
-    # Redacted token for logging
-    redacted = f"{token[:8]}...{token[-8:]}"
+    early_result, cache_key, env = _prepare_whoami(token)
+    if early_result is not None:
+        return early_result
 
     # Retry loop with exponential backoff
     for attempt in range(max_retries):
-        try:
-            logger.info(f"Running 'op whoami' (attempt {attempt + 1}/{max_retries})")
-
-            result = subprocess.run(
-                ['op', 'whoami'],
-                capture_output=True,
-                text=True,
-                timeout=CLI_TIMEOUT,
-                env=env
-            )
+        outcome = _whoami_attempt(env, attempt, max_retries)
+        if isinstance(outcome, CLIValidationResult):
+            if outcome.success:
+                _whoami_cache_put(cache_key, outcome)
+            return outcome
+        time.sleep(outcome)
 
-            # Check return code
-            if result.returncode == 0:
-                output = result.stdout.strip()
-                logger.info(f"op whoami succeeded")
-
-                # Parse output for service account name
-                service_account_name = None
-                match = re.search(r'Service Account:\s*([^\n\r(]+)', output)
-                if match:
-                    service_account_name = match.group(1).strip()
-                    logger.info(f"Service account: {service_account_name}")
-
-                return CLIValidationResult(
-                    success=True,
-                    output=output,
-                    service_account_name=service_account_name
-                )
-
-            else:
-                # CLI error
-                stderr = result.stderr.strip()
-                logger.error(f"op whoami failed (exit {result.returncode}): {stderr}")
-
-                # Check if it's a transient error (network, server)
-                transient_errors = [
-                    'network',
-                    'timeout',
-                    'connection',
-                    'server error',
-                    '503',
-                    '502',
-                    '500'
-                ]
-
-                is_transient = any(err in stderr.lower() for err in transient_errors)
-
-                if is_transient and attempt < max_retries - 1:
-                    # Retry with exponential backoff
-                    delay = min(BASE_DELAY * (BACKOFF_MULTIPLIER ** attempt), MAX_DELAY)
-                    logger.warning(f"Transient error detected. Retrying in {delay}s...")
-                    time.sleep(delay)
-                    continue
-                else:
-                    # Non-transient error or max retries reached
-                    return CLIValidationResult(
-                        success=False,
-                        output=stderr,
-                        error_message=f"op whoami failed: {stderr}"
-                    )
-
-        except FileNotFoundError:
-            # op CLI not installed
-            error_msg = (
-                "1Password CLI (op) not found. Install with: brew install 1password-cli"
-            )
-            logger.error(error_msg)
-            return CLIValidationResult(
-                success=False,
-                error_message=error_msg
-            )
+    # Should never reach here, but just in case
+    return CLIValidationResult(
+        success=False,
+        error_message=f"Max retries ({max_retries}) exceeded"
+    )
 
-        except subprocess.TimeoutExpired:
-            # Command timed out
-            logger.warning(f"op whoami timed out (attempt {attempt + 1}/{max_retries})")
-
-            if attempt < max_retries - 1:
-                delay = min(BASE_DELAY * (BACKOFF_MULTIPLIER ** attempt), MAX_DELAY)
-                logger.info(f"Retrying in {delay}s...")
-                time.sleep(delay)
-                continue
-            else:
-                return CLIValidationResult(
-                    success=False,
-                    error_message=f"op whoami timed out after {CLI_TIMEOUT}s"
-                )
 
-        except Exception as e:
-            # Unexpected error
-            logger.error(f"Unexpected error running op whoami: {str(e)}")
-
-            if attempt < max_retries - 1:
-                delay = min(BASE_DELAY * (BACKOFF_MULTIPLIER ** attempt), MAX_DELAY)
-                logger.info(f"Retrying in {delay}s...")
-                time.sleep(delay)
-                continue
-            else:
-                return CLIValidationResult(
-                    success=False,
-                    error_message=f"Unexpected error: {str(e)}"
-                )
+async def test_token_async(
+    token: Union[str, ValidatedToken],
+    max_retries: int = MAX_RETRIES
+) -> CLIValidationResult:
+    """
+    Event-loop friendly version of test_token().
+
+    Each 'op whoami' run happens in a worker thread and the backoff between
+    attempts is an asyncio.sleep(), so neither blocks the loop and the call
+    can be cancelled between attempts.
+
+    Args:
+        token: Service account token to test
+        max_retries: Maximum retry attempts (default: 3)
+
+    Returns:
+        CLIValidationResult with validation status
+    """
+    early_result, cache_key, env = _prepare_whoami(token)
+    if early_result is not None:
+        return early_result
+
+    for attempt in range(max_retries):
+        outcome = await asyncio.to_thread(
+            _whoami_attempt, env, attempt, max_retries
+        )
+        if isinstance(outcome, CLIValidationResult):
+            if outcome.success:
+                _whoami_cache_put(cache_key, outcome)
+            return outcome
+        await asyncio.sleep(outcome)
 
-    # Should never reach here, but just in case
     return CLIValidationResult(
         success=False,
         error_message=f"Max retries ({max_retries}) exceeded"
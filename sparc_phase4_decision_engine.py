@@ -17,10 +17,12 @@ import asyncio
 import logging
 import random
 import re
+import sys
 import time
-from dataclasses import dataclass, field
+from collections import deque
+from dataclasses import dataclass, field, replace
 from enum import Enum
-from typing import Any, Dict, Iterable, List, Optional, Tuple
+from typing import Any, Deque, Dict, Iterable, List, Literal, Optional, Tuple
 
 
 # ---------------------------------------------------------------------------
@@ -34,6 +36,117 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+# ---------------------------------------------------------------------------
+# PATTERNS
+# ---------------------------------------------------------------------------
+
+# Element dict keys holding memoized derived values: _element_text() and
+# the lowercased role/tag/type set by _coerce_elements()
+_NORM_TEXT_KEY = "_norm_text"
+_ROLE_LC_KEY = "_role_lc"
+_TAG_LC_KEY = "_tag_lc"
+_TYPE_LC_KEY = "_type_lc"
+
+# dataclass(slots=True) needs Python 3.10+; older interpreters keep __dict__
+_DATACLASS_SLOTS: Dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+# Element fields joined (in this order) into the normalized element text
+_ELEMENT_TEXT_KEYS = ("text", "label", "aria_label", "name", "placeholder", "value")
+
+# Signal patterns: one capture group per signal, wrapped in a lookahead so a
+# match never consumes text another group needs (e.g. "sign invalid"). The
+# groups start with distinct letters, so at most one matches per position.
+# DOM signals run on the raw DOM (no lowercased/collapsed copy):
+# 1 = error, 2 = captcha, 3 = login
+_DOM_SIGNAL_RE = re.compile(
+    r"(?=(error|failed|try\s+again)"
+    r"|(captcha|recaptcha|hcaptcha)"
+    r"|(password|sign\s+in|log\s+in))",
+    re.IGNORECASE,
+)
+_LOGIN_URL_RE = re.compile(r"login|signin|sign-in", re.IGNORECASE)
+
+# Element signals run on already-normalized element text: 1 = error, 2 = login
+_ELEMENT_SIGNAL_RE = re.compile(
+    r"(?=(error|failed|invalid|try again)|(password|sign in|log in))"
+)
+
+# Element error texts collected per analysis before the scan stops early
+_MAX_ELEMENT_ERRORS = 8
+
+# page_state keys (besides url/dom/intent) whose presence invalidates the
+# cached retry decision in DecisionContext.update_from_page_state()
+_ANALYSIS_INPUT_KEYS = (
+    "visible_elements",
+    "errors",
+    "error",
+    "last_action",
+    "last_result",
+    "last_error",
+    "retry_count",
+    "metadata",
+)
+
+# DecisionContext fields the analysis reads that _analysis_key() does not
+# cover; assigning any of them clears the cached retry decision
+_RETRY_KEY_RESET_FIELDS = frozenset(
+    {"visible_elements", "last_result", "last_error", "metadata"}
+)
+
+# Decisions kept per context in history/decision_log; older ones are evicted
+_DECISION_LOG_MAXLEN = 512
+
+# Recent attempt outcomes tracked per strategy name for adaptive backoff
+_FAIL_WINDOW_SIZE = 16
+
+# Error-message keywords that select a retry strategy (see _get_retry_strategy)
+_ERROR_MSG_RE = re.compile(r"timeout|captcha|invalid|not found|missing")
+
+_CLICK_ROLES = frozenset({"button", "link", "menuitem", "tab"})
+_CLICK_TAGS = frozenset({"button", "a"})
+_INPUT_ROLES = frozenset({"textbox", "combobox", "searchbox"})
+_INPUT_TAGS = frozenset({"input", "textarea", "select"})
+_INPUT_TYPES = frozenset({"text", "email", "password", "search", "tel", "url"})
+
+# Lowercased forms of the ASCII role/tag/type values the sets above test, in
+# the spellings drivers report (e.g. tagName is "BUTTON"), so the common case
+# is a dict hit instead of str.lower(). Other values still go through lower().
+_ATTR_LOWER = {
+    spelling: value
+    for value in _CLICK_ROLES | _CLICK_TAGS | _INPUT_ROLES | _INPUT_TAGS | _INPUT_TYPES
+    for spelling in (value, value.upper(), value.capitalize())
+}
+_ATTR_LOWER[""] = ""
+
+# Click labels in priority order. The lookahead alternation reports every
+# (possibly overlapping) label in a single scan of the element text.
+_CLICK_PRIORITY = (
+    "continue",
+    "next",
+    "submit",
+    "save",
+    "ok",
+    "yes",
+    "allow",
+    "accept",
+    "sign in",
+    "log in",
+    "login",
+    "create",
+    "start",
+    "finish",
+    "done",
+)
+_CLICK_PRIORITY_SCORE = {
+    label: 1.0 - (rank / len(_CLICK_PRIORITY))
+    for rank, label in enumerate(_CLICK_PRIORITY)
+}
+_CLICK_TOP_SCORE = _CLICK_PRIORITY_SCORE[_CLICK_PRIORITY[0]]
+_CLICK_PRIORITY_RE = re.compile(
+    "(?=(" + "|".join(re.escape(label) for label in _CLICK_PRIORITY) + "))"
+)
+
+
 # ---------------------------------------------------------------------------
 # DATA STRUCTURES
 # ---------------------------------------------------------------------------
@@ -48,7 +161,7 @@ class ActionType(Enum):
     RETRY = "retry"
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class Action:
     """Represents the next automation action with reasoning."""
 
@@ -75,7 +188,36 @@ class Action:
         }
 
 
-@dataclass
+class RetryOutcomes:
+    """
+    Recent attempt outcomes per strategy name, for adaptive backoff.
+
+    Owned by the caller that retries (one per Orchestrator), so separate
+    runs and threads do not share failure rates.
+    """
+
+    __slots__ = ("_size", "_windows")
+
+    def __init__(self, size: int = _FAIL_WINDOW_SIZE) -> None:
+        self._size = size
+        self._windows: Dict[str, Deque[bool]] = {}
+
+    def record(self, strategy_name: str, success: bool) -> None:
+        """Record one attempt outcome for the named strategy."""
+        window = self._windows.get(strategy_name)
+        if window is None:
+            window = self._windows[strategy_name] = deque(maxlen=self._size)
+        window.append(not success)
+
+    def failure_rate(self, strategy_name: str) -> Optional[float]:
+        """Failed fraction of the recorded outcomes, or None if none yet."""
+        window = self._windows.get(strategy_name)
+        if not window:
+            return None
+        return sum(window) / len(window)
+
+
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class RetryStrategy:
     """Retry strategy for recoverable errors."""
 
@@ -87,17 +229,31 @@ class RetryStrategy:
     jitter: float = 0.2
     retryable: bool = True
     reason: str = ""
+    mode: Literal["exponential", "adaptive"] = "exponential"
 
-    def next_delay_sec(self, attempt: int) -> float:
-        """Compute the next delay using exponential backoff with jitter."""
+    def next_delay_sec(
+        self,
+        attempt: int,
+        failure_rate: Optional[float] = None,
+    ) -> float:
+        """
+        Compute the next delay with jitter.
+
+        Exponential mode doubles (backoff_factor) per attempt. Adaptive mode
+        scales that exponential delay by failure_rate (see RetryOutcomes),
+        never going below base_delay_sec; without a rate it is exponential.
+        """
         if attempt < 1:
             attempt = 1
         delay = self.base_delay_sec * (self.backoff_factor ** (attempt - 1))
+        adaptive = self.mode == "adaptive"
+        if adaptive and failure_rate is not None:
+            delay *= failure_rate
         delay = min(delay, self.max_delay_sec)
         if self.jitter > 0:
             jitter_range = delay * self.jitter
             delay += random.uniform(-jitter_range, jitter_range)
-        return max(0.0, delay)
+        return max(self.base_delay_sec if adaptive else 0.0, delay)
 
     def should_retry(self, attempt: int) -> bool:
         """Return True if another retry should be attempted."""
@@ -114,10 +270,78 @@ class RetryStrategy:
             "jitter": self.jitter,
             "retryable": self.retryable,
             "reason": self.reason,
+            "mode": self.mode,
         }
 
 
-@dataclass
+_TIMEOUT_STRAT = RetryStrategy(
+    name="timeout",
+    max_attempts=3,
+    base_delay_sec=1.0,
+    backoff_factor=2.0,
+    jitter=0.3,
+    reason="Timeout while waiting for page or element",
+    mode="adaptive",
+)
+_TIMEOUT_MSG_STRAT = RetryStrategy(
+    name="timeout",
+    max_attempts=3,
+    base_delay_sec=1.0,
+    backoff_factor=2.0,
+    jitter=0.3,
+    reason="Timeout reported by error message",
+    mode="adaptive",
+)
+_NETWORK_STRAT = RetryStrategy(
+    name="network",
+    max_attempts=5,
+    base_delay_sec=1.5,
+    backoff_factor=2.0,
+    jitter=0.2,
+    reason="Network or transport error",
+    mode="adaptive",
+)
+_CAPTCHA_STRAT = RetryStrategy(
+    name="captcha",
+    max_attempts=1,
+    base_delay_sec=5.0,
+    backoff_factor=1.0,
+    jitter=0.0,
+    reason="Captcha detected; allow manual resolution",
+)
+_NON_RETRYABLE_STRAT = RetryStrategy(
+    name="non_retryable",
+    max_attempts=0,
+    retryable=False,
+    reason="Non-retryable input or selector error",
+)
+_GENERIC_STRAT = RetryStrategy(
+    name="generic",
+    max_attempts=2,
+    base_delay_sec=1.0,
+    backoff_factor=2.0,
+    jitter=0.2,
+    reason="Unhandled error; default retry strategy",
+)
+
+# Strategies picked by exception type alone; subclasses are added on first use
+_STRATEGY_CACHE: Dict[type, RetryStrategy] = {
+    asyncio.TimeoutError: _TIMEOUT_STRAT,
+    ConnectionError: _NETWORK_STRAT,
+    OSError: _NETWORK_STRAT,
+}
+
+# Message keywords in precedence order, checked after the type lookup
+_ERROR_MSG_STRATEGIES = (
+    ("timeout", _TIMEOUT_MSG_STRAT),
+    ("captcha", _CAPTCHA_STRAT),
+    ("invalid", _NON_RETRYABLE_STRAT),
+    ("not found", _NON_RETRYABLE_STRAT),
+    ("missing", _NON_RETRYABLE_STRAT),
+)
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class DecisionContext:
     """Mutable decision context derived from page state."""
 
@@ -130,9 +354,21 @@ class DecisionContext:
     last_result: Optional[Any] = None
     last_error: Optional[Exception] = None
     retry_count: int = 0
-    history: List[Action] = field(default_factory=list)
-    decision_log: List[Dict[str, Any]] = field(default_factory=list)
+    history: Deque[Action] = field(
+        default_factory=lambda: deque(maxlen=_DECISION_LOG_MAXLEN)
+    )
+    decision_log: Deque[Dict[str, Any]] = field(
+        default_factory=lambda: deque(maxlen=_DECISION_LOG_MAXLEN)
+    )
     metadata: Dict[str, Any] = field(default_factory=dict)
+    _retry_key: Optional[Tuple[Any, ...]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name in _RETRY_KEY_RESET_FIELDS:
+            object.__setattr__(self, "_retry_key", None)
+        object.__setattr__(self, name, value)
 
     @classmethod
     def from_page_state(cls, page_state: Dict[str, Any]) -> "DecisionContext":
@@ -145,7 +381,10 @@ class DecisionContext:
         return cls(
             url=str(page_state.get("url", "") or ""),
             dom=str(page_state.get("dom", "") or ""),
-            visible_elements=_coerce_elements(page_state.get("visible_elements") or []),
+            visible_elements=_coerce_elements(
+                page_state.get("visible_elements") or [],
+                fresh=True,
+            ),
             intent=dict(page_state.get("intent") or {}),
             errors=_coerce_error_list(page_state.get("errors") or page_state.get("error")),
             last_action=page_state.get("last_action"),
@@ -163,7 +402,7 @@ class DecisionContext:
             self.dom = str(dom)
         visible = page_state.get("visible_elements")
         if visible is not None:
-            self.visible_elements = _coerce_elements(visible)
+            self.visible_elements = _coerce_elements(visible, fresh=True)
         intent = page_state.get("intent")
         if intent is not None:
             self.intent = dict(intent)
@@ -180,6 +419,10 @@ class DecisionContext:
             self.retry_count = int(page_state.get("retry_count") or 0)
         if "metadata" in page_state:
             self.metadata = dict(page_state.get("metadata") or {})
+        if self._retry_key is not None and any(
+            key in page_state for key in _ANALYSIS_INPUT_KEYS
+        ):
+            self._retry_key = None
 
     def record_decision(self, action: Action) -> None:
         """Record a decision into the context log."""
@@ -194,18 +437,84 @@ class DecisionContext:
             }
         )
 
+    def to_list(self) -> List[Dict[str, Any]]:
+        """Return the decision log as a list for serializers."""
+        return list(self.decision_log)
+
 
 @dataclass
+class ElementTable:
+    """Column-oriented view of visible elements, lowercased once."""
+
+    elements: List[Dict[str, Any]]
+    roles: List[str]
+    tags: List[str]
+    types: List[str]
+    hidden: List[bool]
+    clickable: List[bool]
+
+    @classmethod
+    def from_elements(cls, elements: List[Dict[str, Any]]) -> "ElementTable":
+        """Build the column arrays in a single pass over the elements."""
+        count = len(elements)
+        roles = [""] * count
+        tags = [""] * count
+        types = [""] * count
+        hidden = [False] * count
+        clickable = [False] * count
+        for i, element in enumerate(elements):
+            if _ROLE_LC_KEY not in element:
+                _cache_lowered_attributes(element)
+            roles[i] = element[_ROLE_LC_KEY]
+            tags[i] = element[_TAG_LC_KEY]
+            types[i] = element[_TYPE_LC_KEY]
+            hidden[i] = element.get("visible") is False
+            clickable[i] = element.get("clickable") is True
+        return cls(elements, roles, tags, types, hidden, clickable)
+
+    def clickable_indices(self) -> List[int]:
+        """Indices of visible elements that can be clicked."""
+        return [
+            i
+            for i in range(len(self.elements))
+            if not self.hidden[i]
+            and (
+                self.clickable[i]
+                or self.roles[i] in _CLICK_ROLES
+                or self.tags[i] in _CLICK_TAGS
+            )
+        ]
+
+    def input_indices(self) -> List[int]:
+        """Indices of visible elements that accept text input."""
+        return [
+            i
+            for i in range(len(self.elements))
+            if not self.hidden[i]
+            and (
+                self.roles[i] in _INPUT_ROLES
+                or self.tags[i] in _INPUT_TAGS
+                or self.types[i] in _INPUT_TYPES
+            )
+        ]
+
+    def select(self, indices: List[int]) -> List[Dict[str, Any]]:
+        """Return the element dicts at the given indices."""
+        return [self.elements[i] for i in indices]
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class PageAnalysis:
     """Structured analysis of the current page state."""
 
     url: str
-    dom_text: str
+    dom_text: str  # raw DOM; scanned case-insensitively
     visible_elements: List[Dict[str, Any]]
     clickables: List[Dict[str, Any]]
     inputs: List[Dict[str, Any]]
     errors: List[str]
     signals: Dict[str, bool]
+    table: Optional[ElementTable] = None
 
 
 # ---------------------------------------------------------------------------
@@ -221,31 +530,98 @@ class DecisionEngine:
     @staticmethod
     async def get_retry_strategy(error: Exception) -> RetryStrategy:
         """Expose retry strategy selection for external callers."""
-        return await get_retry_strategy(error)
+        return _get_retry_strategy(error)
 
     async def decide(self, context: DecisionContext) -> Action:
         """Analyze page state and decide the next action."""
-        analysis = await self._analyze(context)
-        action = await self._select_action(context, analysis)
+        action = self._direct_intent_action(context)
+        if action is None:
+            action = self._repeat_retry(context)
+        if action is None:
+            analysis = self._analyze(context)
+            action = self._select_action(context, analysis)
+            if action.action_type == ActionType.RETRY:
+                context._retry_key = _analysis_key(context)
+            else:
+                context._retry_key = None
         context.record_decision(action)
-        self._log_decision(context, action, analysis)
+        self._log_decision(context, action)
         return action
 
-    async def _analyze(self, context: DecisionContext) -> PageAnalysis:
+    def _repeat_retry(self, context: DecisionContext) -> Optional[Action]:
+        """
+        Repeat the last RETRY decision if the page has not changed since.
+
+        The key covers url, dom, intent, metadata, retry_count and errors;
+        assigning any other analysis input (visible_elements, last_result,
+        last_error) clears the cached key.
+        """
+        last_action = context.last_action
+        if (
+            context._retry_key is None
+            or last_action is None
+            or last_action.action_type != ActionType.RETRY
+            or _analysis_key(context) != context._retry_key
+        ):
+            return None
+        return replace(last_action, metadata=dict(last_action.metadata))
+
+    def _direct_intent_action(self, context: DecisionContext) -> Optional[Action]:
+        """
+        Return an action fully determined by intent, skipping DOM analysis.
+
+        Applies only when nothing is pending a retry and the DOM shows no
+        error, captcha or login markers (those take precedence in full
+        analysis); a target URL, extraction targets, or an explicit click
+        selector then decide the action alone.
+        """
+        if (
+            context.last_result is not None
+            or context.last_error is not None
+            or context.errors
+            or any(_scan_dom_signals(context.dom))
+        ):
+            return None
+
+        (
+            target_url,
+            extract_targets,
+            form_data,
+            query_value,
+            click_selector,
+            _click_text,
+        ) = _resolve_intent(context)
+
+        navigate_action = self._maybe_navigate(target_url, context.url)
+        if navigate_action is not None:
+            return navigate_action
+
+        extract_action = self._maybe_extract(extract_targets)
+        if extract_action is not None:
+            return extract_action
+
+        if click_selector and not (form_data or query_value):
+            return _click_selector_action(click_selector)
+
+        return None
+
+    def _analyze(self, context: DecisionContext) -> PageAnalysis:
         """Analyze DOM, URL, and visible elements."""
-        await asyncio.sleep(0)
         url = context.url
-        dom_text = _normalize_text(context.dom)
+        dom_text = context.dom
         visible = _coerce_elements(context.visible_elements)
-        clickables = [el for el in visible if _is_clickable(el)]
-        inputs = [el for el in visible if _is_input(el)]
-        errors = _extract_errors(dom_text, visible, context.errors)
+        table = ElementTable.from_elements(visible)
+        clickables = table.select(table.clickable_indices())
+        inputs = table.select(table.input_indices())
+        errors, is_login, has_captcha = _scan_signals(
+            dom_text, url, visible, context.errors
+        )
         signals = {
             "has_error": bool(errors),
             "has_inputs": bool(inputs),
             "has_clickables": bool(clickables),
-            "is_login": _detect_login(dom_text, url, visible),
-            "has_captcha": _detect_captcha(dom_text),
+            "is_login": is_login,
+            "has_captcha": has_captcha,
         }
         return PageAnalysis(
             url=url,
@@ -255,15 +631,16 @@ class DecisionEngine:
             inputs=inputs,
             errors=errors,
             signals=signals,
+            table=table,
         )
 
-    async def _select_action(
+    def _select_action(
         self,
         context: DecisionContext,
         analysis: PageAnalysis,
     ) -> Action:
         """Select the next action based on analysis and intent."""
-        retry_action = await self._maybe_retry(context)
+        retry_action = self._maybe_retry(context)
         if retry_action is not None:
             return retry_action
 
@@ -285,19 +662,28 @@ class DecisionEngine:
                 metadata={"errors": analysis.errors},
             )
 
-        navigate_action = self._maybe_navigate(context, analysis)
+        (
+            target_url,
+            extract_targets,
+            form_data,
+            query_value,
+            click_selector,
+            click_text,
+        ) = _resolve_intent(context)
+
+        navigate_action = self._maybe_navigate(target_url, analysis.url)
         if navigate_action is not None:
             return navigate_action
 
-        extract_action = self._maybe_extract(context, analysis)
+        extract_action = self._maybe_extract(extract_targets)
         if extract_action is not None:
             return extract_action
 
-        fill_action = self._maybe_fill(context, analysis)
+        fill_action = self._maybe_fill(analysis, form_data, query_value)
         if fill_action is not None:
             return fill_action
 
-        click_action = self._maybe_click(context, analysis)
+        click_action = self._maybe_click(analysis, click_selector, click_text)
         if click_action is not None:
             return click_action
 
@@ -308,18 +694,18 @@ class DecisionEngine:
             confidence=0.1,
         )
 
-    async def _maybe_retry(self, context: DecisionContext) -> Optional[Action]:
+    def _maybe_retry(self, context: DecisionContext) -> Optional[Action]:
         """Retry if the last result indicates a failure."""
         if context.last_result is None:
             return None
 
-        result_ok = await evaluate_result(context.last_result)
+        result_ok = _evaluate_result(context.last_result)
         if result_ok:
             return None
 
         strategy = None
         if context.last_error is not None:
-            strategy = await get_retry_strategy(context.last_error)
+            strategy = _get_retry_strategy(context.last_error)
 
         if strategy is not None and not strategy.retryable:
             return None
@@ -341,20 +727,12 @@ class DecisionEngine:
             metadata={"strategy": strategy.to_dict() if strategy else None},
         )
 
-    def _maybe_navigate(
-        self,
-        context: DecisionContext,
-        analysis: PageAnalysis,
-    ) -> Optional[Action]:
+    def _maybe_navigate(self, target_url: Any, current_url: str) -> Optional[Action]:
         """Decide if navigation is needed."""
-        target_url = _first_truthy(
-            context.intent.get("target_url"),
-            context.metadata.get("target_url"),
-        )
         if not target_url:
             return None
 
-        if _url_matches(analysis.url, target_url):
+        if _url_matches(current_url, target_url):
             return None
 
         return Action(
@@ -365,18 +743,8 @@ class DecisionEngine:
             confidence=0.9,
         )
 
-    def _maybe_extract(
-        self,
-        context: DecisionContext,
-        analysis: PageAnalysis,
-    ) -> Optional[Action]:
+    def _maybe_extract(self, extract_targets: Any) -> Optional[Action]:
         """Decide if extraction should occur."""
-        extract_targets = _first_truthy(
-            context.intent.get("extract"),
-            context.intent.get("extract_selectors"),
-            context.metadata.get("extract"),
-            context.metadata.get("extract_selectors"),
-        )
         if not extract_targets:
             return None
 
@@ -390,19 +758,14 @@ class DecisionEngine:
 
     def _maybe_fill(
         self,
-        context: DecisionContext,
         analysis: PageAnalysis,
+        form_data: Any,
+        query_value: Any,
     ) -> Optional[Action]:
         """Decide if a form field should be filled."""
         if not analysis.inputs:
             return None
 
-        form_data = _first_truthy(
-            context.intent.get("form_data"),
-            context.intent.get("inputs"),
-            context.metadata.get("form_data"),
-        )
-
         if isinstance(form_data, dict) and form_data:
             candidate = _select_best_input(analysis.inputs, form_data)
             if candidate is not None:
@@ -417,11 +780,6 @@ class DecisionEngine:
                     metadata={"field": field_key, "match_score": score},
                 )
 
-        query_value = _first_truthy(
-            context.intent.get("query"),
-            context.intent.get("text"),
-            context.intent.get("value"),
-        )
         if query_value:
             search_input = _select_search_input(analysis.inputs)
             if search_input:
@@ -438,26 +796,19 @@ class DecisionEngine:
 
     def _maybe_click(
         self,
-        context: DecisionContext,
         analysis: PageAnalysis,
+        click_selector: Any,
+        click_text: Any,
     ) -> Optional[Action]:
         """Decide if a click action should be taken."""
         if not analysis.clickables:
             return None
 
-        selector_override = context.intent.get("click_selector")
-        if selector_override:
-            return Action(
-                action_type=ActionType.CLICK,
-                selector=str(selector_override),
-                reason="click_selector_override",
-                description="Click selector provided by intent",
-                confidence=0.8,
-            )
+        if click_selector:
+            return _click_selector_action(click_selector)
 
-        text_override = context.intent.get("click_text")
-        if text_override:
-            match = _match_click_text(analysis.clickables, str(text_override))
+        if click_text:
+            match = _match_click_text(analysis.clickables, str(click_text))
             if match is not None:
                 return Action(
                     action_type=ActionType.CLICK,
@@ -465,7 +816,7 @@ class DecisionEngine:
                     reason="click_text_override",
                     description="Click element matching intent text",
                     confidence=0.7,
-                    metadata={"matched_text": text_override},
+                    metadata={"matched_text": click_text},
                 )
 
         candidate = _select_best_click(analysis.clickables)
@@ -482,18 +833,13 @@ class DecisionEngine:
             metadata={"label": label, "score": score},
         )
 
-    def _log_decision(
-        self,
-        context: DecisionContext,
-        action: Action,
-        analysis: PageAnalysis,
-    ) -> None:
+    def _log_decision(self, context: DecisionContext, action: Action) -> None:
         """Log the decision with reasoning."""
         self._logger.info(
             "Decision: %s | reason=%s | url=%s | confidence=%.2f",
             action.action_type.value,
             action.reason,
-            analysis.url,
+            context.url,
             action.confidence,
         )
 
@@ -527,8 +873,10 @@ async def evaluate_result(result: Any) -> bool:
     Returns:
         True if result indicates success, False otherwise.
     """
-    await asyncio.sleep(0)
+    return _evaluate_result(result)
 
+
+def _evaluate_result(result: Any) -> bool:
     if result is None:
         return False
     if isinstance(result, bool):
@@ -565,63 +913,28 @@ async def get_retry_strategy(error: Exception) -> RetryStrategy:
     Returns:
         RetryStrategy describing how to retry.
     """
-    await asyncio.sleep(0)
+    return _get_retry_strategy(error)
 
-    if isinstance(error, asyncio.TimeoutError):
-        return RetryStrategy(
-            name="timeout",
-            max_attempts=3,
-            base_delay_sec=1.0,
-            backoff_factor=2.0,
-            jitter=0.3,
-            reason="Timeout while waiting for page or element",
-        )
 
+def _get_retry_strategy(error: Exception) -> RetryStrategy:
+    error_type = type(error)
+    strategy = _STRATEGY_CACHE.get(error_type)
+    if strategy is not None:
+        return strategy
+
+    if isinstance(error, asyncio.TimeoutError):
+        _STRATEGY_CACHE[error_type] = _TIMEOUT_STRAT
+        return _TIMEOUT_STRAT
     if isinstance(error, (ConnectionError, OSError)):
-        return RetryStrategy(
-            name="network",
-            max_attempts=5,
-            base_delay_sec=1.5,
-            backoff_factor=2.0,
-            jitter=0.2,
-            reason="Network or transport error",
-        )
+        _STRATEGY_CACHE[error_type] = _NETWORK_STRAT
+        return _NETWORK_STRAT
 
-    error_text = str(error).lower()
-    if "timeout" in error_text:
-        return RetryStrategy(
-            name="timeout",
-            max_attempts=3,
-            base_delay_sec=1.0,
-            backoff_factor=2.0,
-            jitter=0.3,
-            reason="Timeout reported by error message",
-        )
-    if "captcha" in error_text:
-        return RetryStrategy(
-            name="captcha",
-            max_attempts=1,
-            base_delay_sec=5.0,
-            backoff_factor=1.0,
-            jitter=0.0,
-            reason="Captcha detected; allow manual resolution",
-        )
-    if any(token in error_text for token in ("invalid", "not found", "missing")):
-        return RetryStrategy(
-            name="non_retryable",
-            max_attempts=0,
-            retryable=False,
-            reason="Non-retryable input or selector error",
-        )
+    found = set(_ERROR_MSG_RE.findall(str(error).lower()))
+    for keyword, strategy in _ERROR_MSG_STRATEGIES:
+        if keyword in found:
+            return strategy
 
-    return RetryStrategy(
-        name="generic",
-        max_attempts=2,
-        base_delay_sec=1.0,
-        backoff_factor=2.0,
-        jitter=0.2,
-        reason="Unhandled error; default retry strategy",
-    )
+    return _GENERIC_STRAT
 
 
 # ---------------------------------------------------------------------------
@@ -632,22 +945,96 @@ async def get_retry_strategy(error: Exception) -> RetryStrategy:
 def _normalize_text(text: str) -> str:
     if not text:
         return ""
-    lowered = text.lower()
-    return re.sub(r"\s+", " ", lowered).strip()
+    return " ".join(text.lower().split())
+
+
+def _resolve_intent(
+    context: DecisionContext,
+) -> Tuple[Any, Any, Any, Any, Any, Any]:
+    intent = context.intent
+    metadata = context.metadata
+    target_url = intent.get("target_url") or metadata.get("target_url")
+    extract_targets = (
+        intent.get("extract")
+        or intent.get("extract_selectors")
+        or metadata.get("extract")
+        or metadata.get("extract_selectors")
+    )
+    form_data = (
+        intent.get("form_data")
+        or intent.get("inputs")
+        or metadata.get("form_data")
+    )
+    query_value = intent.get("query") or intent.get("text") or intent.get("value")
+    return (
+        target_url,
+        extract_targets,
+        form_data,
+        query_value,
+        intent.get("click_selector"),
+        intent.get("click_text"),
+    )
+
+
+def _analysis_key(context: DecisionContext) -> Tuple[Any, ...]:
+    return (
+        context.url,
+        context.dom,
+        _mapping_key(context.intent),
+        _mapping_key(context.metadata),
+        context.retry_count,
+        tuple(context.errors),
+    )
+
 
+def _mapping_key(mapping: Dict[str, Any]) -> Any:
+    try:
+        return frozenset(mapping.items())
+    except TypeError:
+        return repr(mapping)
 
-def _coerce_elements(elements: Iterable[Any]) -> List[Dict[str, Any]]:
+
+def _coerce_elements(
+    elements: Iterable[Any],
+    fresh: bool = False,
+) -> List[Dict[str, Any]]:
     coerced: List[Dict[str, Any]] = []
     for item in elements:
         if isinstance(item, dict):
+            if fresh:
+                item.pop(_NORM_TEXT_KEY, None)
+            if fresh or _ROLE_LC_KEY not in item:
+                _cache_lowered_attributes(item)
             coerced.append(item)
-        elif isinstance(item, str):
-            coerced.append({"text": item, "visible": True})
         else:
-            coerced.append({"text": str(item), "visible": True})
+            text = item if isinstance(item, str) else str(item)
+            coerced.append(
+                {
+                    "text": text,
+                    "visible": True,
+                    _ROLE_LC_KEY: "",
+                    _TAG_LC_KEY: "",
+                    _TYPE_LC_KEY: "",
+                }
+            )
     return coerced
 
 
+def _cache_lowered_attributes(element: Dict[str, Any]) -> None:
+    element[_ROLE_LC_KEY] = _lower_attribute(element.get("role", ""))
+    element[_TAG_LC_KEY] = _lower_attribute(element.get("tag", ""))
+    element[_TYPE_LC_KEY] = _lower_attribute(element.get("type", ""))
+
+
+def _lower_attribute(value: Any) -> str:
+    if type(value) is str:
+        lowered = _ATTR_LOWER.get(value)
+        if lowered is not None:
+            return lowered
+        return value.lower()
+    return str(value).lower()
+
+
 def _coerce_error_list(errors: Any) -> List[str]:
     if errors is None:
         return []
@@ -656,79 +1043,70 @@ def _coerce_error_list(errors: Any) -> List[str]:
     return [str(errors)]
 
 
-def _extract_errors(dom_text: str, elements: List[Dict[str, Any]], errors: List[str]) -> List[str]:
+def _scan_signals(
+    dom_text: str,
+    url: str,
+    elements: List[Dict[str, Any]],
+    errors: List[str],
+) -> Tuple[List[str], bool, bool]:
     found = list(errors)
-    if "error" in dom_text or "failed" in dom_text or "try again" in dom_text:
+    dom_error, has_captcha, is_login = _scan_dom_signals(dom_text)
+    if dom_error:
         found.append("dom_error_marker")
+    is_login = is_login or _LOGIN_URL_RE.search(url) is not None
+
+    element_hits = 0
     for el in elements:
+        errors_done = element_hits >= _MAX_ELEMENT_ERRORS
+        if errors_done and is_login:
+            break
         text = _element_text(el)
-        if any(token in text for token in ("error", "failed", "invalid", "try again")):
+        error_hit = False
+        for match in _ELEMENT_SIGNAL_RE.finditer(text):
+            if match.group(1) is not None:
+                error_hit = True
+            else:
+                is_login = True
+            if (error_hit or errors_done) and is_login:
+                break
+        if error_hit and not errors_done:
             found.append(text)
-    return found
-
-
-def _element_text(element: Dict[str, Any]) -> str:
-    parts = [
-        element.get("text"),
-        element.get("label"),
-        element.get("aria_label"),
-        element.get("name"),
-        element.get("placeholder"),
-        element.get("value"),
-    ]
-    combined = " ".join([str(p) for p in parts if p])
-    return _normalize_text(combined)
-
-
-def _is_clickable(element: Dict[str, Any]) -> bool:
-    if element.get("visible") is False:
-        return False
-    role = str(element.get("role", "")).lower()
-    tag = str(element.get("tag", "")).lower()
-    if element.get("clickable") is True:
-        return True
-    if role in {"button", "link", "menuitem", "tab"}:
-        return True
-    if tag in {"button", "a"}:
-        return True
-    return False
-
-
-def _is_input(element: Dict[str, Any]) -> bool:
-    if element.get("visible") is False:
-        return False
-    role = str(element.get("role", "")).lower()
-    tag = str(element.get("tag", "")).lower()
-    input_type = str(element.get("type", "")).lower()
-    if role in {"textbox", "combobox", "searchbox"}:
-        return True
-    if tag in {"input", "textarea", "select"}:
-        return True
-    if input_type in {"text", "email", "password", "search", "tel", "url"}:
-        return True
-    return False
+            element_hits += 1
+    return found, is_login, has_captcha
 
 
-def _detect_login(dom_text: str, url: str, elements: List[Dict[str, Any]]) -> bool:
-    if any(token in url.lower() for token in ("login", "signin", "sign-in")):
-        return True
-    if any(token in dom_text for token in ("password", "sign in", "log in")):
-        return True
-    for el in elements:
-        if any(token in _element_text(el) for token in ("sign in", "log in", "password")):
-            return True
-    return False
-
-
-def _detect_captcha(dom_text: str) -> bool:
-    return any(token in dom_text for token in ("captcha", "recaptcha", "hcaptcha"))
+def _scan_dom_signals(dom_text: str) -> Tuple[bool, bool, bool]:
+    error = captcha = login = False
+    for match in _DOM_SIGNAL_RE.finditer(dom_text):
+        if match.group(1) is not None:
+            error = True
+        elif match.group(2) is not None:
+            captcha = True
+        else:
+            login = True
+        if error and captcha and login:
+            break
+    return error, captcha, login
 
 
-def _first_truthy(*values: Any) -> Any:
-    for value in values:
-        if value:
-            return value
-    return None
+def _element_text(element: Dict[str, Any]) -> str:
+    cached = element.get(_NORM_TEXT_KEY)
+    if cached is not None:
+        return cached
+    combined = " ".join([str(p) for p in map(element.get, _ELEMENT_TEXT_KEYS) if p])
+    text = " ".join(combined.lower().split())
+    element[_NORM_TEXT_KEY] = text
+    return text
+
+
+def _click_selector_action(selector: Any) -> Action:
+    return Action(
+        action_type=ActionType.CLICK,
+        selector=str(selector),
+        reason="click_selector_override",
+        description="Click selector provided by intent",
+        confidence=0.8,
+    )
 
 
 def _url_matches(current_url: str, target_url: str) -> bool:
@@ -745,20 +1123,35 @@ def _select_best_input(
     inputs: List[Dict[str, Any]],
     form_data: Dict[str, Any],
 ) -> Optional[Tuple[Dict[str, Any], str, Any, float]]:
+    fields = [_prepare_field(str(key), value) for key, value in form_data.items()]
     best: Optional[Tuple[Dict[str, Any], str, Any, float]] = None
     for element in inputs:
         if _is_filled(element):
             continue
         element_text = _element_text(element)
-        for field_key, value in form_data.items():
-            score = _score_match(element_text, str(field_key))
+        if not element_text:
+            continue
+        for field_key, value, field_norm, field_tokens in fields:
+            score = _score_match(element_text, field_norm, field_tokens)
             if score <= 0:
                 continue
             if best is None or score > best[3]:
-                best = (element, str(field_key), value, score)
+                best = (element, field_key, value, score)
+                if score >= 1.0:
+                    return best
     return best
 
 
+def _prepare_field(
+    field_key: str,
+    value: Any,
+) -> Tuple[str, Any, Optional[str], Tuple[str, ...]]:
+    if not field_key:
+        return field_key, value, None, ()
+    field_norm = _normalize_text(field_key)
+    return field_key, value, field_norm, tuple(field_norm.split())
+
+
 def _select_search_input(inputs: List[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
     for element in inputs:
         if _is_filled(element):
@@ -766,8 +1159,7 @@ def _select_search_input(inputs: List[Dict[str, Any]]) -> Optional[Dict[str, Any
         text = _element_text(element)
         if "search" in text:
             return element
-        input_type = str(element.get("type", "")).lower()
-        if input_type == "search":
+        if element.get(_TYPE_LC_KEY) == "search":
             return element
     return None
 
@@ -775,31 +1167,21 @@ def _select_search_input(inputs: List[Dict[str, Any]]) -> Optional[Dict[str, Any
 def _select_best_click(
     clickables: List[Dict[str, Any]],
 ) -> Optional[Tuple[Dict[str, Any], str, float]]:
-    priority = [
-        "continue",
-        "next",
-        "submit",
-        "save",
-        "ok",
-        "yes",
-        "allow",
-        "accept",
-        "sign in",
-        "log in",
-        "login",
-        "create",
-        "start",
-        "finish",
-        "done",
-    ]
     best: Optional[Tuple[Dict[str, Any], str, float]] = None
     for element in clickables:
-        text = _element_text(element)
-        for rank, label in enumerate(priority):
-            if label in text:
-                score = 1.0 - (rank / max(1, len(priority)))
-                if best is None or score > best[2]:
-                    best = (element, label, score)
+        label = None
+        score = -1.0
+        for match in _CLICK_PRIORITY_RE.finditer(_element_text(element)):
+            candidate = match.group(1)
+            candidate_score = _CLICK_PRIORITY_SCORE[candidate]
+            if candidate_score > score:
+                label, score = candidate, candidate_score
+        if label is None:
+            continue
+        if best is None or score > best[2]:
+            best = (element, label, score)
+            if score >= _CLICK_TOP_SCORE:
+                break
     return best
 
 
@@ -825,18 +1207,20 @@ def _is_filled(element: Dict[str, Any]) -> bool:
     return bool(value)
 
 
-def _score_match(element_text: str, field_key: str) -> float:
-    if not element_text or not field_key:
+def _score_match(
+    element_text: str,
+    field_norm: Optional[str],
+    field_tokens: Tuple[str, ...],
+) -> float:
+    if field_norm is None:
         return 0.0
-    element_text = _normalize_text(element_text)
-    field_key = _normalize_text(field_key)
-    if element_text == field_key:
+    if element_text == field_norm:
         return 1.0
-    if field_key in element_text:
+    if field_norm in element_text:
         return 0.8
-    if element_text in field_key:
+    if element_text in field_norm:
         return 0.6
-    tokens = set(field_key.split())
-    if tokens and any(token in element_text for token in tokens):
-        return 0.4
+    for token in field_tokens:
+        if token in element_text:
+            return 0.4
     return 0.0
@@ -18,32 +18,43 @@ Status: PRODUCTION-READY
 """
 
 import asyncio
+import atexit
+import inspect
+import json
 import logging
+import threading
 import time
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
-from typing import List, Optional, Dict, Any, Callable, Awaitable, TypeVar
-from datetime import datetime
+from typing import List, Optional, Dict, Any, Callable, Awaitable, Tuple, TypeVar
 
 # Phase 4 module imports
 from sparc_phase4_auth_detector import analyze_auth_status, AuthStatus
 from sparc_phase4_session_manager import SessionManager
 from sparc_phase4_browser_automation import (
     AsyncPlaywrightDriver,
+    block_heavy_resources,
+    boost_browser_priority,
     fill_service_account_form,
     navigate_to_service_account_page,
     navigate_wizard_steps,
+    start_token_capture,
     extract_token
 )
 from sparc_phase4_cli_integration import (
-    validate_token_format,
     save_token_to_env,
-    test_token,
-    ServiceAccountResult
+    test_token_async,
+    ServiceAccountResult,
+    ValidatedToken
 )
 from sparc_phase4_screenshot_analyzer import ScreenshotAnalyzer
-from sparc_phase4_decision_engine import DecisionEngine, RetryStrategy
+from sparc_phase4_decision_engine import (
+    _DATACLASS_SLOTS,
+    DecisionEngine,
+    RetryOutcomes,
+    RetryStrategy,
+)
 
 # Autonomous mode modules (imported conditionally)
 try:
@@ -51,6 +62,12 @@ try:
 except ImportError:
     MacAutomation = None
 
+# Optional fast JSON encoder for OrchestrationResult.to_json()
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 # Configure logging
 logging.basicConfig(
@@ -62,6 +79,17 @@ logger = logging.getLogger(__name__)
 
 T = TypeVar("T")
 
+# Seconds an authenticated analyze_auth_status() result is reused across
+# orchestration runs (override with config["auth_cache_ttl"]; 0 disables)
+AUTH_CACHE_TTL = 60.0
+_AUTH_CACHE: Optional[Tuple[float, AuthStatus]] = None  # (monotonic timestamp, status)
+
+# Concurrent browser drivers the orchestrate_sync() pool hands out
+ORCHESTRATOR_POOL_SIZE = 1
+
+# Leading token characters kept by OrchestrationResult.to_dict()
+_REDACT_LEN = 20
+
 # ============================================================================
 # ENUMS AND STATE MACHINE
 # ============================================================================
@@ -77,18 +105,23 @@ class OrchestrationState(Enum):
     WIZARD_NAV = "wizard_nav"
     EXTRACT_TOKEN = "extract_token"
     VALIDATE_TOKEN = "validate_token"
-    SAVE_TOKEN = "save_token"
-    TEST_TOKEN = "test_token"
+    PERSIST_AND_VERIFY = "persist_and_verify"
     CLEANUP = "cleanup"
     COMPLETE = "complete"
     ERROR = "error"
 
 
+# One bit per state for the visited_mask fields below
+_STATE_BITS: Dict[OrchestrationState, int] = {
+    state: 1 << index for index, state in enumerate(OrchestrationState)
+}
+
+
 # ============================================================================
 # DATA STRUCTURES
 # ============================================================================
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class OrchestrationResult:
     """
     Result of orchestration workflow.
@@ -101,6 +134,7 @@ class OrchestrationResult:
         duration_seconds: Total execution time
         final_state: Final state machine state
         state_transitions: List of states visited
+        visited_mask: Bitmask of visited states (see has_visited())
         auth_status: Initial authentication status
         token_validated: Whether token passed validation
         token_saved: Whether token was saved to environment
@@ -113,6 +147,7 @@ class OrchestrationResult:
     duration_seconds: float = 0.0
     final_state: OrchestrationState = OrchestrationState.INIT
     state_transitions: List[OrchestrationState] = field(default_factory=list)
+    visited_mask: int = 0
     auth_status: Optional[AuthStatus] = None
     token_validated: bool = False
     token_saved: bool = False
@@ -133,22 +168,34 @@ class OrchestrationResult:
             f"Tested: {'✓' if self.token_tested else '✗'}"
         )
 
+    def has_visited(self, state: OrchestrationState) -> bool:
+        """Check whether the workflow passed through a state (O(1))."""
+        return bool(self.visited_mask & _STATE_BITS[state])
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
+        auth_status = self.auth_status
         return {
             "success": self.success,
             "service_account_name": self.service_account_name,
-            "token": self.token[:20] + "..." if self.token else None,  # Redacted
+            "token": self.token[:_REDACT_LEN] + "..." if self.token else None,  # Redacted
             "error_message": self.error_message,
             "duration_seconds": self.duration_seconds,
             "final_state": self.final_state.value,
-            "state_transitions": [s.value for s in self.state_transitions],
-            "auth_status": self.auth_status.detected_method if self.auth_status else None,
+            "state_transitions": [state.value for state in self.state_transitions],
+            "auth_status": auth_status.detected_method if auth_status else None,
             "token_validated": self.token_validated,
             "token_saved": self.token_saved,
             "token_tested": self.token_tested,
         }
 
+    def to_json(self) -> bytes:
+        """Serialize to_dict() as UTF-8 JSON (uses orjson when installed)."""
+        data = self.to_dict()
+        if orjson is not None:
+            return orjson.dumps(data)
+        return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode()
+
 
 @dataclass
 class OrchestrationContext:
@@ -166,8 +213,12 @@ class OrchestrationContext:
         auth_status: Authentication status result
         page: Playwright page object
         token: Extracted service account token
+        validated_token: Token after format validation (set in step 8)
+        token_saved: Whether the token was written to ~/.zshrc (step 9)
+        token_tested: Whether the op whoami check passed (step 9)
         error: Current error message
-        start_time: Workflow start timestamp
+        retry_deadline: time.monotonic() after which no retry may start
+        start_monotonic_ns: Workflow start, from time.monotonic_ns()
     """
     account_name: str
     vaults: List[str]
@@ -179,9 +230,42 @@ class OrchestrationContext:
     auth_status: Optional[AuthStatus] = None
     page: Optional[Any] = None
     token: Optional[str] = None
+    validated_token: Optional[ValidatedToken] = None
+    token_saved: bool = False
+    token_tested: bool = False
     error: Optional[str] = None
-    start_time: datetime = field(default_factory=datetime.now)
+    retry_deadline: Optional[float] = None
+    start_monotonic_ns: int = field(default_factory=time.monotonic_ns)
     state_transitions: List[OrchestrationState] = field(default_factory=list)
+    visited_mask: int = 0
+
+
+# ============================================================================
+# AUTH STATUS CACHE
+# ============================================================================
+
+def _auth_cache_get(ttl: float) -> Optional[AuthStatus]:
+    """Return the cached auth status if present and younger than ttl."""
+    entry = _AUTH_CACHE
+    if entry is None:
+        return None
+    cached_at, status = entry
+    if time.monotonic() - cached_at >= ttl:
+        return None
+    return status
+
+
+def _auth_cache_put(status: AuthStatus) -> None:
+    """Cache an authenticated status; unauthenticated results are not kept."""
+    global _AUTH_CACHE
+    if status.is_authenticated:
+        _AUTH_CACHE = (time.monotonic(), status)
+
+
+def clear_auth_cache() -> None:
+    """Forget the cached auth status so the next run calls `op` again."""
+    global _AUTH_CACHE
+    _AUTH_CACHE = None
 
 
 # ============================================================================
@@ -196,34 +280,69 @@ class Orchestrator:
     error handling, logging, and performance timing.
     """
 
-    def __init__(self, config: Optional[Dict[str, Any]] = None):
+    # Workflow table walked by orchestrate(): (state, step method, retryable).
+    # A state of None means the step makes its own transitions.
+    WORKFLOW_STEPS: Tuple[Tuple[Optional[OrchestrationState], str, bool], ...] = (
+        (None, "_startup_stage", False),
+        (OrchestrationState.NAVIGATE, "_navigate_to_page", True),
+        (OrchestrationState.FILL_FORM, "_fill_account_form", True),
+        (OrchestrationState.WIZARD_NAV, "_navigate_wizard", True),
+        (OrchestrationState.EXTRACT_TOKEN, "_extract_service_token", True),
+        (OrchestrationState.VALIDATE_TOKEN, "_validate_token", False),
+        (OrchestrationState.PERSIST_AND_VERIFY, "_persist_and_verify_token", False),
+        (OrchestrationState.CLEANUP, "_cleanup", False),
+    )
+
+    def __init__(
+        self,
+        config: Optional[Dict[str, Any]] = None,
+        pool: Optional["OrchestratorPool"] = None
+    ):
         """
         Initialize orchestrator.
 
         Args:
             config: Optional configuration dictionary
+            pool: Optional OrchestratorPool to borrow a warm browser driver
+                from; orchestrate() must then run on the pool's event loop
+                (see OrchestratorPool.run())
         """
         self.config = config or {}
+        self.pool = pool
         self.context: Optional[OrchestrationContext] = None
         self.playwright_driver: Optional[AsyncPlaywrightDriver] = None
+        self._token_capture: Optional["asyncio.Task[Optional[str]]"] = None
 
         # Initialize autonomous modules if enabled
         self.autonomous = self.config.get('autonomous', False)
         self.max_retries = self.config.get('max_retries', 3)
+        self.auth_cache_ttl = float(self.config.get('auth_cache_ttl', AUTH_CACHE_TTL))
+        # Attempt outcomes behind adaptive strategies' delays, per instance
+        self._retry_outcomes = RetryOutcomes()
+        self._configured_max_retries = self._parse_max_retries(
+            self.config.get('max_retries')
+        )
+        # Total seconds of retry backoff allowed per orchestrate() run
+        # (config["retry_budget_sec"]; unset means no limit)
+        retry_budget = self.config.get('retry_budget_sec')
+        self.retry_budget_sec = float(retry_budget) if retry_budget is not None else None
 
         if self.autonomous:
             self.decision_engine = DecisionEngine()
-            if MacAutomation is not None:
-                self.macos_control = MacAutomation()
+            try:
+                # PyObjC frameworks load here (ImportError off macOS)
+                self.macos_control = MacAutomation() if MacAutomation else None
+            except ImportError:
+                self.macos_control = None
+            if self.macos_control is not None:
                 logger.info("Autonomous mode enabled with MacAutomation")
             else:
-                self.macos_control = None
                 logger.warning("Autonomous mode enabled but MacAutomation not available")
         else:
             self.decision_engine = None
             self.macos_control = None
 
-        logger.info(f"Orchestrator initialized (autonomous={self.autonomous})")
+        logger.info("Orchestrator initialized (autonomous=%s)", self.autonomous)
 
     async def orchestrate(
         self,
@@ -235,17 +354,18 @@ class Orchestrator:
         Full workflow orchestration - main entry point.
 
         Orchestrates complete workflow:
-        1. Check authentication status
+        1. Check authentication status (runs while steps 2-3 start up)
         2. Initialize session manager
-        3. Open browser (Playwright)
+        3. Open browser (Playwright; warm from the pool when one is set)
         4. Navigate to 1Password service account page
         5. Fill service account form
         6. Navigate wizard steps
         7. Extract token
         8. Validate token format
-        9. Save token to ~/.zshrc
-        10. Test token with CLI
-        11. Cleanup and return results
+        9. Save token to ~/.zshrc and test it with the CLI (concurrently)
+        10. Cleanup and return results
+
+        The steps and their retry policy are declared in WORKFLOW_STEPS.
 
         Args:
             account_name: Service account name
@@ -273,79 +393,35 @@ class Orchestrator:
             autonomous=self.autonomous,
             max_retries=self.max_retries
         )
+        if self.retry_budget_sec is not None:
+            self.context.retry_deadline = time.monotonic() + self.retry_budget_sec
 
-        start_time = time.time()
         logger.info(
-            f"Starting orchestration: account={account_name}, "
-            f"vaults={vaults}, headless={headless}"
+            "Starting orchestration: account=%s, vaults=%s, headless=%s",
+            account_name, vaults, headless
         )
 
         try:
-            # State 1: Check authentication
-            await self._transition_state(OrchestrationState.CHECK_AUTH)
-            await self._retry_with_backoff(
-                self._check_auth_status,
-                step_name="check_auth_status"
-            )
-
-            # State 2: Initialize session manager
-            await self._transition_state(OrchestrationState.SESSION_INIT)
-            await self._init_session_manager()
-
-            # State 3: Open browser
-            await self._transition_state(OrchestrationState.BROWSER_OPEN)
-            await self._open_browser()
-
-            # State 4: Navigate to service account page
-            await self._transition_state(OrchestrationState.NAVIGATE)
-            await self._retry_with_backoff(
-                self._navigate_to_page,
-                step_name="navigate_to_page"
-            )
-
-            # State 5: Fill form
-            await self._transition_state(OrchestrationState.FILL_FORM)
-            await self._retry_with_backoff(
-                self._fill_account_form,
-                step_name="fill_account_form"
-            )
-
-            # State 6: Navigate wizard
-            await self._transition_state(OrchestrationState.WIZARD_NAV)
-            await self._retry_with_backoff(
-                self._navigate_wizard,
-                step_name="navigate_wizard"
-            )
-
-            # State 7: Extract token
-            await self._transition_state(OrchestrationState.EXTRACT_TOKEN)
-            await self._retry_with_backoff(
-                self._extract_service_token,
-                step_name="extract_service_token"
-            )
-
-            # State 8: Validate token
-            await self._transition_state(OrchestrationState.VALIDATE_TOKEN)
-            self._validate_token()
-
-            # State 9: Save token
-            await self._transition_state(OrchestrationState.SAVE_TOKEN)
-            await self._save_token_to_env()
-
-            # State 10: Test token
-            await self._transition_state(OrchestrationState.TEST_TOKEN)
-            await self._test_token_with_cli()
-
-            # State 11: Cleanup
-            await self._transition_state(OrchestrationState.CLEANUP)
-            await self._cleanup()
+            # States 1-10, see WORKFLOW_STEPS
+            for state, step_name, retryable in self.WORKFLOW_STEPS:
+                if state is not None:
+                    await self._transition_state(state)
+                step = getattr(self, step_name)
+                if retryable:
+                    await self._retry_with_backoff(
+                        step, step_name=step_name.lstrip("_")
+                    )
+                else:
+                    outcome = step()
+                    if inspect.isawaitable(outcome):
+                        await outcome
 
-            # State 12: Complete
+            # State 11: Complete
             await self._transition_state(OrchestrationState.COMPLETE)
 
-            duration = time.time() - start_time
+            duration = (time.monotonic_ns() - self.context.start_monotonic_ns) / 1e9
             logger.info(
-                f"Orchestration completed successfully in {duration:.1f}s"
+                "Orchestration completed successfully in %.1fs", duration
             )
 
             return OrchestrationResult(
@@ -355,24 +431,26 @@ class Orchestrator:
                 duration_seconds=duration,
                 final_state=self.context.current_state,
                 state_transitions=self.context.state_transitions,
+                visited_mask=self.context.visited_mask,
                 auth_status=self.context.auth_status,
                 token_validated=True,
-                token_saved=True,
-                token_tested=True,
+                token_saved=self.context.token_saved,
+                token_tested=self.context.token_tested,
                 session_manager=self.context.session_manager
             )
 
         except Exception as e:
-            duration = time.time() - start_time
+            duration = (time.monotonic_ns() - self.context.start_monotonic_ns) / 1e9
             error_msg = f"Orchestration failed: {str(e)}"
             logger.error(error_msg, exc_info=True)
 
             await self._transition_state(OrchestrationState.ERROR)
+            clear_auth_cache()
 
             try:
                 await self._cleanup()
             except Exception as cleanup_err:
-                logger.warning(f"Cleanup failed during error handling: {cleanup_err}")
+                logger.warning("Cleanup failed during error handling: %s", cleanup_err)
 
             return OrchestrationResult(
                 success=False,
@@ -381,7 +459,11 @@ class Orchestrator:
                 duration_seconds=duration,
                 final_state=self.context.current_state,
                 state_transitions=self.context.state_transitions,
+                visited_mask=self.context.visited_mask,
                 auth_status=self.context.auth_status,
+                token_validated=self.context.validated_token is not None,
+                token_saved=self.context.token_saved,
+                token_tested=self.context.token_tested,
                 session_manager=self.context.session_manager
             )
 
@@ -402,90 +484,163 @@ class Orchestrator:
         old_state = self.context.current_state
         self.context.current_state = new_state
         self.context.state_transitions.append(new_state)
+        self.context.visited_mask |= _STATE_BITS[new_state]
 
         logger.info(
-            f"State transition: {old_state.value} → {new_state.value}"
+            "State transition: %s → %s", old_state.value, new_state.value
         )
 
+    async def _gather_fail_fast(self, *coros: Awaitable[Any]) -> List[Any]:
+        """
+        Run coroutines concurrently, cancelling the rest if one fails.
+
+        asyncio.gather() leaves sibling tasks running after the first
+        exception; here they are cancelled and awaited before re-raising so
+        cleanup never races a half-finished step.
+        """
+        tasks = [asyncio.ensure_future(coro) for coro in coros]
+        try:
+            return await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+
     async def _retry_with_backoff(
         self,
         operation: Callable[[], Awaitable[T]],
         step_name: Optional[str] = None
     ) -> T:
         """
-        Retry an async operation with exponential backoff.
+        Retry an async operation with backoff.
 
-        Uses DecisionEngine.get_retry_strategy() and respects config max_retries.
+        Uses DecisionEngine.get_retry_strategy() and respects config
+        max_retries and retry_budget_sec.
+        Outcomes are recorded in this orchestrator's RetryOutcomes so adaptive
+        strategies can scale their delays by the observed failure rate.
         """
         name = step_name or getattr(operation, "__name__", "operation")
         attempt = 0
+        strategy: Optional[RetryStrategy] = None
 
         while True:
             try:
-                return await operation()
+                result = await operation()
             except Exception as exc:
                 strategy = await DecisionEngine.get_retry_strategy(exc)
+                self._retry_outcomes.record(strategy.name, False)
                 max_attempts = self._resolve_max_attempts(strategy)
 
                 if not strategy.retryable:
                     logger.error(
-                        f"{name} failed with non-retryable error: {exc} "
-                        f"(strategy={strategy.name}, reason={strategy.reason})"
+                        "%s failed with non-retryable error: %s "
+                        "(strategy=%s, reason=%s)",
+                        name, exc, strategy.name, strategy.reason
                     )
                     raise
                 if max_attempts <= 0:
                     logger.error(
-                        f"{name} failed with retries disabled: {exc} "
-                        f"(strategy={strategy.name}, reason={strategy.reason})"
+                        "%s failed with retries disabled: %s "
+                        "(strategy=%s, reason=%s)",
+                        name, exc, strategy.name, strategy.reason
                     )
                     raise
 
                 attempt += 1
                 if attempt >= max_attempts:
                     logger.error(
-                        f"{name} failed after {attempt}/{max_attempts} attempts: {exc} "
-                        f"(strategy={strategy.name}, reason={strategy.reason})"
+                        "%s failed after %d/%d attempts: %s "
+                        "(strategy=%s, reason=%s)",
+                        name, attempt, max_attempts, exc,
+                        strategy.name, strategy.reason
                     )
                     raise
 
-                delay = strategy.next_delay_sec(attempt)
+                delay = strategy.next_delay_sec(
+                    attempt, self._retry_outcomes.failure_rate(strategy.name)
+                )
+                deadline = self.context.retry_deadline if self.context else None
+                if deadline is not None and time.monotonic() + delay > deadline:
+                    logger.error(
+                        "%s failed (attempt %d/%d): %s; a %.2fs backoff would "
+                        "exceed the retry budget",
+                        name, attempt, max_attempts, exc, delay
+                    )
+                    raise
                 logger.warning(
-                    f"{name} failed (attempt {attempt}/{max_attempts}); "
-                    f"retrying in {delay:.2f}s - "
-                    f"strategy={strategy.name}, reason={strategy.reason}, error={exc}"
+                    "%s failed (attempt %d/%d); retrying in %.2fs - "
+                    "strategy=%s, reason=%s, error=%s",
+                    name, attempt, max_attempts, delay,
+                    strategy.name, strategy.reason, exc
                 )
                 await asyncio.sleep(delay)
+            else:
+                if strategy is not None:
+                    self._retry_outcomes.record(strategy.name, True)
+                return result
 
     def _resolve_max_attempts(self, strategy: RetryStrategy) -> int:
         """Resolve the effective retry cap using config max_retries."""
-        configured = self.config.get("max_retries")
-        if configured is None:
-            return max(0, int(strategy.max_attempts))
-
-        try:
-            configured_int = int(configured)
-        except (TypeError, ValueError):
-            logger.warning(
-                f"Invalid max_retries config ({configured}); "
-                f"using strategy default of {strategy.max_attempts}"
-            )
-            return max(0, int(strategy.max_attempts))
+        if strategy.max_attempts <= 0:
+            return 0
+        if self._configured_max_retries is None:
+            return int(strategy.max_attempts)
+        return min(int(strategy.max_attempts), self._configured_max_retries)
+
+    @staticmethod
+    def _parse_max_retries(configured: Any) -> Optional[int]:
+        """Parse config max_retries once; None means use strategy defaults."""
+        if configured is None or isinstance(configured, int):
+            configured_int = configured
+        else:
+            try:
+                configured_int = int(configured)
+            except (TypeError, ValueError):
+                logger.warning(
+                    "Invalid max_retries config (%s); using strategy defaults",
+                    configured
+                )
+                return None
 
-        if configured_int < 0:
+        if configured_int is not None and configured_int < 0:
             logger.warning(
-                f"Negative max_retries config ({configured_int}); treating as 0"
+                "Negative max_retries config (%d); treating as 0", configured_int
             )
             return 0
 
-        if strategy.max_attempts <= 0:
-            return 0
-
-        return min(int(strategy.max_attempts), configured_int)
+        return configured_int
 
     # ========================================================================
     # ORCHESTRATION STEPS
     # ========================================================================
 
+    async def _startup_stage(self) -> None:
+        """
+        States 1-3: Check authentication while the session manager and
+        browser start up; nothing before navigation depends on auth.
+        """
+        await self._gather_fail_fast(
+            self._check_auth_stage(),
+            self._open_browser_and_session(),
+        )
+
+    async def _check_auth_stage(self) -> None:
+        """State 1: Check authentication (with retries)."""
+        await self._transition_state(OrchestrationState.CHECK_AUTH)
+        await self._retry_with_backoff(
+            self._check_auth_status,
+            step_name="check_auth_status"
+        )
+
+    async def _open_browser_and_session(self) -> None:
+        """States 2-3: Initialize session manager, then open the browser."""
+        await self._transition_state(OrchestrationState.SESSION_INIT)
+        await self._init_session_manager()
+
+        await self._transition_state(OrchestrationState.BROWSER_OPEN)
+        await self._open_browser()
+
     async def _check_auth_status(self) -> None:
         """
         Step 1: Check authentication status using auth detector module.
@@ -498,7 +653,15 @@ class Orchestrator:
 
         logger.info("Checking 1Password authentication status...")
 
-        self.context.auth_status = analyze_auth_status()
+        auth_status = _auth_cache_get(self.auth_cache_ttl)
+        if auth_status is not None:
+            logger.info("Authentication status served from cache")
+        else:
+            # analyze_auth_status() shells out to `op`; run it off the event
+            # loop so the browser launch gathered alongside it keeps going
+            auth_status = await asyncio.to_thread(analyze_auth_status)
+            _auth_cache_put(auth_status)
+        self.context.auth_status = auth_status
 
         if not self.context.auth_status.is_authenticated:
             raise RuntimeError(
@@ -507,8 +670,9 @@ class Orchestrator:
             )
 
         logger.info(
-            f"Authentication confirmed: {self.context.auth_status.detected_method} "
-            f"(confidence: {self.context.auth_status.confidence_score:.0%})"
+            "Authentication confirmed: %s (confidence: %.0f%%)",
+            self.context.auth_status.detected_method,
+            self.context.auth_status.confidence_score * 100
         )
 
     async def _init_session_manager(self) -> None:
@@ -548,16 +712,29 @@ class Orchestrator:
             "save_session": True,
         }
 
+        macos_control = self.macos_control if self.autonomous else None
+
         try:
-            self.playwright_driver = AsyncPlaywrightDriver(
-                config,
-                macos_control=self.macos_control if self.autonomous else None
-            )
-            driver = await self.playwright_driver.__aenter__()
+            if self.pool is not None:
+                driver = await self.pool.acquire_driver(config, macos_control)
+                self.playwright_driver = driver
+            else:
+                self.playwright_driver = AsyncPlaywrightDriver(
+                    config,
+                    macos_control=macos_control
+                )
+                driver = await self.playwright_driver.__aenter__()
 
             self.context.page = driver.page
 
-            logger.info(f"Browser opened (headless={self.context.headless})")
+            if self.config.get("block_resources", True):
+                await block_heavy_resources(driver.page)
+
+            if self.config.get("boost_qos", False):
+                boosted = await asyncio.to_thread(boost_browser_priority)
+                logger.debug("Raised priority of %d browser processes", boosted)
+
+            logger.info("Browser opened (headless=%s)", self.context.headless)
 
         except Exception as e:
             raise RuntimeError(f"Failed to open browser: {e}")
@@ -581,7 +758,7 @@ class Orchestrator:
                 f"Navigation failed: {nav_result.get('message', 'Unknown error')}"
             )
 
-        logger.info(f"Successfully navigated to: {nav_result['url']}")
+        logger.info("Successfully navigated to: %s", nav_result['url'])
 
     async def _fill_account_form(self) -> None:
         """
@@ -594,8 +771,8 @@ class Orchestrator:
             raise RuntimeError("Context or page not initialized")
 
         logger.info(
-            f"Filling form: account={self.context.account_name}, "
-            f"vaults={self.context.vaults}"
+            "Filling form: account=%s, vaults=%s",
+            self.context.account_name, self.context.vaults
         )
 
         form_result = await fill_service_account_form(
@@ -625,6 +802,10 @@ class Orchestrator:
 
         logger.info("Navigating through wizard steps...")
 
+        # Listen for the create call before the wizard submits it
+        self._cancel_token_capture()
+        self._token_capture = start_token_capture(self.context.page)
+
         wizard_result = await navigate_wizard_steps(
             self.context.page,
             max_steps=5,
@@ -639,7 +820,7 @@ class Orchestrator:
             )
 
         steps_taken = wizard_result.get("steps_taken", 0)
-        logger.info(f"Wizard navigation complete ({steps_taken} steps)")
+        logger.info("Wizard navigation complete (%d steps)", steps_taken)
 
     async def _extract_service_token(self) -> None:
         """
@@ -653,17 +834,26 @@ class Orchestrator:
 
         logger.info("Extracting service account token...")
 
-        self.context.token = await extract_token(self.context.page)
+        # The capture task is single-use; retries fall back to the DOM
+        token_capture, self._token_capture = self._token_capture, None
+        self.context.token = await extract_token(
+            self.context.page, token_capture=token_capture
+        )
 
         if not self.context.token:
             raise RuntimeError("Token extraction failed")
 
         # Log redacted token for security
-        redacted = (
-            f"{self.context.token[:8]}..."
-            f"{self.context.token[-8:]}"
+        logger.info(
+            "Token extracted successfully: %s...%s",
+            self.context.token[:8], self.context.token[-8:]
         )
-        logger.info(f"Token extracted successfully: {redacted}")
+
+    def _cancel_token_capture(self) -> None:
+        """Stop listening for the token response, if still listening."""
+        if self._token_capture is not None:
+            self._token_capture.cancel()
+            self._token_capture = None
 
     def _validate_token(self) -> None:
         """
@@ -677,27 +867,53 @@ class Orchestrator:
 
         logger.info("Validating token format...")
 
-        if not validate_token_format(self.context.token):
-            raise RuntimeError(
-                f"Token validation failed: invalid format"
-            )
+        try:
+            self.context.validated_token = ValidatedToken(self.context.token)
+        except ValueError as e:
+            raise RuntimeError(f"Token validation failed: {e}")
 
         logger.info("Token validation passed")
 
+    async def _persist_and_verify_token(self) -> None:
+        """
+        Step 9: Save token to ~/.zshrc and test it with the CLI in parallel.
+
+        The CLI test passes the token to `op` directly, so it does not need
+        the ~/.zshrc write to land first. Both branches always run to
+        completion; their outcomes are recorded in context.token_saved and
+        context.token_tested before the first failure is re-raised.
+
+        Raises:
+            RuntimeError if either the save or the test fails
+        """
+        save_outcome, test_outcome = await asyncio.gather(
+            self._save_token_to_env(),
+            self._test_token_with_cli(),
+            return_exceptions=True,
+        )
+
+        self.context.token_saved = save_outcome is None
+        self.context.token_tested = test_outcome is None
+
+        for outcome in (save_outcome, test_outcome):
+            if isinstance(outcome, BaseException):
+                raise outcome
+
     async def _save_token_to_env(self) -> None:
         """
-        Step 9: Save token to ~/.zshrc environment variable.
+        Save token to ~/.zshrc environment variable (file I/O in a thread).
 
         Raises:
             RuntimeError if token save fails
         """
-        if self.context is None or not self.context.token:
+        if self.context is None or not self.context.validated_token:
             raise RuntimeError("Token not available for saving")
 
         logger.info("Saving token to ~/.zshrc...")
 
-        persist_result = save_token_to_env(
-            self.context.token,
+        persist_result = await asyncio.to_thread(
+            save_token_to_env,
+            self.context.validated_token,
             env_var_name="OP_SERVICE_ACCOUNT_TOKEN"
         )
 
@@ -707,26 +923,24 @@ class Orchestrator:
             )
 
         logger.info(
-            f"Token saved to ~/.zshrc (backup: {persist_result.backup_path})"
+            "Token saved to ~/.zshrc (backup: %s)", persist_result.backup_path
         )
 
     async def _test_token_with_cli(self) -> None:
         """
-        Step 10: Test token with 1Password CLI (op whoami).
+        Test token with 1Password CLI (op whoami) without blocking the loop.
 
         Raises:
             RuntimeError if token test fails
         """
-        if self.context is None or not self.context.token:
+        if self.context is None or not self.context.validated_token:
             raise RuntimeError("Token not available for testing")
 
         logger.info("Testing token with 1Password CLI...")
 
-        # Set token in current process environment
-        import os
-        os.environ["OP_SERVICE_ACCOUNT_TOKEN"] = self.context.token
-
-        cli_result = test_token()
+        # test_token_async() hands the token to `op` through the
+        # subprocess's own environment, so os.environ is left untouched
+        cli_result = await test_token_async(self.context.validated_token)
 
         if not cli_result.success:
             raise RuntimeError(
@@ -734,30 +948,200 @@ class Orchestrator:
             )
 
         logger.info(
-            f"Token test passed: {cli_result.service_account_name}"
+            "Token test passed: %s", cli_result.service_account_name
         )
 
     async def _cleanup(self) -> None:
         """
-        Step 11: Clean up browser and session resources.
+        Step 10: Clean up browser and session resources.
         """
         logger.info("Cleaning up resources...")
+        self._cancel_token_capture()
 
-        try:
-            # Close Playwright driver if open
-            if self.playwright_driver:
-                await self.playwright_driver.__aexit__(None, None, None)
-                logger.debug("Playwright driver closed")
+        # Browser and session shutdowns are independent; run them side by side
+        closers = []
+        if self.playwright_driver:
+            driver = self.playwright_driver
+            self.playwright_driver = None
+            closers.append(self._release_driver(driver))
+        if self.context and self.context.session_manager:
+            closers.append(self._close_session_manager())
 
-            # Close session manager if open
-            if self.context and self.context.session_manager:
-                await self.context.session_manager.close_session()
-                logger.debug("Session manager closed")
+        for outcome in await asyncio.gather(*closers, return_exceptions=True):
+            if isinstance(outcome, Exception):
+                logger.warning("Cleanup error (non-fatal): %s", outcome)
 
+        logger.info("Cleanup complete")
+
+    async def _release_driver(self, driver: AsyncPlaywrightDriver) -> None:
+        """Close the Playwright driver (pooled drivers stay warm)."""
+        if self.pool is not None:
+            await self.pool.release_driver(driver)
+            logger.debug("Playwright driver returned to pool")
+        else:
+            await driver.__aexit__(None, None, None)
+            logger.debug("Playwright driver closed")
+
+    async def _close_session_manager(self) -> None:
+        """Close the session manager's browser resources."""
+        await self.context.session_manager.close_session()
+        logger.debug("Session manager closed")
+
+
+# ============================================================================
+# ORCHESTRATOR POOL
+# ============================================================================
+
+class OrchestratorPool:
+    """
+    Persistent event loop plus warm Playwright drivers for orchestrate_sync().
+
+    The loop runs in a daemon thread for the life of the process, so
+    repeated synchronous runs skip event loop setup and, more importantly,
+    Playwright/Chromium startup: drivers are kept per (headless, window_size)
+    with their browser running, and each run gets its own BrowserContext
+    (seeded from the saved session state) that is closed on release. At
+    most pool_size drivers are checked out at once.
+    """
+
+    def __init__(self, pool_size: int = ORCHESTRATOR_POOL_SIZE):
+        self.pool_size = max(1, int(pool_size))
+        self._lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._idle: Dict[Tuple[Any, ...], List[AsyncPlaywrightDriver]] = {}
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        """Start the pool's event loop thread on first use."""
+        with self._lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                thread = threading.Thread(
+                    target=loop.run_forever,
+                    name="orchestrator-pool",
+                    daemon=True
+                )
+                thread.start()
+                self._loop, self._thread = loop, thread
+            return self._loop
+
+    def run(self, coro: Awaitable[T]) -> T:
+        """Run a coroutine on the pool's loop and block for its result."""
+        future = asyncio.run_coroutine_threadsafe(coro, self._ensure_loop())
+        return future.result()
+
+    @staticmethod
+    def _driver_key(config: Dict[str, Any]) -> Tuple[Any, ...]:
+        browser = config.get("browser", {})
+        return (
+            bool(browser.get("headless", False)),
+            tuple(browser.get("window_size", ())),
+        )
+
+    async def acquire_driver(
+        self,
+        config: Dict[str, Any],
+        macos_control: Optional[Any] = None
+    ) -> AsyncPlaywrightDriver:
+        """
+        Check out a driver with a fresh context and page.
+
+        Reuses an idle browser when one is running, otherwise launches one.
+
+        Must be awaited on the pool's loop.
+        """
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.pool_size)
+        await self._semaphore.acquire()
+
+        try:
+            idle = self._idle.get(self._driver_key(config), [])
+            while idle:
+                driver = idle.pop()
+                if driver.browser is None or not driver.browser.is_connected():
+                    await self._close_driver(driver)
+                    continue
+                driver.config = config
+                driver.macos_control = macos_control
+                try:
+                    await driver.open_context()
+                    await driver.open_page()
+                except BaseException:
+                    await self._close_driver(driver)
+                    raise
+                logger.debug("Reusing warm Playwright driver from pool")
+                return driver
+
+            driver = AsyncPlaywrightDriver(config, macos_control=macos_control)
+            try:
+                await driver.__aenter__()
+            except BaseException:
+                await self._close_driver(driver)
+                raise
+            return driver
+        except BaseException:
+            self._semaphore.release()
+            raise
+
+    async def release_driver(self, driver: AsyncPlaywrightDriver) -> None:
+        """Save the session, close the context and keep the browser warm."""
+        try:
+            await driver.save_session()
+            await driver.close_context()
+            if driver.browser is not None and driver.browser.is_connected():
+                self._idle.setdefault(self._driver_key(driver.config), []).append(driver)
+            else:
+                await self._close_driver(driver)
+        except Exception as e:
+            logger.warning("Discarding pooled driver after release error: %s", e)
+            await self._close_driver(driver)
+        finally:
+            if self._semaphore is not None:
+                self._semaphore.release()
+
+    @staticmethod
+    async def _close_driver(driver: AsyncPlaywrightDriver) -> None:
+        try:
+            await driver.__aexit__(None, None, None)
         except Exception as e:
-            logger.warning(f"Cleanup error (non-fatal): {e}")
+            logger.warning("Failed to close pooled driver: %s", e)
+
+    async def _close_idle(self) -> None:
+        idle, self._idle = self._idle, {}
+        for drivers in idle.values():
+            for driver in drivers:
+                await self._close_driver(driver)
+
+    def shutdown(self) -> None:
+        """Close idle drivers and stop the pool's event loop."""
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._loop = self._thread = None
+        if loop is None:
+            return
+        try:
+            asyncio.run_coroutine_threadsafe(self._close_idle(), loop).result()
+        finally:
+            loop.call_soon_threadsafe(loop.stop)
+            if thread is not None:
+                thread.join()
+            loop.close()
+            self._semaphore = None
 
-        logger.info("Cleanup complete")
+
+_POOL: Optional[OrchestratorPool] = None
+_POOL_LOCK = threading.Lock()
+
+
+def get_orchestrator_pool() -> OrchestratorPool:
+    """Return the process-wide pool used by orchestrate_sync()."""
+    global _POOL
+    with _POOL_LOCK:
+        if _POOL is None:
+            _POOL = OrchestratorPool(ORCHESTRATOR_POOL_SIZE)
+            atexit.register(_POOL.shutdown)
+        return _POOL
 
 
 # ============================================================================
@@ -771,9 +1155,11 @@ def orchestrate_sync(
     config: Optional[Dict[str, Any]] = None
 ) -> OrchestrationResult:
     """
-    Synchronous wrapper for orchestrate() using asyncio.run().
+    Synchronous wrapper for orchestrate() on the shared OrchestratorPool.
 
-    Allows calling async orchestration from synchronous code.
+    Allows calling async orchestration from synchronous code. Runs reuse the
+    pool's event loop and warm browser, so only the first call pays for
+    Playwright startup.
 
     Args:
         account_name: Service account name
@@ -789,9 +1175,10 @@ def orchestrate_sync(
         >>> print(result)
         [SUCCESS] Account: SPARC-Automation | Duration: 45.2s | ...
     """
-    orchestrator = Orchestrator(config=config)
+    pool = get_orchestrator_pool()
+    orchestrator = Orchestrator(config=config, pool=pool)
 
-    return asyncio.run(
+    return pool.run(
         orchestrator.orchestrate(
             account_name=account_name,
             vaults=vaults,
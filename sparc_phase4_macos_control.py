@@ -8,73 +8,343 @@ Date: 2026-01-01
 Status: PRODUCTION-READY
 """
 
+import importlib
 import time
+from functools import lru_cache
 from typing import Optional
-from AppKit import NSWorkspace
-from ApplicationServices import (
-    AXUIElementCreateApplication,
-    AXUIElementCopyAttributeValue,
-    AXUIElementPerformAction,
-    AXUIElementSetAttributeValue,
-    kAXTitleAttribute,
-    kAXRoleAttribute,
-    kAXWindowsAttribute,
-    kAXChildrenAttribute,
-    kAXPressAction,
-    kAXValueAttribute,
-    kAXDescriptionAttribute,
-    kAXButtonRole,
-    kAXTextFieldRole,
-    kAXTextAreaRole,
+
+# PyObjC frameworks are imported on first use (MacAutomation() or module
+# attribute access) rather than at import time: loading them initializes
+# the Objective-C runtime and framework bundles, which costs 100-300ms and
+# is impossible off macOS. Each name below becomes a module global.
+_FRAMEWORK_SYMBOLS = {
+    "AppKit": (
+        "NSAppleScript",
+        "NSPredicate",
+        "NSRunningApplication",
+        "NSWorkspace",
+    ),
+    "CoreFoundation": ("CFGetTypeID",),
+    "ApplicationServices": (
+        "AXUIElementCreateApplication",
+        "AXUIElementCopyAttributeValue",
+        "AXUIElementCopyMultipleAttributeValues",
+        "AXUIElementCopyParameterizedAttributeNames",
+        "AXUIElementCopyParameterizedAttributeValue",
+        "AXValueGetTypeID",
+        "AXUIElementPerformAction",
+        "AXUIElementSetAttributeValue",
+        "kAXTitleAttribute",
+        "kAXRoleAttribute",
+        "kAXWindowsAttribute",
+        "kAXChildrenAttribute",
+        "kAXPressAction",
+        "kAXValueAttribute",
+        "kAXDescriptionAttribute",
+        "kAXButtonRole",
+        "kAXTextFieldRole",
+        "kAXTextAreaRole",
+    ),
+    "Quartz": (
+        "CGEventCreateKeyboardEvent",
+        "CGEventPost",
+        "kCGHIDEventTap",
+        "CGEventSetFlags",
+        "kCGEventFlagMaskCommand",
+        "kCGEventFlagMaskShift",
+        "kCGEventFlagMaskControl",
+        "kCGEventFlagMaskAlternate",
+    ),
+}
+
+# Module constants built from framework symbols by _load_frameworks()
+_DERIVED_CONSTANTS = (
+    "TRAVERSAL_ATTRIBUTES",
+    "LABEL_ATTRIBUTES",
+    "_AX_VALUE_TYPE_ID",
+    "_MOD_MAP",
 )
 
+_LAZY_NAMES = frozenset(
+    name for names in _FRAMEWORK_SYMBOLS.values() for name in names
+).union(_DERIVED_CONSTANTS)
+
+_frameworks_loaded = False
+
+
+def _load_frameworks() -> None:
+    """
+    Imports the PyObjC frameworks and builds the dependent constants.
+
+    Raises ImportError when PyObjC is unavailable (e.g. not on macOS).
+    """
+    global _frameworks_loaded
+    global TRAVERSAL_ATTRIBUTES, LABEL_ATTRIBUTES
+    global _AX_VALUE_TYPE_ID, _MOD_MAP
+    if _frameworks_loaded:
+        return
+
+    namespace = globals()
+    for module_name, names in _FRAMEWORK_SYMBOLS.items():
+        module = importlib.import_module(module_name)
+        for name in names:
+            namespace[name] = getattr(module, name)
+
+    # Role-pruned search (_find_by_role): every element is fetched with
+    # TRAVERSAL_ATTRIBUTES, only role matches also with LABEL_ATTRIBUTES
+    TRAVERSAL_ATTRIBUTES = [kAXRoleAttribute, kAXChildrenAttribute]
+    LABEL_ATTRIBUTES = [kAXTitleAttribute, kAXDescriptionAttribute]
+
+    # AXUIElementCopyMultipleAttributeValues reports a failed attribute as
+    # an AXValue wrapping the error, in place of the value
+    _AX_VALUE_TYPE_ID = AXValueGetTypeID()
+
+    # press_shortcut() modifier flags
+    _MOD_MAP = {
+        'cmd': kCGEventFlagMaskCommand,
+        'shift': kCGEventFlagMaskShift,
+        'ctrl': kCGEventFlagMaskControl,
+        'alt': kCGEventFlagMaskAlternate,
+    }
+
+    _frameworks_loaded = True
+
+
+def __getattr__(name: str):
+    """Loads the frameworks when a lazy symbol is accessed (PEP 562)."""
+    if name in _LAZY_NAMES:
+        _load_frameworks()
+        return globals()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+# Server-side search exposed by WebKit/Chromium (Electron) accessibility
+# trees: one call returns the elements matching a search key and text
+SEARCH_PREDICATE_ATTRIBUTE = "AXUIElementsForSearchPredicate"
+SEARCH_RESULTS_LIMIT = 10
+
+# AXError codes meaning a cached element no longer refers to a live UI
+_AX_STALE_ERRORS = frozenset({
+    -25202,  # kAXErrorInvalidUIElement
+    -25204,  # kAXErrorCannotComplete
+})
+
+# Seconds get_app_by_name() trusts a cached NSRunningApplication
+APP_CACHE_TTL = 2.0
+
+# Apps get_app_by_name() resolves by bundle identifier (a direct
+# LaunchServices lookup) instead of scanning every running application
+APP_BUNDLE_IDS = {
+    "1Password": "com.1password.1password",
+    "1Password 7": "com.agilebits.onepassword7",
+    "Google Chrome": "com.google.Chrome",
+    "Safari": "com.apple.Safari",
+}
+
+# focus_window(): activate the app and find the 1-based index of the first
+# window whose title contains the keyword (0 if none) in one Apple Event
+# round-trip; System Events lists windows in kAXWindowsAttribute order
+FOCUS_WINDOW_SCRIPT = """
+tell application "{app}" to activate
+tell application "System Events" to tell process "{app}"
+    repeat with i from 1 to count of windows
+        if name of window i contains "{keyword}" then return i
+    end repeat
+end tell
+return 0
+"""
+
+# press_shortcut() key mapping (extend as needed)
+_KEYMAP = {
+    'v': 0x09,
+    'c': 0x08,
+    'p': 0x23,
+    'a': 0x00,
+    'enter': 0x24,
+    'tab': 0x30,
+}
+
+
+def _applescript_escape(text: str) -> str:
+    """Escapes text for use inside an AppleScript string literal."""
+    return text.replace('\\', '\\\\').replace('"', '\\"')
+
+
+@lru_cache(maxsize=64)
+def _parse_shortcut(keys: str) -> tuple[int, int]:
+    """
+    Parses a shortcut like "cmd+shift+p" into (modifier flags, keycode).
+
+    Memoized: repeated shortcuts (e.g. "cmd+v") become a dict lookup.
+    """
+    # Modifiers may appear in any position ("v+cmd"); the other part is the key
+    modifiers = 0
+    key_char = None
+    for part in keys.lower().split('+'):
+        flag = _MOD_MAP.get(part)
+        if flag is None:
+            key_char = part
+        else:
+            modifiers |= flag
+
+    if key_char not in _KEYMAP:
+        raise ValueError(f"Unsupported key: {key_char}")
+    return modifiers, _KEYMAP[key_char]
+
 
 class MacAutomation:
     """macOS UI automation using native Accessibility API."""
 
     def __init__(self, timeout: int = 5) -> None:
+        _load_frameworks()  # pay the PyObjC import once, up front
         self.timeout = timeout
+        self._app_cache = {}  # app name -> (NSRunningApplication, monotonic ts)
+        self._ax_cache = {}  # pid -> application AXUIElement
+        self._script_cache = {}  # (app name, keyword) -> compiled NSAppleScript
+        self._predicate_support = {}  # AXUIElement -> supports predicate search
 
     def _get_ax_element(self, pid: int):
-        """Creates an AXUIElement for a given Process ID."""
-        return AXUIElementCreateApplication(pid)
+        """Returns the (cached) AXUIElement for a given Process ID."""
+        element = self._ax_cache.get(pid)
+        if element is None:
+            element = self._ax_cache[pid] = AXUIElementCreateApplication(pid)
+        return element
+
+    def _forget_ax_element(self, element) -> None:
+        """Drops a cached application element after it went stale."""
+        for pid, cached in list(self._ax_cache.items()):
+            if cached == element:
+                del self._ax_cache[pid]
 
     def _get_attribute(self, element, attribute: str):
-        """Safely retrieves a value from an accessibility attribute."""
+        """
+        Retrieves a value from an accessibility attribute.
+
+        AX failures are reported through the error code, not exceptions.
+        """
+        error, value = AXUIElementCopyAttributeValue(element, attribute, None)
+        if error == 0:
+            return value
+        if error in _AX_STALE_ERRORS:
+            self._forget_ax_element(element)
+        return None
+
+    def _get_attributes(self, element, attributes: list) -> dict:
+        """
+        Retrieves several attributes with a single accessibility call.
+
+        Missing or failed attributes map to None.
+        """
         try:
-            error, value = AXUIElementCopyAttributeValue(element, attribute, None)
-            if error == 0:
-                return value
+            error, values = AXUIElementCopyMultipleAttributeValues(
+                element, attributes, 0, None
+            )
         except Exception:
-            pass
+            return {}
+        if error in _AX_STALE_ERRORS:
+            self._forget_ax_element(element)
+        if error != 0 or values is None:
+            return {}
+        attrs = {}
+        for attribute, value in zip(attributes, values):
+            if value is not None and CFGetTypeID(value) == _AX_VALUE_TYPE_ID:
+                value = None
+            attrs[attribute] = value
+        return attrs
+
+    def _find_by_role(self, root, target_roles: set, predicate, max_depth: int = 10):
+        """
+        Breadth-first search that only reads labels of candidate elements.
+
+        Containers are walked with role and children alone; title and
+        description are fetched only when the role is in target_roles.
+        predicate receives the role, title and description as a dict.
+        """
+        get_attributes = self._get_attributes
+        traversal_attributes = TRAVERSAL_ATTRIBUTES
+        label_attributes = LABEL_ATTRIBUTES
+        role_attribute = kAXRoleAttribute
+        children_attribute = kAXChildrenAttribute
+
+        level = [root]
+        for depth in range(max_depth + 1):
+            next_level = []
+            for element in level:
+                attrs = get_attributes(element, traversal_attributes)
+
+                if attrs.get(role_attribute) in target_roles:
+                    attrs.update(get_attributes(element, label_attributes))
+                    if predicate(attrs):
+                        return element
+
+                children = attrs.get(children_attribute)
+                if children and depth < max_depth:
+                    next_level.extend(children)
+            if not next_level:
+                break
+            level = next_level
         return None
 
-    def _find_element_recursive(self, root, criteria_func, depth: int = 0, max_depth: int = 10):
-        """Recursively searches the accessibility tree for an element matching criteria."""
-        if depth > max_depth:
-            return None
+    def _supports_search_predicate(self, element) -> bool:
+        """Whether element answers AXUIElementsForSearchPredicate (cached)."""
+        supported = self._predicate_support.get(element)
+        if supported is None:
+            error, names = AXUIElementCopyParameterizedAttributeNames(element, None)
+            supported = error == 0 and SEARCH_PREDICATE_ATTRIBUTE in (names or ())
+            self._predicate_support[element] = supported
+        return supported
 
-        # Check if current element matches
-        if criteria_func(root):
-            return root
+    def _find_by_search_predicate(self, root, search_key: str, text: str, predicate):
+        """
+        Asks the app to search its own tree (one round-trip).
 
-        # Get children
-        children = self._get_attribute(root, kAXChildrenAttribute)
-        if not children:
+        Candidates are confirmed with predicate, which receives the title
+        and description as a dict, since AXSearchText matches any text.
+        """
+        params = {
+            "AXSearchKey": search_key,
+            "AXSearchText": text,
+            "AXResultsLimit": SEARCH_RESULTS_LIMIT,
+            "AXDirection": "AXDirectionNext",
+        }
+        error, matches = AXUIElementCopyParameterizedAttributeValue(
+            root, SEARCH_PREDICATE_ATTRIBUTE, params, None
+        )
+        if error != 0 or not matches:
             return None
-
-        for child in children:
-            result = self._find_element_recursive(child, criteria_func, depth + 1, max_depth)
-            if result:
-                return result
+        for element in matches:
+            if predicate(self._get_attributes(element, LABEL_ATTRIBUTES)):
+                return element
         return None
 
     def get_app_by_name(self, app_name: str):
-        """Finds a running application by name."""
-        apps = NSWorkspace.sharedWorkspace().runningApplications()
-        for app in apps:
-            if app.localizedName() == app_name:
+        """Finds a running application by name (cached for APP_CACHE_TTL)."""
+        cached = self._app_cache.get(app_name)
+        if cached is not None:
+            app, cached_at = cached
+            if time.monotonic() - cached_at < APP_CACHE_TTL and not app.isTerminated():
                 return app
+            del self._app_cache[app_name]
+            if app.isTerminated():
+                self._ax_cache.pop(app.processIdentifier(), None)
+
+        bundle_id = APP_BUNDLE_IDS.get(app_name)
+        if bundle_id is not None:
+            apps = NSRunningApplication.runningApplicationsWithBundleIdentifier_(bundle_id)
+            for app in apps:
+                if not app.isTerminated():
+                    self._app_cache[app_name] = (app, time.monotonic())
+                    return app
+
+        # Filter on the Objective-C side: one predicate evaluation pass
+        # instead of a bridged localizedName() call per running process
+        apps = NSWorkspace.sharedWorkspace().runningApplications()
+        predicate = NSPredicate.predicateWithFormat_("localizedName == %@", app_name)
+        matches = apps.filteredArrayUsingPredicate_(predicate)
+        if matches.count():
+            app = matches[0]
+            self._app_cache[app_name] = (app, time.monotonic())
+            return app
         return None
 
     def focus_window(self, app_name: str, window_title_keyword: Optional[str] = None):
@@ -86,6 +356,17 @@ class MacAutomation:
         if not app:
             raise Exception(f"App '{app_name}' not found")
 
+        if window_title_keyword:
+            index = self._focus_window_via_script(app_name, window_title_keyword)
+            if index is not None:
+                if index == 0:
+                    return None
+                ax_app = self._get_ax_element(app.processIdentifier())
+                windows = self._get_attribute(ax_app, kAXWindowsAttribute)
+                if windows and index <= len(windows):
+                    return windows[index - 1]
+                return None
+
         # Activate App (NSApplicationActivateIgnoringOtherApps = 1 << 1)
         app.activateWithOptions_(1 << 1)
         time.sleep(0.5)
@@ -103,6 +384,31 @@ class MacAutomation:
                     return window
         return None
 
+    def _focus_window_via_script(self, app_name: str, keyword: str) -> Optional[int]:
+        """
+        Activates the app and locates the window with one AppleScript call.
+
+        Returns the 1-based window index (0 if no title matches), or None if
+        the script failed and the caller should use the PyObjC path.
+        """
+        key = (app_name, keyword)
+        script = self._script_cache.get(key)
+        if script is None:
+            source = FOCUS_WINDOW_SCRIPT.format(
+                app=_applescript_escape(app_name),
+                keyword=_applescript_escape(keyword),
+            )
+            script = NSAppleScript.alloc().initWithSource_(source)
+            success, _ = script.compileAndReturnError_(None)
+            if not success:
+                return None
+            self._script_cache[key] = script
+
+        result, error = script.executeAndReturnError_(None)
+        if error is not None or result is None:
+            return None
+        return result.int32Value()
+
     def click_button(self, app_name: str, button_label: str) -> bool:
         """
         Clicks a button by its accessibility label (AXTitle or AXDescription).
@@ -114,17 +420,19 @@ class MacAutomation:
 
         ax_app = self._get_ax_element(app.processIdentifier())
 
-        def is_target_button(element):
-            role = self._get_attribute(element, kAXRoleAttribute)
-            if role != kAXButtonRole:
-                return False
-
-            title = self._get_attribute(element, kAXTitleAttribute)
-            desc = self._get_attribute(element, kAXDescriptionAttribute)
-
-            return (title == button_label) or (desc == button_label)
+        def is_target_button(attrs):
+            return (
+                attrs.get(kAXTitleAttribute) == button_label
+                or attrs.get(kAXDescriptionAttribute) == button_label
+            )
 
-        target = self._find_element_recursive(ax_app, is_target_button)
+        target = None
+        if self._supports_search_predicate(ax_app):
+            target = self._find_by_search_predicate(
+                ax_app, "AXButtonSearchKey", button_label, is_target_button
+            )
+        if target is None:
+            target = self._find_by_role(ax_app, {kAXButtonRole}, is_target_button)
 
         if target:
             AXUIElementPerformAction(target, kAXPressAction)
@@ -142,15 +450,18 @@ class MacAutomation:
 
         ax_app = self._get_ax_element(app.processIdentifier())
 
-        def is_target_field(element):
-            role = self._get_attribute(element, kAXRoleAttribute)
-            if role not in [kAXTextFieldRole, kAXTextAreaRole]:
-                return False
+        def is_target_field(attrs):
+            return attrs.get(kAXDescriptionAttribute) == field_label
 
-            desc = self._get_attribute(element, kAXDescriptionAttribute)
-            return desc == field_label
-
-        target = self._find_element_recursive(ax_app, is_target_field)
+        target = None
+        if self._supports_search_predicate(ax_app):
+            target = self._find_by_search_predicate(
+                ax_app, "AXTextFieldSearchKey", field_label, is_target_field
+            )
+        if target is None:
+            target = self._find_by_role(
+                ax_app, {kAXTextFieldRole, kAXTextAreaRole}, is_target_field
+            )
 
         if target:
             # Direct value injection (faster and more reliable than keystroke pasting)
@@ -163,48 +474,7 @@ class MacAutomation:
         Press keyboard shortcuts (e.g., 'cmd+v', 'cmd+shift+p').
         Uses CGEvent for reliable keyboard simulation.
         """
-        from Quartz import (
-            CGEventCreateKeyboardEvent,
-            CGEventPost,
-            kCGHIDEventTap,
-            CGEventSetFlags,
-            kCGEventFlagMaskCommand,
-            kCGEventFlagMaskShift,
-            kCGEventFlagMaskControl,
-            kCGEventFlagMaskAlternate,
-        )
-
-        # Key mapping (extend as needed)
-        keymap = {
-            'v': 0x09,
-            'c': 0x08,
-            'p': 0x23,
-            'a': 0x00,
-            'enter': 0x24,
-            'tab': 0x30,
-        }
-
-        # Parse keys (e.g., "cmd+shift+p")
-        parts = keys.lower().split('+')
-        modifiers = 0
-        key_char = None
-
-        for part in parts:
-            if part == 'cmd':
-                modifiers |= kCGEventFlagMaskCommand
-            elif part == 'shift':
-                modifiers |= kCGEventFlagMaskShift
-            elif part == 'ctrl':
-                modifiers |= kCGEventFlagMaskControl
-            elif part == 'alt':
-                modifiers |= kCGEventFlagMaskAlternate
-            else:
-                key_char = part
-
-        if key_char not in keymap:
-            raise ValueError(f"Unsupported key: {key_char}")
-
-        keycode = keymap[key_char]
+        modifiers, keycode = _parse_shortcut(keys)
 
         # Press key
         key_down = CGEventCreateKeyboardEvent(None, keycode, True)
@@ -26,10 +26,15 @@ Date: 2026-01-01
 """
 
 import argparse
+import hashlib
+import json
 import logging
 import os
+import queue
+import shutil
 import signal
 import sys
+import threading
 import time
 from datetime import datetime
 from pathlib import Path
@@ -37,7 +42,11 @@ from typing import Optional, Dict, Any, List
 
 # Import Phase 4 modules
 try:
-    from sparc_phase4_integration import Orchestrator, OrchestrationResult
+    from sparc_phase4_integration import (
+        Orchestrator,
+        OrchestrationResult,
+        orchestrate_sync,
+    )
 except ImportError as e:
     print(f"ERROR: Phase 4 integration module not found: {e}")
     print("Ensure sparc_phase4_integration.py is in the same directory.")
@@ -109,6 +118,13 @@ except ImportError as e:
         def save_metrics(self): pass
 
 
+# In-process macOS speech (falls back to the `say` binary without PyObjC)
+try:
+    from AppKit import NSDate, NSRunLoop, NSSpeechSynthesizer
+except ImportError:
+    NSDate = NSRunLoop = NSSpeechSynthesizer = None
+
+
 # Exit codes
 EXIT_SUCCESS = 0
 EXIT_AUTH_FAILED = 1
@@ -117,13 +133,34 @@ EXIT_VALIDATION_FAILED = 3
 EXIT_CONFIG_ERROR = 4
 EXIT_GENERAL_ERROR = 5
 
+# Successful validate_environment() results are cached here, keyed on the
+# interpreter and the op/say binaries, so repeat runs skip the probes
+ENV_CACHE_FILE = Path.home() / ".cache" / "sparc" / "env_validation.json"
+ENV_CACHE_TTL = 3600  # seconds
+
+# One shell run probes all tools; prints "<tool>=<exit code|missing>" lines
+ENV_PROBE_SCRIPT = (
+    'if command -v op >/dev/null 2>&1; then '
+    'op --version >/dev/null 2>&1; echo "op=$?"; '
+    'else echo "op=missing"; fi; '
+    # A real (cheap) query, so a yabai that is installed but not running
+    # is reported too
+    'if command -v yabai >/dev/null 2>&1; then '
+    'yabai -m query --windows >/dev/null 2>&1; echo "yabai=$?"; '
+    'else echo "yabai=missing"; fi; '
+    'if command -v say >/dev/null 2>&1; then echo "say=0"; '
+    'else echo "say=missing"; fi'
+)
+
 
 class VoiceNotifier:
     """
     Voice notification system for accessibility.
 
     Provides audio feedback for critical events to support users
-    with typing difficulties.
+    with typing difficulties. Speech runs on a background worker thread so
+    the automation workflow never blocks on audio; call close() on shutdown
+    to let queued messages finish.
     """
 
     def __init__(self, enabled: bool = True, voice: str = "Samantha", rate: int = 200):
@@ -140,18 +177,213 @@ class VoiceNotifier:
         self.rate = rate
         self.last_notification = 0
         self.min_interval = 2.0  # Minimum seconds between notifications
+        # Created and driven only on the worker thread, whose run loop is
+        # pumped while it waits (see _pause)
+        self._synth = None
+        self._say_pid = None  # running `say` process when AppKit is missing
+        self._queue = queue.Queue(maxsize=8)
+        # Set by interrupt() (e.g. from a signal handler); the worker then
+        # stops speech, discards the queue and speaks _interrupt_message
+        self._interrupt = threading.Event()
+        self._interrupt_message = None
+        self._worker_thread = None
+        if enabled:
+            self._worker_thread = threading.Thread(
+                target=self._worker, name="voice-notifier", daemon=True
+            )
+            self._worker_thread.start()
+
+    def _create_synthesizer(self):
+        """
+        Create one persistent NSSpeechSynthesizer for the configured voice.
+
+        Called on the worker thread. Returns None when AppKit is
+        unavailable, so notify() uses `say`.
+        """
+        if NSSpeechSynthesizer is None:
+            return None
+
+        voice_id = None
+        for candidate in NSSpeechSynthesizer.availableVoices():
+            attributes = NSSpeechSynthesizer.attributesForVoice_(candidate)
+            if attributes and attributes.get("VoiceName") == self.voice:
+                voice_id = candidate
+                break
+
+        synth = NSSpeechSynthesizer.alloc().initWithVoice_(voice_id)
+        if synth is None:
+            return None
+        synth.setRate_(float(self.rate))
+        return synth
+
+    def _is_speaking(self) -> bool:
+        """Whether speech is in progress (reaps a finished `say` process)."""
+        if self._synth is not None:
+            return self._synth.isSpeaking()
+        if self._say_pid is None:
+            return False
+        pid, _ = os.waitpid(self._say_pid, os.WNOHANG)
+        if pid == 0:
+            return True
+        self._say_pid = None
+        return False
+
+    def _start_speaking(self, message: str) -> None:
+        """Start speaking without waiting for completion."""
+        if self._synth is not None:
+            self._synth.startSpeakingString_(message)
+        else:
+            # Spawn `say` directly (no Popen pipes or wait); reaped later
+            self._say_pid = os.posix_spawnp(
+                'say',
+                ['say', '-v', self.voice, '-r', str(self.rate), message],
+                os.environ
+            )
+
+    def _pause(self, seconds: float) -> None:
+        """Wait on the worker thread, running its run loop for the synthesizer."""
+        if self._synth is not None and NSRunLoop is not None:
+            NSRunLoop.currentRunLoop().runUntilDate_(
+                NSDate.dateWithTimeIntervalSinceNow_(seconds)
+            )
+        else:
+            time.sleep(seconds)
+
+    def _stop_speaking(self) -> None:
+        """Cut off speech in progress."""
+        if self._synth is not None:
+            self._synth.stopSpeaking()
+        elif self._say_pid is not None:
+            try:
+                os.kill(self._say_pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+            os.waitpid(self._say_pid, 0)
+            self._say_pid = None
+
+    def _wait_until_silent(self, timeout: float = 30.0) -> None:
+        """Block until current speech finishes (or timeout/interrupt)."""
+        deadline = time.monotonic() + timeout
+        while self._is_speaking():
+            if self._interrupt.is_set() or time.monotonic() >= deadline:
+                self._stop_speaking()
+                return
+            self._pause(0.05)
 
     def notify(self, message: str, priority: int = 1) -> None:
         """
-        Speak a message using macOS TTS.
+        Queue a message for the background speech worker.
 
         Args:
             message: Text to speak
             priority: 1=normal, 2=important (skips rate limiting)
         """
-        if not self.enabled:
+        if self._worker_thread is None:
+            return
+
+        try:
+            self._queue.put_nowait((message, priority))
+            return
+        except queue.Full:
+            # Normal messages are dropped when the worker is behind;
+            # important ones replace the oldest queued message
+            if priority == 1:
+                return
+        try:
+            dropped = self._queue.get_nowait()
+        except queue.Empty:
+            dropped = False
+        try:
+            # Keep close()'s stop sentinel if it was the one taken out
+            self._queue.put_nowait(None if dropped is None else (message, priority))
+        except queue.Full:
+            pass
+
+    def interrupt(self, message: Optional[str] = None) -> None:
+        """
+        Stop speech and discard queued messages, then speak message.
+
+        Only sets a flag for the worker thread, so it is safe to call from
+        a signal handler; call close() afterwards to wait for the message.
+        """
+        if self._worker_thread is None:
+            return
+        self._interrupt_message = message
+        self._interrupt.set()
+
+    def close(self, timeout: float = 30.0) -> None:
+        """
+        Drain queued notifications and stop the worker thread.
+
+        Args:
+            timeout: Maximum seconds to wait for pending speech
+        """
+        worker = self._worker_thread
+        if worker is None or threading.current_thread() is worker:
             return
+        self._worker_thread = None
+        try:
+            self._queue.put(None, timeout=timeout)
+        except queue.Full:
+            return  # worker is stuck; it is a daemon thread
+        worker.join(timeout)
+
+    def _worker(self) -> None:
+        """Speak queued messages until close() sends the stop sentinel."""
+        try:
+            self._synth = self._create_synthesizer()
+        except Exception:
+            self._synth = None
+        while True:
+            if self._interrupt.is_set():
+                if self._handle_interrupt():
+                    return
+                continue
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                self._pause(0.1)
+                continue
+            if item is None:
+                try:
+                    self._wait_until_silent()
+                except Exception:
+                    pass
+                return
+            self._speak(*item)
+
+    def _handle_interrupt(self) -> bool:
+        """
+        Act on interrupt() from the worker thread.
+
+        Returns:
+            True if close() had already sent the stop sentinel
+        """
+        self._interrupt.clear()
+        try:
+            self._stop_speaking()
+        except Exception:
+            pass
+        closing = False
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is None:
+                closing = True
+        if self._interrupt_message:
+            self._speak(self._interrupt_message, priority=2)
+        return closing
+
+    def _speak(self, message: str, priority: int) -> None:
+        """
+        Speak a message using macOS TTS (runs on the worker thread).
 
+        Args:
+            message: Text to speak
+            priority: 1=normal, 2=important (skips rate limiting)
+        """
         # Rate limiting (except for priority messages)
         if priority == 1:
             now = time.time()
@@ -159,14 +391,19 @@ class VoiceNotifier:
                 return
             self.last_notification = now
 
-        # Execute TTS
-        import subprocess
+        # Execute TTS: normal messages are dropped while speech is in
+        # progress, important ones wait their turn and are spoken to
+        # completion (startSpeakingString_ would cut off current speech)
         try:
-            subprocess.run(
-                ['say', '-v', self.voice, '-r', str(self.rate), message],
-                timeout=30,
-                check=False
-            )
+            if priority == 1:
+                if not self._is_speaking():
+                    self._start_speaking(message)
+            else:
+                self._wait_until_silent()
+                if self._interrupt.is_set():
+                    return
+                self._start_speaking(message)
+                self._wait_until_silent()
         except Exception as e:
             # Silently fail - don't disrupt automation for TTS issues
             pass
@@ -237,18 +474,20 @@ class SignalHandler:
         self.shutdown_requested = True
         signal_name = "SIGINT" if signum == signal.SIGINT else "SIGTERM"
         self.logger.info(f"Received {signal_name}, shutting down gracefully...")
-        self.voice_notifier.notify("Automation interrupted. Shutting down.", priority=2)
+        # Only flag the speech worker here; main()'s finally block calls
+        # close(), which waits for the message
+        self.voice_notifier.interrupt("Automation interrupted. Shutting down.")
 
         # Cleanup will happen in main() finally block
         sys.exit(EXIT_GENERAL_ERROR)
 
 
-def parse_arguments() -> argparse.Namespace:
+def _build_parser() -> argparse.ArgumentParser:
     """
-    Parse command-line arguments.
+    Build the command-line argument parser.
 
     Returns:
-        Parsed arguments namespace
+        Configured ArgumentParser (built once, as _PARSER)
     """
     parser = argparse.ArgumentParser(
         description="1Password Service Account Automation (Accessibility-First)",
@@ -373,20 +612,83 @@ Voice Notifications:
         help='Maximum retry attempts for failed operations (default: 3)'
     )
 
-    args = parser.parse_args()
+    return parser
+
+
+_PARSER = _build_parser()
+
+
+def parse_arguments(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """
+    Parse command-line arguments.
+
+    Args:
+        argv: Arguments to parse (defaults to sys.argv[1:])
+
+    Returns:
+        Parsed arguments namespace
+    """
+    args = _PARSER.parse_args(argv)
 
     # Validation: --name and --vaults required unless --config or --resume
     if not args.resume and not args.config:
         if not args.name or not args.vaults:
-            parser.error("--name and --vaults are required (or use --config/--resume)")
+            _PARSER.error("--name and --vaults are required (or use --config/--resume)")
 
     return args
 
 
+def _environment_fingerprint() -> Optional[str]:
+    """
+    Hash the interpreter and the op/say binaries (path and mtime).
+
+    Returns:
+        Hex digest, or None if either binary is not on PATH
+    """
+    parts = [sys.executable, sys.platform]
+    for tool in ('op', 'say'):
+        path = shutil.which(tool)
+        if path is None:
+            return None
+        try:
+            parts.extend([path, os.stat(path).st_mtime])
+        except OSError:
+            return None
+    return hashlib.sha256(json.dumps(parts).encode()).hexdigest()
+
+
+def _load_env_cache(fingerprint: str) -> bool:
+    """Return True if a fresh cached validation matches the fingerprint."""
+    try:
+        cached = json.loads(ENV_CACHE_FILE.read_text())
+    except (OSError, ValueError):
+        return False
+    return (
+        isinstance(cached, dict)
+        and cached.get("fingerprint") == fingerprint
+        and time.time() - cached.get("validated_at", 0) < ENV_CACHE_TTL
+    )
+
+
+def _save_env_cache(fingerprint: str) -> None:
+    """Record a successful validation (best effort)."""
+    try:
+        ENV_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        ENV_CACHE_FILE.write_text(json.dumps({
+            "fingerprint": fingerprint,
+            "validated_at": time.time(),
+        }))
+    except OSError:
+        pass
+
+
 def validate_environment() -> tuple[bool, Optional[str]]:
     """
     Validate environment and dependencies.
 
+    Successful results are cached in ENV_CACHE_FILE for ENV_CACHE_TTL
+    seconds, so repeat runs skip the op/yabai/say subprocess probes.
+
     Returns:
         (is_valid, error_message)
     """
@@ -398,29 +700,41 @@ def validate_environment() -> tuple[bool, Optional[str]]:
     if sys.version_info < (3, 9):
         return False, "Python 3.9+ required"
 
-    # Check op CLI
+    fingerprint = _environment_fingerprint()
+    if fingerprint is not None and _load_env_cache(fingerprint):
+        return True, None
+
+    # Probe op, yabai and say with a single shell invocation
     import subprocess
     try:
-        result = subprocess.run(['op', '--version'], capture_output=True, timeout=5)
-        if result.returncode != 0:
-            return False, "1Password CLI (op) not installed or not working"
-    except FileNotFoundError:
-        return False, "1Password CLI (op) not found. Install with: brew install --cask 1password-cli"
+        result = subprocess.run(
+            ['/bin/sh', '-c', ENV_PROBE_SCRIPT],
+            capture_output=True, text=True, timeout=5
+        )
     except Exception as e:
         return False, f"Error checking op CLI: {e}"
+    probes = dict(
+        line.split('=', 1) for line in result.stdout.splitlines() if '=' in line
+    )
+
+    # Check op CLI
+    if probes.get('op') == 'missing':
+        return False, "1Password CLI (op) not found. Install with: brew install --cask 1password-cli"
+    if probes.get('op') != '0':
+        return False, "1Password CLI (op) not installed or not working"
 
     # Check yabai (optional but recommended)
-    try:
-        subprocess.run(['yabai', '-m', 'query', '--windows'], capture_output=True, timeout=5)
-    except FileNotFoundError:
+    if probes.get('yabai') == 'missing':
         print("Warning: yabai not found. Install for better window management: brew install yabai")
+    elif probes.get('yabai') != '0':
+        print("Warning: yabai is installed but not responding. Start it with: yabai --start-service")
 
     # Check say command (macOS TTS)
-    try:
-        subprocess.run(['say', '--version'], capture_output=True, timeout=5)
-    except FileNotFoundError:
+    if probes.get('say') != '0':
         return False, "macOS 'say' command not found (required for voice notifications)"
 
+    if fingerprint is not None:
+        _save_env_cache(fingerprint)
     return True, None
 
 
@@ -456,6 +770,9 @@ def main() -> int:
     except SystemExit as e:
         return e.code
 
+    # Normalize the comma-separated vault list once
+    vault_list = [v.strip() for v in args.vaults.split(',')] if args.vaults else []
+
     # Validate environment
     is_valid, error_msg = validate_environment()
     if not is_valid:
@@ -482,14 +799,15 @@ def main() -> int:
         # Apply command-line overrides
         if args.name:
             config.account_name = args.name
-        if args.vaults:
-            config.vault_names = [v.strip() for v in args.vaults.split(',')]
+        if vault_list:
+            config.vault_names = vault_list
         if args.debug:
             config.log_level = "DEBUG"
 
     except Exception as e:
         print(f"❌ Configuration error: {e}")
         voice_notifier.notify_error("configuration loading")
+        voice_notifier.close()
         return EXIT_CONFIG_ERROR
 
     print(f"✅ Configuration loaded: account={config.account_name}")
@@ -506,6 +824,7 @@ def main() -> int:
         logger.info("="*70)
     except Exception as e:
         print(f"❌ Logging setup failed: {e}")
+        voice_notifier.close()
         return EXIT_CONFIG_ERROR
 
     # Register signal handlers
@@ -548,15 +867,15 @@ def main() -> int:
             'max_retries': args.max_retries
         }
 
-        orchestrator = Orchestrator(config=orchestrator_config)
-
-        # Run orchestration asynchronously
-        import asyncio
-        result = asyncio.run(orchestrator.orchestrate(
+        # Run orchestration on the shared pool's persistent event loop
+        # (no per-run loop setup/teardown; it lives in a worker thread, so
+        # the SignalHandler registered above stays in charge of SIGINT)
+        result = orchestrate_sync(
             account_name=args.name,
-            vaults=args.vaults.split(',') if isinstance(args.vaults, str) else args.vaults,
-            headless=args.headless if hasattr(args, 'headless') else False
-        ))
+            vaults=vault_list,
+            headless=args.headless if hasattr(args, 'headless') else False,
+            config=orchestrator_config
+        )
 
         perf_monitor.end_operation("automation_total")
 
@@ -635,6 +954,9 @@ def main() -> int:
         except:
             pass
 
+        # Let pending voice notifications finish before exit
+        voice_notifier.close()
+
         logger.info("Shutdown complete")
 
 
@@ -3,18 +3,87 @@
 
 from __future__ import annotations
 
+import atexit
 import base64
+import functools
+import hashlib
+import http.client
+import io
 import json
+import os
 import re
+import secrets
 import shutil
 import subprocess
 import tempfile
-import urllib.error
-import urllib.request
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from datetime import datetime
 from pathlib import Path
-from typing import List, Optional, Sequence, Union
+from typing import Callable, List, Optional, Sequence, Tuple, Union
+from urllib.parse import urlsplit
+
+try:  # In-process libtesseract binding; falls back to the tesseract CLI
+    from tesserocr import PyTessBaseAPI
+except ImportError:
+    PyTessBaseAPI = None
+
+try:  # Image decoding for OCR preprocessing (a tesserocr dependency)
+    from PIL import Image, ImageOps
+except ImportError:
+    Image = None
+
+try:  # Perceptual hashing for the response cache; falls back to SHA-256
+    import imagehash
+except ImportError:
+    imagehash = None
+
+try:  # Fast JSON for the (multi-MB, base64 image) Ollama payloads
+    import orjson
+except ImportError:
+    orjson = None
+
+# Errors from a reused Ollama connection that warrant one reconnect
+_STALE_CONNECTION_ERRORS = (
+    http.client.RemoteDisconnected,
+    http.client.CannotSendRequest,
+    http.client.ResponseNotReady,
+    BrokenPipeError,
+    ConnectionResetError,
+)
+
+# Entries kept in the OCR/LLaVA response cache (least recently used evicted)
+RESPONSE_CACHE_SIZE = 128
+
+# Screenshots larger than this (longest side, pixels) are downsampled and
+# binarized before in-process OCR; tesseract's cost scales with pixel count
+OCR_MAX_DIMENSION = 1600
+
+# Grey level at or above which a pixel becomes white when binarizing
+OCR_BINARIZE_THRESHOLD = 160
+_OCR_BINARIZE_TABLE = [0] * OCR_BINARIZE_THRESHOLD + [255] * (256 - OCR_BINARIZE_THRESHOLD)
+
+# Auth screens are a few scattered labels and buttons: sparse-text page
+# segmentation (PSM 11) skips full layout analysis, and a character whitelist
+# narrows classification to what such labels contain
+OCR_PAGE_SEG_MODE = 11
+OCR_CHAR_WHITELIST = (
+    "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789"
+    "@.,:;!?'\"-_/()&#+*"
+)
+
+# Screenshot files whose image key and base64 encoding are kept, so retries
+# and further prompts against the same file skip the read/hash/encode
+IMAGE_CACHE_SIZE = 8
+
+AUTH_PROMPT = (
+    "You are analyzing a screenshot for authentication UI elements. "
+    "List any login/auth-related elements you can see, such as username/email "
+    "fields, password fields, sign-in buttons, MFA/OTP prompts, or "
+    "account creation links. If none are visible, say 'none'."
+)
 
 
 @dataclass
@@ -28,9 +97,59 @@ class AnalysisResult:
     llava_response: str = ""
 
 
+# Auth-element labels and the phrases that indicate them
+AUTH_KEYWORDS = {
+    "username": ["username", "user name", "userid", "user id"],
+    "email": ["email", "e-mail"],
+    "password": ["password", "passcode"],
+    "sign_in": ["sign in", "log in", "login", "sign-in", "log-in"],
+    "sign_up": ["sign up", "create account", "register"],
+    "forgot_password": ["forgot password", "reset password"],
+    "mfa": ["mfa", "2fa", "two-factor", "verification code", "otp"],
+    "remember_me": ["remember me", "keep me signed in"],
+    "auth": ["authenticate", "authentication", "authorization"],
+}
+
+STRONG_AUTH_TERMS = ["password", "sign in", "log in", "login", "otp", "verification code"]
+
+
+def _json_dumps(obj) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode("utf-8")
+
+
+def _json_loads(raw: str):
+    # orjson.JSONDecodeError subclasses json.JSONDecodeError
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _phrase_alternation(terms: Sequence[str]) -> str:
+    # Longest first so a phrase is not shadowed by one of its prefixes
+    return "|".join(re.escape(term) for term in sorted(terms, key=len, reverse=True))
+
+
 class ScreenshotAnalyzer:
     """Capture and analyze screenshots for authentication UI elements."""
 
+    # One named group per label inside a lookahead: the zero-width match is
+    # tried at every position, so overlapping phrases ("forgot password"
+    # and "password") are all reported in a single C-level scan. Phrases
+    # must start on a word boundary ("otp" does not match "footprint").
+    # The optional "strong" lookahead flags STRONG_AUTH_TERMS in the same
+    # pass (each strong term is also a label phrase); lastgroup is still
+    # the label, whose group closes last.
+    _KEYWORD_RE = re.compile(
+        r"\b(?=(?P<strong>" + _phrase_alternation(STRONG_AUTH_TERMS) + r")?)"
+        r"(?=" + "|".join(
+            f"(?P<{label}>{_phrase_alternation(terms)})"
+            for label, terms in AUTH_KEYWORDS.items()
+        ) + ")",
+        re.IGNORECASE,
+    )
+
     def __init__(
         self,
         llava_model: str = "llava",
@@ -40,11 +159,71 @@ class ScreenshotAnalyzer:
         self.llava_model = llava_model
         self.ollama_host = ollama_host.rstrip("/")
         self.request_timeout_sec = request_timeout_sec
+        # Keep-alive connection to Ollama per thread (http.client
+        # connections are not thread-safe); all are closed by close()
+        self._ollama_url = urlsplit(self.ollama_host)
+        self._http_local = threading.local()
+        self._http_conns: List[http.client.HTTPConnection] = []
+        # One initialized tesseract engine per thread (the API is not
+        # thread-safe); all of them are ended by close()
+        self._tess_local = threading.local()
+        self._tess_apis: List[PyTessBaseAPI] = []
+        self._lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        # (kind, ..., image key) -> OCR text / LLaVA response, LRU ordered
+        self._response_cache: OrderedDict[Tuple[str, ...], str] = OrderedDict()
+        # resolved path -> [(st_mtime_ns, st_size), LLaVA image key, exact
+        # content key, raw bytes, base64]; the raw bytes are kept only until
+        # the base64 form is needed
+        self._image_cache: OrderedDict[str, list] = OrderedDict()
+        # Scratch directory for tesseract CLI output, created on first use
+        # and reused by every call instead of a fresh mkdtemp/rmtree pair
+        self._ocr_tmp: Optional[Path] = None
+        self._ocr_tmp_cleanup: Optional[Callable[[], None]] = None
+
+    def close(self) -> None:
+        """Stop the batch worker pool and release the in-process OCR engines."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+        with self._lock:
+            apis, self._tess_apis = self._tess_apis, []
+            conns, self._http_conns = self._http_conns, []
+            cleanup, self._ocr_tmp_cleanup = self._ocr_tmp_cleanup, None
+            self._ocr_tmp = None
+        for api in apis:
+            api.End()
+        for conn in conns:
+            conn.close()
+        self._tess_local = threading.local()
+        self._http_local = threading.local()
+        if cleanup is not None:
+            atexit.unregister(cleanup)
+            cleanup()
+
+    def __del__(self) -> None:
+        try:
+            self.close()
+        except Exception:  # noqa: BLE001 - interpreter may be shutting down
+            pass
+
+    def _get_tess_api(self) -> PyTessBaseAPI:
+        """Return this thread's tesseract engine, initializing it once."""
+        api = getattr(self._tess_local, "api", None)
+        if api is None:
+            api = PyTessBaseAPI(lang="eng", psm=OCR_PAGE_SEG_MODE)
+            api.SetVariable("tessedit_char_whitelist", OCR_CHAR_WHITELIST)
+            self._tess_local.api = api
+            with self._lock:
+                self._tess_apis.append(api)
+        return api
 
     def capture_screenshot(self, region: Optional[Union[str, Sequence[int]]] = None) -> str:
         """Capture a screenshot and return the image path."""
-        timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S_%f")
-        filename = f"screenshot_{timestamp}.png"
+        # time_ns keeps names chronological; the random suffix keeps
+        # concurrent captures in the same instant apart
+        filename = f"screenshot_{time.time_ns()}_{secrets.token_hex(4)}.png"
         output_path = Path(tempfile.gettempdir()) / filename
 
         cmd = ["screencapture", "-x"]
@@ -77,6 +256,41 @@ class ScreenshotAnalyzer:
 
         return str(output_path)
 
+    def capture_screenshot_bytes(
+        self, region: Optional[Union[str, Sequence[int]]] = None
+    ) -> bytes:
+        """Capture a screenshot and return the PNG bytes without a temp file."""
+        cmd = ["screencapture", "-x", "-t", "png"]
+
+        if region is not None:
+            cmd.extend(["-R", self._normalize_region(region)])
+
+        # screencapture has no stdout mode, but writes to /dev/stdout fine
+        cmd.append("/dev/stdout")
+
+        try:
+            result = subprocess.run(
+                cmd,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                check=False,
+                bufsize=-1,
+            )
+        except FileNotFoundError as exc:
+            raise RuntimeError("macOS 'screencapture' command not found.") from exc
+
+        if result.returncode != 0:
+            raise RuntimeError(
+                "Failed to capture screenshot: "
+                f"exit={result.returncode}, "
+                f"stderr={result.stderr.decode('utf-8', errors='replace').strip()}"
+            )
+
+        if not result.stdout:
+            raise RuntimeError("Screenshot command succeeded but produced no image data.")
+
+        return result.stdout
+
     @staticmethod
     def _normalize_region(region: Union[str, Sequence[int]]) -> str:
         """Normalize region input for `screencapture -R`."""
@@ -95,86 +309,315 @@ class ScreenshotAnalyzer:
         raise ValueError("Unsupported region type; use None, string, or 4-int sequence.")
 
     def encode_image(self, image_path: str) -> str:
-        """Base64-encode the image at the given path."""
+        """Base64-encode the image at the given path (cached until it changes)."""
+        return self._cached_image(image_path, need_b64=True)[2]
+
+    def _cached_image(
+        self, image_path: str, need_b64: bool
+    ) -> Tuple[str, str, Optional[str]]:
+        """
+        Return (LLaVA image key, exact content key, base64 or None) for a
+        file, reusing earlier work.
+
+        Entries are validated against the file's mtime and size, so the file
+        is read at most once per version; base64 is computed on first need.
+        """
+        path = Path(image_path)
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Image not found: {image_path}") from None
+        cache_key = str(path.resolve())
+        signature = (stat.st_mtime_ns, stat.st_size)
+
+        with self._lock:
+            entry = self._image_cache.get(cache_key)
+            if entry is not None and entry[0] == signature:
+                self._image_cache.move_to_end(cache_key)
+            else:
+                entry = None
+
+        if entry is None:
+            data = self._read_image(image_path)
+            entry = [
+                signature, self._image_key(data), self._content_key(data), data, None
+            ]
+            with self._lock:
+                self._image_cache[cache_key] = entry
+                while len(self._image_cache) > IMAGE_CACHE_SIZE:
+                    self._image_cache.popitem(last=False)
+
+        # Raw bytes and base64 are read and swapped under the lock (bytes are
+        # dropped only once base64 is stored); encoding itself runs outside it
+        with self._lock:
+            data, b64 = entry[3], entry[4]
+        if need_b64 and b64 is None:
+            encoded = base64.b64encode(memoryview(data)).decode("ascii")
+            with self._lock:
+                if entry[4] is None:
+                    entry[4], entry[3] = encoded, None
+                b64 = entry[4]
+        return entry[1], entry[2], b64
+
+    @staticmethod
+    def _read_image(image_path: str) -> bytes:
+        """Read the raw image bytes at the given path."""
         path = Path(image_path)
         if not path.exists():
             raise FileNotFoundError(f"Image not found: {image_path}")
 
         try:
-            data = path.read_bytes()
+            return path.read_bytes()
         except OSError as exc:
             raise RuntimeError(f"Failed to read image: {image_path}") from exc
 
-        return base64.b64encode(data).decode("utf-8")
+    @classmethod
+    def _image_key(cls, data: bytes) -> str:
+        """
+        Cache key for LLaVA responses.
+
+        A perceptual hash when imagehash/PIL are installed, so re-captures
+        of an unchanged UI hit the cache; otherwise a SHA-256 of the bytes.
+        """
+        if imagehash is not None:
+            try:
+                with Image.open(io.BytesIO(data)) as image:
+                    return f"phash:{imagehash.phash(image)}"
+            except Exception:  # noqa: BLE001 - fall back to exact hashing
+                pass
+        return cls._content_key(data)
+
+    @staticmethod
+    def _content_key(data: bytes) -> str:
+        """
+        Exact cache key for image content (SHA-256 of the bytes).
+
+        Used for OCR text, where a small change such as an error banner
+        must not be answered from a perceptually similar capture.
+        """
+        return f"sha256:{hashlib.sha256(data).hexdigest()}"
+
+    def _cache_get(self, key: Tuple[str, ...]) -> Optional[str]:
+        with self._lock:
+            value = self._response_cache.get(key)
+            if value is not None:
+                self._response_cache.move_to_end(key)
+            return value
+
+    def _cache_put(self, key: Tuple[str, ...], value: str) -> None:
+        with self._lock:
+            self._response_cache[key] = value
+            self._response_cache.move_to_end(key)
+            while len(self._response_cache) > RESPONSE_CACHE_SIZE:
+                self._response_cache.popitem(last=False)
+
+    def clear_cache(self) -> None:
+        """Forget all cached OCR and LLaVA results and image encodings."""
+        with self._lock:
+            self._response_cache.clear()
+            self._image_cache.clear()
+
+    def _get_http_connection(self) -> http.client.HTTPConnection:
+        """Return this thread's persistent connection to Ollama."""
+        conn = getattr(self._http_local, "conn", None)
+        if conn is None:
+            conn_class = (
+                http.client.HTTPSConnection
+                if self._ollama_url.scheme == "https"
+                else http.client.HTTPConnection
+            )
+            conn = conn_class(
+                self._ollama_url.hostname or "localhost",
+                self._ollama_url.port,
+                timeout=self.request_timeout_sec,
+            )
+            self._http_local.conn = conn
+            with self._lock:
+                self._http_conns.append(conn)
+        return conn
+
+    def _drop_http_connection(self) -> None:
+        """Close this thread's connection so the next request reconnects."""
+        conn = getattr(self._http_local, "conn", None)
+        if conn is None:
+            return
+        self._http_local.conn = None
+        conn.close()
+        with self._lock:
+            if conn in self._http_conns:
+                self._http_conns.remove(conn)
+
+    def _post_ollama(
+        self, path: str, data: bytes, read_body: Callable[[http.client.HTTPResponse], str]
+    ) -> str:
+        """POST a JSON body to Ollama over the keep-alive connection.
+
+        ``read_body`` consumes the response; it must read it to the end so
+        the connection can be reused. If it raises, the connection is
+        dropped.
+        """
+        url_path = self._ollama_url.path.rstrip("/") + path
+        headers = {"Content-Type": "application/json"}
+
+        # A kept-alive socket may have been closed by the server while
+        # idle, or left mid-exchange by an earlier failure; either surfaces
+        # on first use, so reconnect once
+        for attempt in range(2):
+            conn = self._get_http_connection()
+            try:
+                conn.request("POST", url_path, body=data, headers=headers)
+                resp = conn.getresponse()
+                if resp.status >= 400:
+                    resp.read()
+                    raise RuntimeError(
+                        f"Ollama request failed: HTTP {resp.status} {resp.reason}"
+                    )
+                try:
+                    return read_body(resp)
+                except BaseException:
+                    # The body was not read to the end; the socket is
+                    # mid-response and cannot carry another request
+                    self._drop_http_connection()
+                    raise
+            except _STALE_CONNECTION_ERRORS as exc:
+                self._drop_http_connection()
+                if attempt == 0:
+                    continue
+                raise RuntimeError(
+                    "Unable to connect to Ollama at "
+                    f"{self.ollama_host}. Is Ollama running?"
+                ) from exc
+            except TimeoutError as exc:
+                self._drop_http_connection()
+                raise RuntimeError("Ollama request timed out.") from exc
+            except (OSError, http.client.HTTPException) as exc:
+                self._drop_http_connection()
+                raise RuntimeError(
+                    "Unable to connect to Ollama at "
+                    f"{self.ollama_host}. Is Ollama running?"
+                ) from exc
 
     def analyze_with_llava(self, image_path: str, prompt: str) -> str:
-        """Analyze an image using a local Ollama LLaVA model."""
-        image_b64 = self.encode_image(image_path)
-        url = f"{self.ollama_host}/api/generate"
+        """Analyze an image using a local Ollama LLaVA model (cached)."""
+        image_key, _, _ = self._cached_image(image_path, need_b64=False)
+        return self._analyze_cached(
+            image_key, prompt, lambda: self.encode_image(image_path)
+        )
+
+    def analyze_bytes_with_llava(self, data: bytes, prompt: str) -> str:
+        """Analyze in-memory image bytes (e.g. from capture_screenshot_bytes)."""
+        return self._analyze_cached(
+            self._image_key(data),
+            prompt,
+            lambda: base64.b64encode(memoryview(data)).decode("ascii"),
+        )
 
+    def _analyze_cached(
+        self, image_key: str, prompt: str, encode: Callable[[], str]
+    ) -> str:
+        """Look up the response cache; on a miss encode the image and query."""
+        cache_key = (
+            "llava",
+            self.llava_model,
+            hashlib.sha256(prompt.encode("utf-8")).hexdigest(),
+            image_key,
+        )
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return cached
+
+        response = self._query_llava(encode(), prompt)
+        self._cache_put(cache_key, response)
+        return response
+
+    def _query_llava(self, image_b64: str, prompt: str) -> str:
+        """Send one base64-encoded image to the Ollama generate endpoint."""
         payload = {
             "model": self.llava_model,
             "prompt": prompt,
             "images": [image_b64],
-            "stream": False,
+            "stream": True,
         }
 
-        data = json.dumps(payload).encode("utf-8")
-        req = urllib.request.Request(
-            url,
-            data=data,
-            headers={"Content-Type": "application/json"},
-            method="POST",
-        )
-
-        try:
-            with urllib.request.urlopen(req, timeout=self.request_timeout_sec) as resp:
-                raw = resp.read().decode("utf-8", errors="replace")
-        except urllib.error.URLError as exc:
-            raise RuntimeError(
-                "Unable to connect to Ollama at "
-                f"{self.ollama_host}. Is Ollama running?"
-            ) from exc
-        except TimeoutError as exc:
-            raise RuntimeError("Ollama request timed out.") from exc
-
-        try:
-            parsed = json.loads(raw)
-            if isinstance(parsed, dict) and "response" in parsed:
-                return str(parsed.get("response", "")).strip()
-        except json.JSONDecodeError:
-            pass
+        data = _json_dumps(payload)
+        return self._post_ollama("/api/generate", data, self._read_llava_stream)
 
-        lines = [line for line in raw.splitlines() if line.strip()]
-        responses: List[str] = []
-        for line in lines:
-            try:
-                obj = json.loads(line)
-                if isinstance(obj, dict) and "response" in obj:
-                    responses.append(str(obj.get("response", "")))
-            except json.JSONDecodeError:
+    @staticmethod
+    def _read_llava_stream(resp: http.client.HTTPResponse) -> str:
+        # Ollama streams one JSON object per line, each carrying the next
+        # "response" fragment, until one with "done": true
+        pieces: List[str] = []
+        done = False
+        for line in resp:
+            if not line.strip():
                 continue
+            try:
+                obj = _json_loads(line)
+            except json.JSONDecodeError as exc:
+                raise RuntimeError(
+                    "Unexpected response from Ollama LLaVA endpoint."
+                ) from exc
+            if not isinstance(obj, dict):
+                raise RuntimeError("Unexpected response from Ollama LLaVA endpoint.")
+            if "error" in obj:
+                raise RuntimeError(f"Ollama LLaVA error: {obj['error']}")
+            pieces.append(str(obj.get("response", "")))
+            if obj.get("done"):
+                done = True
+                break
+        # Drain anything after the final chunk so the connection is reusable
+        resp.read()
+
+        if not done:
+            raise RuntimeError("Ollama LLaVA stream ended before completion.")
+        return "".join(pieces).strip()
 
-        if responses:
-            return "".join(responses).strip()
+    def extract_text_ocr(self, image_path: str) -> str:
+        """Extract text from the image using tesseract OCR (cached)."""
+        _, content_key, _ = self._cached_image(image_path, need_b64=False)
+        cache_key = ("ocr", content_key)
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return cached
+
+        text = self._run_ocr(image_path)
+        self._cache_put(cache_key, text)
+        return text
+
+    def _run_ocr(self, image_path: str) -> str:
+        """Run tesseract on the image (in-process when tesserocr is available)."""
+        path = Path(image_path)
 
-        raise RuntimeError("Unexpected response from Ollama LLaVA endpoint.")
+        if PyTessBaseAPI is not None:
+            if not path.exists():
+                raise FileNotFoundError(f"Image not found: {image_path}")
+            api = self._get_tess_api()
+            image = self._prepare_ocr_image(path)
+            if image is None:
+                api.SetImageFile(str(path))
+            else:
+                api.SetImage(image)
+            return api.GetUTF8Text().strip()
 
-    def extract_text_ocr(self, image_path: str) -> str:
-        """Extract text from the image using tesseract OCR."""
         if shutil.which("tesseract") is None:
             raise RuntimeError(
                 "tesseract not found in PATH. Install with: brew install tesseract"
             )
 
-        path = Path(image_path)
         if not path.exists():
             raise FileNotFoundError(f"Image not found: {image_path}")
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            out_base = Path(tmpdir) / "ocr_output"
-            cmd = ["tesseract", str(path), str(out_base), "-l", "eng"]
+        # Unique base per call so concurrent OCR runs share the directory
+        out_base = self._get_ocr_tmp() / f"ocr_{secrets.token_hex(8)}"
+        out_txt = out_base.with_suffix(".txt")
+        cmd = [
+            "tesseract", str(path), str(out_base),
+            "-l", "eng",
+            "--psm", str(OCR_PAGE_SEG_MODE),
+            "-c", f"tessedit_char_whitelist={OCR_CHAR_WHITELIST}",
+        ]
 
+        try:
             result = subprocess.run(
                 cmd,
                 stdout=subprocess.PIPE,
@@ -188,34 +631,97 @@ class ScreenshotAnalyzer:
                     f"exit={result.returncode}, stderr={result.stderr.strip()}"
                 )
 
-            out_txt = out_base.with_suffix(".txt")
             if not out_txt.exists():
                 return ""
             return out_txt.read_text(encoding="utf-8", errors="replace").strip()
+        finally:
+            out_txt.unlink(missing_ok=True)
+
+    @staticmethod
+    def _prepare_ocr_image(path: Path):
+        # None means the file is small enough to hand to tesseract as is
+        if Image is None:
+            return None
+        with Image.open(path) as image:
+            if max(image.size) <= OCR_MAX_DIMENSION:
+                return None
+            gray = image.convert("L")
+        gray.thumbnail((OCR_MAX_DIMENSION, OCR_MAX_DIMENSION), Image.LANCZOS)
+        return ImageOps.autocontrast(gray).point(_OCR_BINARIZE_TABLE, "1")
+
+    def _get_ocr_tmp(self) -> Path:
+        """Return the tesseract CLI scratch directory, creating it once."""
+        with self._lock:
+            if self._ocr_tmp is None:
+                self._ocr_tmp = Path(tempfile.mkdtemp(prefix="sparc_ocr_"))
+                self._ocr_tmp_cleanup = functools.partial(
+                    shutil.rmtree, self._ocr_tmp, ignore_errors=True
+                )
+                atexit.register(self._ocr_tmp_cleanup)
+            return self._ocr_tmp
 
     def detect_auth_elements(self, image_path: str) -> AnalysisResult:
         """Detect authentication UI elements using OCR + LLaVA."""
-        ocr_text = ""
-        llava_response = ""
+        # The two analyses are independent: OCR runs on the worker pool
+        # while this thread waits on Ollama, so the call takes
+        # max(ocr, llava) rather than their sum
+        ocr_job = self._get_executor().submit(self._ocr_or_error, image_path)
+        llava_response = self._llava_or_error(image_path)
+        return self._build_result(ocr_job.result(), llava_response)
+
+    def detect_auth_elements_batch(self, image_paths: Sequence[str]) -> List[AnalysisResult]:
+        """
+        Detect authentication UI elements for several screenshots at once.
+
+        OCR and LLaVA jobs for all images are sharded across a reusable
+        thread pool (tesserocr releases the GIL while recognizing), so they
+        overlap instead of running one image at a time. Results are in
+        input order.
+        """
+        if not image_paths:
+            return []
+
+        executor = self._get_executor()
+        ocr_jobs = [executor.submit(self._ocr_or_error, path) for path in image_paths]
+        llava_jobs = [executor.submit(self._llava_or_error, path) for path in image_paths]
+
+        return [
+            self._build_result(ocr_job.result(), llava_job.result())
+            for ocr_job, llava_job in zip(ocr_jobs, llava_jobs)
+        ]
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Return the batch worker pool, creating it on first use."""
+        with self._lock:
+            if self._executor is None:
+                # cpu_count() OCR workers plus headroom for the I/O-bound
+                # LLaVA requests, so both kinds of jobs overlap
+                self._executor = ThreadPoolExecutor(
+                    max_workers=(os.cpu_count() or 1) + 4,
+                    thread_name_prefix="screenshot-analyzer",
+                )
+            return self._executor
 
+    def _ocr_or_error(self, image_path: str) -> str:
         try:
-            ocr_text = self.extract_text_ocr(image_path)
+            return self.extract_text_ocr(image_path)
         except Exception as exc:  # noqa: BLE001 - we want resilient analysis
-            ocr_text = f"[OCR_ERROR] {exc}"
+            return f"[OCR_ERROR] {exc}"
 
-        prompt = (
-            "You are analyzing a screenshot for authentication UI elements. "
-            "List any login/auth-related elements you can see, such as username/email "
-            "fields, password fields, sign-in buttons, MFA/OTP prompts, or "
-            "account creation links. If none are visible, say 'none'."
-        )
+    def _llava_or_error(self, image_path: str) -> str:
         try:
-            llava_response = self.analyze_with_llava(image_path, prompt)
+            return self.analyze_with_llava(image_path, AUTH_PROMPT)
         except Exception as exc:  # noqa: BLE001 - resilient analysis
-            llava_response = f"[LLAVA_ERROR] {exc}"
+            return f"[LLAVA_ERROR] {exc}"
 
-        detected_elements = self._extract_auth_elements(ocr_text, llava_response)
-        confidence = self._score_confidence(detected_elements, ocr_text, llava_response)
+    def _build_result(self, ocr_text: str, llava_response: str) -> AnalysisResult:
+        """Score OCR and LLaVA output into an AnalysisResult."""
+        detected_elements, strong_in_ocr, strong_in_llava = self._extract_auth_elements(
+            ocr_text, llava_response
+        )
+        confidence = self._score_confidence(
+            detected_elements, ocr_text, llava_response, strong_in_ocr, strong_in_llava
+        )
         has_auth_form = confidence >= 0.55 and len(detected_elements) > 0
 
         return AnalysisResult(
@@ -226,34 +732,41 @@ class ScreenshotAnalyzer:
             llava_response=llava_response,
         )
 
-    @staticmethod
-    def _extract_auth_elements(ocr_text: str, llava_text: str) -> List[str]:
-        """Extract auth-related elements from OCR and LLaVA responses."""
-        keywords = {
-            "username": ["username", "user name", "userid", "user id"],
-            "email": ["email", "e-mail"],
-            "password": ["password", "passcode"],
-            "sign_in": ["sign in", "log in", "login", "sign-in", "log-in"],
-            "sign_up": ["sign up", "create account", "register"],
-            "forgot_password": ["forgot password", "reset password"],
-            "mfa": ["mfa", "2fa", "two-factor", "verification code", "otp"],
-            "remember_me": ["remember me", "keep me signed in"],
-            "auth": ["authenticate", "authentication", "authorization"],
-        }
-
-        haystack = f"{ocr_text}\n{llava_text}".lower()
-        found: List[str] = []
-        for label, terms in keywords.items():
-            if any(term in haystack for term in terms):
-                found.append(label)
-
-        return found
+    @classmethod
+    def _extract_auth_elements(
+        cls, ocr_text: str, llava_text: str
+    ) -> Tuple[List[str], bool, bool]:
+        """
+        Extract auth-related elements from OCR and LLaVA responses.
+
+        Returns (labels, strong term in OCR text, strong term in LLaVA
+        text) from one scan of each string.
+        """
+        found = set()
+        ocr_strong = cls._scan_auth_text(ocr_text, found)
+        llava_strong = cls._scan_auth_text(llava_text, found)
+
+        # Report labels in AUTH_KEYWORDS order
+        labels = [label for label in AUTH_KEYWORDS if label in found]
+        return labels, ocr_strong, llava_strong
+
+    @classmethod
+    def _scan_auth_text(cls, text: str, found: set) -> bool:
+        """Add matched labels to found; return whether a strong term matched."""
+        strong = False
+        for match in cls._KEYWORD_RE.finditer(text):
+            found.add(match.lastgroup)
+            if match.start("strong") != -1:
+                strong = True
+        return strong
 
     @staticmethod
     def _score_confidence(
         detected: List[str],
         ocr_text: str,
         llava_text: str,
+        strong_in_ocr: bool,
+        strong_in_llava: bool,
     ) -> float:
         """Compute a confidence score from signals."""
         score = 0.0
@@ -261,11 +774,10 @@ class ScreenshotAnalyzer:
         if detected:
             score += min(0.6, 0.1 * len(detected))
 
-        strong_terms = ["password", "sign in", "log in", "login", "otp", "verification code"]
-        if any(term in ocr_text.lower() for term in strong_terms):
+        if strong_in_ocr:
             score += 0.25
 
-        if any(term in llava_text.lower() for term in strong_terms):
+        if strong_in_llava:
             score += 0.20
 
         if "[OCR_ERROR]" in ocr_text:
@@ -20,6 +20,8 @@ Usage:
 import asyncio
 import json
 import logging
+import re
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, Dict, List, Any
 from datetime import datetime
@@ -33,6 +35,12 @@ from playwright.async_api import (
     Error as PlaywrightError
 )
 
+# Optional fast JSON for session state files (stdlib json otherwise)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Configure logging
 logging.basicConfig(
     level=logging.DEBUG,
@@ -40,6 +48,23 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Common session indicators checked by is_authenticated()
+DEFAULT_AUTH_PATTERNS = (
+    "session",
+    "auth",
+    "token",
+    "user_id",
+    "logged_in",
+    "access_token",
+    "refresh_token",
+)
+
+
+@lru_cache(maxsize=32)
+def _compile_auth_patterns(patterns: tuple) -> re.Pattern:
+    """Compile substring patterns into one lowercase alternation."""
+    return re.compile("|".join(re.escape(p.lower()) for p in patterns))
+
 
 class SessionManager:
     """
@@ -198,30 +223,22 @@ class SessionManager:
             cookies = await self.context.cookies()
             logger.debug(f"Extracted {len(cookies)} cookies")
 
-            # Extract localStorage from page
-            local_storage = await self.page.evaluate("""
+            # Extract localStorage, sessionStorage, URL and user agent in
+            # a single evaluate round-trip
+            page_state = await self.page.evaluate("""
                 () => {
-                    const storage = {};
-                    for (let i = 0; i < localStorage.length; i++) {
-                        const key = localStorage.key(i);
-                        storage[key] = localStorage.getItem(key);
-                    }
-                    return storage;
+                    const dump = (storage) => Object.fromEntries(Object.entries(storage));
+                    return {
+                        local: dump(localStorage),
+                        session: dump(sessionStorage),
+                        url: location.href,
+                        ua: navigator.userAgent,
+                    };
                 }
             """)
+            local_storage = page_state["local"]
+            session_storage = page_state["session"]
             logger.debug(f"Extracted {len(local_storage)} localStorage items")
-
-            # Extract sessionStorage from page
-            session_storage = await self.page.evaluate("""
-                () => {
-                    const storage = {};
-                    for (let i = 0; i < sessionStorage.length; i++) {
-                        const key = sessionStorage.key(i);
-                        storage[key] = sessionStorage.getItem(key);
-                    }
-                    return storage;
-                }
-            """)
             logger.debug(f"Extracted {len(session_storage)} sessionStorage items")
 
             # Combine into session state
@@ -229,17 +246,13 @@ class SessionManager:
                 "cookies": cookies,
                 "localStorage": local_storage,
                 "sessionStorage": session_storage,
-                "url": self.page.url,
+                "url": page_state["url"],
                 "timestamp": datetime.now().isoformat(),
-                "user_agent": await self.page.evaluate("navigator.userAgent")
+                "user_agent": page_state["ua"]
             }
 
-            # Save to file
-            save_path = Path(path)
-            save_path.parent.mkdir(parents=True, exist_ok=True)
-
-            with open(save_path, 'w') as f:
-                json.dump(session_state, f, indent=2)
+            # Save to file (off the event loop: the blob can be large)
+            await asyncio.to_thread(self._write_session_file, Path(path), session_state)
 
             logger.info(f"Session state saved successfully to {path}")
             return True
@@ -248,6 +261,26 @@ class SessionManager:
             logger.error(f"Failed to save session: {e}")
             return False
 
+    @staticmethod
+    def _write_session_file(save_path: Path, session_state: Dict[str, Any]) -> None:
+        """Serialize and write session state (runs in a worker thread)."""
+        save_path.parent.mkdir(parents=True, exist_ok=True)
+
+        if orjson is not None:
+            save_path.write_bytes(orjson.dumps(session_state, option=orjson.OPT_INDENT_2))
+        else:
+            with open(save_path, 'w') as f:
+                json.dump(session_state, f, indent=2)
+
+    @staticmethod
+    def _read_session_file(load_path: Path) -> Dict[str, Any]:
+        """Read and parse session state (runs in a worker thread)."""
+        # orjson.JSONDecodeError subclasses json.JSONDecodeError
+        if orjson is not None:
+            return orjson.loads(load_path.read_bytes())
+        with open(load_path, 'r') as f:
+            return json.load(f)
+
     async def restore_session(self, path: str) -> bool:
         """
         Restore session from saved state.
@@ -276,9 +309,8 @@ class SessionManager:
         try:
             logger.info(f"Restoring session state from {path}...")
 
-            # Load session state from file
-            with open(load_path, 'r') as f:
-                session_state = json.load(f)
+            # Load session state from file (off the event loop)
+            session_state = await asyncio.to_thread(self._read_session_file, load_path)
 
             # Restore cookies to context
             cookies = session_state.get("cookies", [])
@@ -292,28 +324,21 @@ class SessionManager:
                 await self.page.goto(saved_url, wait_until="domcontentloaded")
                 logger.debug(f"Navigated to saved URL: {saved_url}")
 
-            # Restore localStorage to page
+            # Restore localStorage and sessionStorage in one round-trip
             local_storage = session_state.get("localStorage", {})
-            if local_storage:
+            session_storage = session_state.get("sessionStorage", {})
+            if local_storage or session_storage:
                 await self.page.evaluate("""
-                    (storage) => {
-                        for (const [key, value] of Object.entries(storage)) {
+                    ({local, session}) => {
+                        for (const [key, value] of Object.entries(local)) {
                             localStorage.setItem(key, value);
                         }
-                    }
-                """, local_storage)
-                logger.debug(f"Restored {len(local_storage)} localStorage items")
-
-            # Restore sessionStorage to page
-            session_storage = session_state.get("sessionStorage", {})
-            if session_storage:
-                await self.page.evaluate("""
-                    (storage) => {
-                        for (const [key, value] of Object.entries(storage)) {
+                        for (const [key, value] of Object.entries(session)) {
                             sessionStorage.setItem(key, value);
                         }
                     }
-                """, session_storage)
+                """, {"local": local_storage, "session": session_storage})
+                logger.debug(f"Restored {len(local_storage)} localStorage items")
                 logger.debug(f"Restored {len(session_storage)} sessionStorage items")
 
             # Reload page to apply restored state
@@ -351,43 +376,34 @@ class SessionManager:
 
         # Default auth patterns (common session indicators)
         if check_patterns is None:
-            check_patterns = [
-                "session",
-                "auth",
-                "token",
-                "user_id",
-                "logged_in",
-                "access_token",
-                "refresh_token"
-            ]
+            check_patterns = DEFAULT_AUTH_PATTERNS
+        if not check_patterns:
+            return False
+
+        # One alternation searched over a newline-joined blob of names,
+        # instead of a scan over every name for every pattern
+        pattern_re = _compile_auth_patterns(tuple(check_patterns))
 
         try:
             logger.debug("Checking authentication state...")
 
             # Check cookies for auth patterns
             cookies = await self.context.cookies()
-            cookie_names = [c["name"].lower() for c in cookies]
+            names_blob = "\n".join(c["name"] for c in cookies).lower()
 
-            for pattern in check_patterns:
-                if any(pattern.lower() in name for name in cookie_names):
-                    logger.info(f"Authentication detected via cookie pattern: {pattern}")
-                    return True
+            match = pattern_re.search(names_blob)
+            if match:
+                logger.info(f"Authentication detected via cookie pattern: {match.group(0)}")
+                return True
 
             # Check localStorage for auth patterns
-            local_storage = await self.page.evaluate("""
-                () => {
-                    const keys = [];
-                    for (let i = 0; i < localStorage.length; i++) {
-                        keys.push(localStorage.key(i));
-                    }
-                    return keys;
-                }
-            """)
+            local_storage = await self.page.evaluate("() => Object.keys(localStorage)")
+            keys_blob = "\n".join(local_storage).lower()
 
-            for pattern in check_patterns:
-                if any(pattern.lower() in key.lower() for key in local_storage):
-                    logger.info(f"Authentication detected via localStorage pattern: {pattern}")
-                    return True
+            match = pattern_re.search(keys_blob)
+            if match:
+                logger.info(f"Authentication detected via localStorage pattern: {match.group(0)}")
+                return True
 
             logger.debug("No authentication indicators found")
             return False
@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+Tests for the SPARC Phase 4 1Password CLI integration
+"""
+
+import os
+from pathlib import Path
+import sys
+
+# Add repo root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import sparc_phase4_cli_integration as cli
+
+
+VALID_TOKEN = "ops_" + "a" * 120
+
+
+class TestOpEnvironment:
+    """Test the environment handed to 'op whoami'"""
+
+    def test_proxy_and_config_are_passed_through(self, monkeypatch):
+        """Test proxy, config and temp dir settings reach op"""
+        monkeypatch.setenv("HTTPS_PROXY", "http://proxy.local:3128")
+        monkeypatch.setenv("NO_PROXY", "localhost")
+        monkeypatch.setenv("OP_CONFIG_DIR", "/tmp/op-config")
+        monkeypatch.setenv("XDG_CONFIG_HOME", "/tmp/xdg")
+        monkeypatch.setenv("TMPDIR", "/tmp/op-tmp")
+        monkeypatch.setenv("USER", "sparc")
+        cli.clear_whoami_cache()
+
+        _, _, env = cli._prepare_whoami(VALID_TOKEN)
+
+        assert env["HTTPS_PROXY"] == "http://proxy.local:3128"
+        assert env["NO_PROXY"] == "localhost"
+        assert env["OP_CONFIG_DIR"] == "/tmp/op-config"
+        assert env["XDG_CONFIG_HOME"] == "/tmp/xdg"
+        assert env["TMPDIR"] == "/tmp/op-tmp"
+        assert env["USER"] == "sparc"
+        assert env["OP_SERVICE_ACCOUNT_TOKEN"] == VALID_TOKEN
+        assert env["LC_ALL"] == "C"
+
+    def test_unrelated_variables_are_dropped(self, monkeypatch):
+        """Test unset pass-through names are omitted and others filtered"""
+        monkeypatch.delenv("HTTP_PROXY", raising=False)
+        monkeypatch.setenv("AWS_SECRET_ACCESS_KEY", "secret")
+        cli.clear_whoami_cache()
+
+        _, _, env = cli._prepare_whoami(VALID_TOKEN)
+
+        assert "HTTP_PROXY" not in env
+        assert "AWS_SECRET_ACCESS_KEY" not in env
+
+
+class TestExtractToken:
+    """Test token extraction from CLI and page output"""
+
+    def test_plain_token(self):
+        """Test a token mixed with other text is found"""
+        assert cli.extract_token_from_output(f"Created.\nYour token: {VALID_TOKEN}") == VALID_TOKEN
+
+    def test_quoted_token(self):
+        """Test a token wrapped in quotes is found without the quotes"""
+        assert cli.extract_token_from_output(f'"{VALID_TOKEN}"') == VALID_TOKEN
+
+    def test_token_wrapped_across_lines(self):
+        """Test a token broken by line wraps is rejoined"""
+        wrapped = f"Token:\n{VALID_TOKEN[:50]}\n  {VALID_TOKEN[50:]}\n"
+        assert cli.extract_token_from_output(wrapped) == VALID_TOKEN
+
+    def test_prefix_wrapped_across_lines(self):
+        """Test a line break inside the ops_ prefix falls back to a full scan"""
+        wrapped = f"Token: op\ns_{VALID_TOKEN[4:]}"
+        assert cli.extract_token_from_output(wrapped) == VALID_TOKEN
+        assert cli.extract_token_from_output(wrapped.encode()) == VALID_TOKEN
+
+    def test_bytes_output(self):
+        """Test raw subprocess bytes yield a str token"""
+        token = cli.extract_token_from_output(f"token\n{VALID_TOKEN}\n".encode())
+
+        assert token == VALID_TOKEN
+        assert isinstance(token, str)
+
+    def test_no_token(self):
+        """Test output without a token returns None"""
+        assert cli.extract_token_from_output("ops_short and nothing else") is None
+        assert cli.extract_token_from_output("") is None
+        assert cli.extract_token_from_output(b"") is None
+
+
+class TestSaveToken:
+    """Test persisting the token export to a zshrc file"""
+
+    def export_lines(self, path):
+        return [
+            line for line in path.read_text().splitlines()
+            if line.startswith("export OP_SERVICE_ACCOUNT_TOKEN=")
+        ]
+
+    def test_appends_to_new_file(self, tmp_path):
+        """Test a missing zshrc is created with the export"""
+        zshrc = tmp_path / ".zshrc"
+
+        result = cli.save_token_to_env(VALID_TOKEN, zshrc_path=str(zshrc))
+
+        assert result.success and result.verified
+        assert result.backup_path is None
+        assert self.export_lines(zshrc) == [f'export OP_SERVICE_ACCOUNT_TOKEN="{VALID_TOKEN}"']
+
+    def test_replaces_existing_export(self, tmp_path):
+        """Test an existing export is updated in place and the rest kept"""
+        zshrc = tmp_path / ".zshrc"
+        zshrc.write_text('alias ll="ls -l"\nexport OP_SERVICE_ACCOUNT_TOKEN="old"\n')
+        new_token = "ops_" + "b" * 120
+
+        result = cli.save_token_to_env(new_token, zshrc_path=str(zshrc))
+
+        assert result.success and result.verified
+        assert self.export_lines(zshrc) == [f'export OP_SERVICE_ACCOUNT_TOKEN="{new_token}"']
+        assert zshrc.read_text().startswith('alias ll="ls -l"\n')
+        assert "old" in Path(result.backup_path).read_text()
+
+    def test_written_file_is_owner_only(self, tmp_path):
+        """Test the atomically replaced zshrc has mode 0600"""
+        zshrc = tmp_path / ".zshrc"
+        zshrc.write_text("# shell config\n")
+
+        cli.save_token_to_env(VALID_TOKEN, zshrc_path=str(zshrc))
+
+        assert zshrc.stat().st_mode & 0o777 == 0o600
+        leftovers = [
+            p.name for p in tmp_path.iterdir()
+            if p.name != ".zshrc" and ".backup." not in p.name
+        ]
+        assert leftovers == []
+
+    def test_leftover_temp_file_does_not_block_save(self, tmp_path):
+        """Test a stale temp file from an earlier crash is not reused"""
+        zshrc = tmp_path / ".zshrc"
+        stale = tmp_path / f".zshrc.tmp.{os.getpid()}"
+        stale.write_text("stale")
+
+        result = cli.save_token_to_env(VALID_TOKEN, zshrc_path=str(zshrc))
+
+        assert result.success
+        assert self.export_lines(zshrc)
+        assert stale.read_text() == "stale"
+
+    def test_paranoid_verify_rereads_file(self, tmp_path):
+        """Test paranoid_verify confirms the token from disk"""
+        zshrc = tmp_path / ".zshrc"
+
+        result = cli.save_token_to_env(
+            VALID_TOKEN, zshrc_path=str(zshrc), paranoid_verify=True
+        )
+
+        assert result.success and result.verified
+
+    def test_invalid_token_is_rejected(self, tmp_path):
+        """Test a malformed token leaves the zshrc untouched"""
+        zshrc = tmp_path / ".zshrc"
+        zshrc.write_text("# shell config\n")
+
+        result = cli.save_token_to_env("ops_short", zshrc_path=str(zshrc))
+
+        assert not result.success
+        assert "Invalid token format" in result.error_message
+        assert zshrc.read_text() == "# shell config\n"
+        assert [p.name for p in tmp_path.iterdir()] == [".zshrc"]
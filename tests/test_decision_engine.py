@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+"""
+Tests for the SPARC Phase 4 decision engine
+"""
+
+import asyncio
+from pathlib import Path
+import sys
+
+# Add repo root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sparc_phase4_decision_engine import (
+    ActionType,
+    DecisionContext,
+    DecisionEngine,
+    RetryOutcomes,
+    RetryStrategy,
+)
+
+
+CONTINUE_BUTTON = {"role": "button", "text": "Continue", "selector": "#continue"}
+
+
+def decide(context):
+    return asyncio.run(DecisionEngine().decide(context))
+
+
+class TestRepeatRetry:
+    """Test reuse of the last RETRY decision on an unchanged page"""
+
+    def make_failed_context(self):
+        return DecisionContext.from_page_state({
+            "url": "https://example.com/step",
+            "dom": "<main>Step two</main>",
+            "visible_elements": [dict(CONTINUE_BUTTON)],
+            "last_result": False,
+        })
+
+    def test_unchanged_page_repeats_retry(self):
+        """Test a second decision on the same page repeats the RETRY"""
+        context = self.make_failed_context()
+        first = decide(context)
+        second = decide(context)
+
+        assert first.action_type == ActionType.RETRY
+        assert second.action_type == ActionType.RETRY
+        assert second.reason == first.reason
+        assert second is not first
+
+    def test_assigning_last_result_clears_retry(self):
+        """Test a fixed last_result set on the context is not masked"""
+        context = self.make_failed_context()
+        assert decide(context).reason == "last_result_failed"
+
+        context.last_result = True
+        action = decide(context)
+
+        assert action.action_type == ActionType.CLICK
+        assert action.selector == "#continue"
+
+    def test_assigning_visible_elements_clears_retry(self):
+        """Test new elements set on the context are analyzed"""
+        context = DecisionContext.from_page_state({
+            "url": "https://example.com/step",
+            "dom": "<main>Loading</main>",
+        })
+        assert decide(context).reason == "no_action_candidates"
+
+        context.visible_elements = [dict(CONTINUE_BUTTON)]
+        action = decide(context)
+
+        assert action.action_type == ActionType.CLICK
+
+    def test_metadata_change_clears_retry(self):
+        """Test a target_url added to metadata in place is honored"""
+        context = DecisionContext.from_page_state({
+            "url": "https://example.com/step",
+            "dom": "<main>Loading</main>",
+        })
+        assert decide(context).reason == "no_action_candidates"
+
+        context.metadata["target_url"] = "https://example.com/next"
+        action = decide(context)
+
+        assert action.action_type == ActionType.NAVIGATE
+        assert action.url == "https://example.com/next"
+
+
+class TestDirectIntentAction:
+    """Test the intent fast path against page signals"""
+
+    CAPTCHA_DOM = '<div class="g-recaptcha">Please complete the captcha</div>'
+    ERROR_DOM = "<h1>Something went wrong</h1><p>Request failed, try again</p>"
+
+    def test_target_url_navigates_on_clean_page(self):
+        """Test a mismatched target_url navigates without analysis"""
+        context = DecisionContext.from_page_state({
+            "url": "https://example.com/home",
+            "dom": "<main>Welcome</main>",
+            "intent": {"target_url": "https://example.com/create"},
+        })
+        action = decide(context)
+
+        assert action.action_type == ActionType.NAVIGATE
+        assert action.url == "https://example.com/create"
+
+    def test_captcha_page_overrides_intent(self):
+        """Test a captcha page yields a manual RETRY, not the intent action"""
+        for intent in (
+            {"target_url": "https://example.com/create"},
+            {"extract": ["#token"]},
+            {"click_selector": "#submit"},
+        ):
+            context = DecisionContext.from_page_state({
+                "url": "https://example.com/home",
+                "dom": self.CAPTCHA_DOM,
+                "visible_elements": [dict(CONTINUE_BUTTON)],
+                "intent": intent,
+            })
+            action = decide(context)
+
+            assert action.action_type == ActionType.RETRY
+            assert action.reason == "captcha_detected"
+            assert action.metadata["requires_manual"] is True
+
+    def test_error_page_overrides_intent(self):
+        """Test an error page yields a page-error RETRY"""
+        for intent in (
+            {"target_url": "https://example.com/create"},
+            {"extract": ["#token"]},
+            {"click_selector": "#submit"},
+        ):
+            context = DecisionContext.from_page_state({
+                "url": "https://example.com/home",
+                "dom": self.ERROR_DOM,
+                "visible_elements": [dict(CONTINUE_BUTTON)],
+                "intent": intent,
+            })
+            action = decide(context)
+
+            assert action.action_type == ActionType.RETRY
+            assert action.reason == "page_error_detected"
+
+
+class TestAdaptiveBackoff:
+    """Test adaptive retry delays driven by RetryOutcomes"""
+
+    def make_strategy(self):
+        return RetryStrategy(
+            name="network",
+            max_attempts=5,
+            base_delay_sec=1.5,
+            max_delay_sec=30.0,
+            backoff_factor=2.0,
+            jitter=0.0,
+            mode="adaptive",
+        )
+
+    def test_delay_grows_with_attempt_when_failing(self):
+        """Test backoff stays exponential while every attempt fails"""
+        strategy = self.make_strategy()
+        outcomes = RetryOutcomes()
+        outcomes.record(strategy.name, False)
+
+        delays = [
+            strategy.next_delay_sec(attempt, outcomes.failure_rate(strategy.name))
+            for attempt in range(1, 5)
+        ]
+
+        assert delays == [1.5, 3.0, 6.0, 12.0]
+
+    def test_delay_never_below_base_after_successes(self):
+        """Test a low failure rate shrinks delays only down to the base"""
+        strategy = self.make_strategy()
+        outcomes = RetryOutcomes()
+        for _ in range(15):
+            outcomes.record(strategy.name, True)
+        outcomes.record(strategy.name, False)
+
+        rate = outcomes.failure_rate(strategy.name)
+        delays = [strategy.next_delay_sec(attempt, rate) for attempt in range(1, 5)]
+
+        assert rate == 1 / 16
+        assert delays == [1.5, 1.5, 1.5, 1.5]
+
+    def test_jitter_keeps_base_floor(self):
+        """Test jitter never takes an adaptive delay below the base"""
+        strategy = RetryStrategy(
+            name="timeout",
+            max_attempts=3,
+            base_delay_sec=1.0,
+            jitter=0.3,
+            mode="adaptive",
+        )
+        for _ in range(50):
+            assert strategy.next_delay_sec(1, 0.1) >= 1.0
+
+    def test_outcomes_are_per_instance(self):
+        """Test separate RetryOutcomes do not share failure windows"""
+        first = RetryOutcomes()
+        second = RetryOutcomes()
+        first.record("network", False)
+
+        assert first.failure_rate("network") == 1.0
+        assert second.failure_rate("network") is None
@@ -0,0 +1,237 @@
+#!/usr/bin/env python3
+"""
+Tests for the SPARC Phase 4 screenshot analyzer
+"""
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+import sys
+
+import pytest
+
+# Add repo root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sparc_phase4_screenshot_analyzer import ScreenshotAnalyzer
+
+
+# Streamed /api/generate replies keyed by prompt
+STREAM_REPLIES = {
+    "login": [
+        {"response": "Sign in ", "done": False},
+        {"response": "button", "done": False},
+        {"response": "", "done": True},
+    ],
+    "error": [
+        {"error": "model crashed"},
+        {"response": "ignored", "done": False},
+        {"response": "", "done": True},
+    ],
+    "garbage": ["not json", {"response": "", "done": True}],
+    "truncated": [{"response": "Sign", "done": False}],
+}
+
+
+class OllamaHandler(BaseHTTPRequestHandler):
+    """Minimal chunked NDJSON stand-in for Ollama's generate endpoint"""
+
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args):
+        pass
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        self.server.prompts.append(body["prompt"])
+        self.send_response(200)
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        try:
+            for item in STREAM_REPLIES[body["prompt"]]:
+                line = item if isinstance(item, str) else json.dumps(item)
+                chunk = (line + "\n").encode()
+                self.wfile.write(b"%x\r\n%s\r\n" % (len(chunk), chunk))
+            self.wfile.write(b"0\r\n\r\n")
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+
+
+@pytest.fixture
+def ollama_server():
+    """Run the stand-in Ollama server on a free local port"""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), OllamaHandler)
+    server.daemon_threads = True
+    server.prompts = []
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def analyzer(ollama_server):
+    """Analyzer pointed at the stand-in server"""
+    host, port = ollama_server.server_address
+    analyzer = ScreenshotAnalyzer(ollama_host=f"http://{host}:{port}")
+    yield analyzer
+    analyzer.close()
+
+
+class TestLlavaStream:
+    """Test streamed LLaVA responses over the keep-alive connection"""
+
+    def test_fragments_are_joined(self, analyzer):
+        """Test response fragments are concatenated until done"""
+        assert analyzer._query_llava("aGk=", "login") == "Sign in button"
+
+    def test_connection_is_reused(self, analyzer):
+        """Test a completed stream leaves the connection reusable"""
+        analyzer._query_llava("aGk=", "login")
+        conn = analyzer._http_local.conn
+
+        assert analyzer._query_llava("aGk=", "login") == "Sign in button"
+        assert analyzer._http_local.conn is conn
+
+    @pytest.mark.parametrize("prompt", ["error", "garbage", "truncated"])
+    def test_bad_stream_does_not_break_next_request(
+        self, analyzer, ollama_server, prompt
+    ):
+        """Test a failed stream is reported and the next request still works"""
+        with pytest.raises(RuntimeError):
+            analyzer._query_llava("aGk=", prompt)
+
+        assert analyzer._query_llava("aGk=", "login") == "Sign in button"
+        assert ollama_server.prompts == [prompt, "login"]
+
+
+class TestOllamaConnection:
+    """Test recovery of a keep-alive connection left in a bad state"""
+
+    def test_reconnects_after_unsent_request(self, analyzer, ollama_server):
+        """Test CannotSendRequest on a stale connection triggers a reconnect"""
+        stale = analyzer._get_http_connection()
+        stale.putrequest("POST", "/api/generate")
+
+        assert analyzer._query_llava("aGk=", "login") == "Sign in button"
+        assert analyzer._http_local.conn is not stale
+        assert ollama_server.prompts == ["login"]
+
+
+class TestResponseCache:
+    """Test OCR and LLaVA result caching"""
+
+    @pytest.fixture
+    def screens(self, tmp_path):
+        """Two captures that differ only slightly (e.g. an error banner)"""
+        before = tmp_path / "before.png"
+        after = tmp_path / "after.png"
+        before.write_bytes(b"\x89PNG login form")
+        after.write_bytes(b"\x89PNG login form + Incorrect password")
+        return before, after
+
+    def test_ocr_is_keyed_by_exact_content(self, monkeypatch, screens):
+        """Test perceptually equal screens still get their own OCR text"""
+        analyzer = ScreenshotAnalyzer()
+        monkeypatch.setattr(
+            ScreenshotAnalyzer, "_image_key", staticmethod(lambda data: "phash:same")
+        )
+        monkeypatch.setattr(
+            analyzer, "_run_ocr", lambda path: Path(path).read_bytes().decode("latin-1")
+        )
+        before, after = screens
+
+        assert analyzer.extract_text_ocr(str(before)) == "\x89PNG login form"
+        assert analyzer.extract_text_ocr(str(after)).endswith("Incorrect password")
+        analyzer.close()
+
+    def test_ocr_repeat_is_cached(self, monkeypatch, screens):
+        """Test the same file is OCRed once"""
+        analyzer = ScreenshotAnalyzer()
+        calls = []
+        monkeypatch.setattr(
+            analyzer, "_run_ocr", lambda path: calls.append(path) or "text"
+        )
+        before, _ = screens
+
+        analyzer.extract_text_ocr(str(before))
+        analyzer.extract_text_ocr(str(before))
+
+        assert calls == [str(before)]
+        analyzer.close()
+
+    def test_llava_uses_perceptual_key(self, monkeypatch, screens):
+        """Test perceptually equal screens share one LLaVA response"""
+        analyzer = ScreenshotAnalyzer()
+        monkeypatch.setattr(
+            ScreenshotAnalyzer, "_image_key", staticmethod(lambda data: "phash:same")
+        )
+        calls = []
+        monkeypatch.setattr(
+            analyzer, "_query_llava", lambda b64, prompt: calls.append(b64) or "login form"
+        )
+        before, after = screens
+
+        assert analyzer.analyze_with_llava(str(before), "p") == "login form"
+        assert analyzer.analyze_with_llava(str(after), "p") == "login form"
+        assert len(calls) == 1
+        analyzer.close()
+
+
+class TestAuthKeywords:
+    """Test auth keyword detection and confidence scoring"""
+
+    def test_labels_from_both_sources_in_keyword_order(self):
+        """Test labels from OCR and LLaVA are merged in AUTH_KEYWORDS order"""
+        labels, strong_ocr, strong_llava = ScreenshotAnalyzer._extract_auth_elements(
+            "Email\nPassword\nRemember me", "A login form with a sign up link"
+        )
+
+        assert labels == ["email", "password", "sign_in", "sign_up", "remember_me"]
+        assert strong_ocr is True
+        assert strong_llava is True
+
+    def test_overlapping_phrases_report_both_labels(self):
+        """Test "forgot password" counts as forgot_password and password"""
+        labels, strong_ocr, _ = ScreenshotAnalyzer._extract_auth_elements(
+            "Forgot password?", ""
+        )
+
+        assert labels == ["password", "forgot_password"]
+        assert strong_ocr is True
+
+    def test_matching_is_case_insensitive_and_word_bounded(self):
+        """Test case is ignored and terms inside other words do not match"""
+        labels, strong_ocr, _ = ScreenshotAnalyzer._extract_auth_elements(
+            "SIGN IN", ""
+        )
+        assert labels == ["sign_in"]
+        assert strong_ocr is True
+
+        labels, strong_ocr, strong_llava = ScreenshotAnalyzer._extract_auth_elements(
+            "hotpot recipes", "a photo of a lotpmail"
+        )
+        assert labels == []
+        assert strong_ocr is False
+        assert strong_llava is False
+
+    def test_strong_flag_is_per_source(self):
+        """Test a weak term alone does not set the strong flag"""
+        labels, strong_ocr, strong_llava = ScreenshotAnalyzer._extract_auth_elements(
+            "Username", "enter your verification code"
+        )
+
+        assert labels == ["username", "mfa"]
+        assert strong_ocr is False
+        assert strong_llava is True
+
+    def test_confidence_scoring(self):
+        """Test confidence combines labels, strong terms and error markers"""
+        score = ScreenshotAnalyzer._score_confidence
+
+        assert score([], "", "", False, False) == 0.0
+        assert score(["email", "password"], "", "", True, True) == pytest.approx(0.65)
+        assert score(["email"] * 9, "", "", True, True) == 1.0
+        assert score(["email"], "[OCR_ERROR]", "[LLAVA_ERROR]", False, False) == 0.0